@@ -2,30 +2,9 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy import ndimage
 import odl
 
 
-class Convolution(odl.Operator):
-    def __init__(self, kernel, adjkernel=None):
-        self.kernel = kernel
-        self.adjkernel = (adjkernel if adjkernel is not None
-                          else kernel.space.element(kernel[::-1].copy()))
-        self.norm = float(np.sum(np.abs(self.kernel.ntuple)))
-        odl.Operator.__init__(self, domain=kernel.space, range=kernel.space,
-                              linear=True)
-
-    def _call(self, rhs, out):
-        ndimage.convolve(rhs.ntuple.data, self.kernel.ntuple.data,
-                         output=out.ntuple.data, mode='wrap')
-
-    @property
-    def adjoint(self):
-        return Convolution(self.adjkernel, self.kernel)
-
-    def opnorm(self):
-        return self.norm
-
 # Discretization
 discr_space = odl.uniform_discr(0, 10, 500, impl='numpy')
 
@@ -33,12 +12,13 @@ discr_space = odl.uniform_discr(0, 10, 500, impl='numpy')
 kernel = discr_space.element(lambda x: np.exp(x / 2) * np.cos(x * 1.172))
 phantom = discr_space.element(lambda x: x ** 2 * np.sin(x) ** 2 * (x > 5))
 
-# Create operator
-conv = Convolution(kernel)
+# Create operator, a periodic convolution evaluated via FFT
+conv = odl.trafos.Convolution(discr_space, kernel, pad_mode='periodic')
 
-# Dampening parameter for landweber
+# Dampening parameter for landweber, using the bound
+# ||conv|| <= sum(|kernel|)
 iterations = 100
-omega = 1 / conv.opnorm() ** 2
+omega = 1 / float(np.sum(np.abs(kernel.asarray()))) ** 2
 
 
 # Display callback
@@ -39,14 +39,20 @@ def _linear_deform(template, displacement, out=None):
         template.
     out : `numpy.ndarray`, optional
         Array to which the function values of the deformed template
-        are written. It must have the same shape as ``template`` and
+        are written. It must have shape ``(template.size,)`` and
         a data type compatible with ``template.dtype``.
 
     Returns
     -------
     deformed_template : `numpy.ndarray`
-        Function values of the deformed template. If ``out`` was given,
-        the returned object is a reference to it.
+        Function values of the deformed template, flattened in the
+        ordering of ``template.space``. If ``out`` was given, the
+        returned object is a reference to it.
+
+    Notes
+    -----
+    The deformed points are computed and evaluated in blocks of grid
+    points, such that the full array of points is never created.
 
     Examples
     --------
@@ -74,10 +80,17 @@ def _linear_deform(template, displacement, out=None):
     >>> _linear_deform(template, displacement_field)
     array([ 0. ,  0. ,  1. ,  0.5,  0. ])
     """
-    image_pts = template.space.points()
-    for i, vi in enumerate(displacement):
-        image_pts[:, i] += vi.ntuple.asarray()
-    return template.interpolation(image_pts.T, out=out, bounds_check=False)
+    space = template.space
+    if out is None:
+        out = np.empty(space.size, dtype=space.dtype)
+
+    for slc, image_pts in space.grid.iter_points(order=space.order):
+        for i, vi in enumerate(displacement):
+            image_pts[:, i] += vi.ntuple.asarray(slc.start, slc.stop)
+        template.interpolation(image_pts.T, out=out[slc],
+                               bounds_check=False)
+
+    return out
 
 
 class LinDeformFixedTempl(Operator):
@@ -14,11 +14,13 @@ from future import standard_library
 standard_library.install_aliases()
 from builtins import super
 
+from functools import partial
 import numpy as np
 
 from odl.discr.lp_discr import DiscreteLp
 from odl.operator.tensor_ops import PointwiseTensorFieldOperator
 from odl.space import ProductSpace
+from odl.util import map_blocks
 
 
 __all__ = ('PartialDerivative', 'Gradient', 'Divergence', 'Laplacian')
@@ -46,6 +48,19 @@ _ADJ_PADDING = {'constant': 'constant',
                 'order2': 'order2_adjoint',
                 'order2_adjoint': 'order2'}
 
+# Approximate number of bytes of the input array per slab processed by
+# `Gradient` and `Divergence`. All partial derivatives of a slab are
+# computed while it is in the cache.
+FINITE_DIFF_BLOCK_BYTES = 2 ** 19
+
+# Minimum array size from which the slabs are processed in several threads
+FINITE_DIFF_THREADING_THRESHOLD = 2 ** 20
+
+# Number of entries along the slab axis by which a slab is extended on
+# each side for differences along that axis. This covers the widest
+# boundary stencil in `finite_diff`.
+_SLAB_HALO = 3
+
 
 class PartialDerivative(PointwiseTensorFieldOperator):
 
@@ -310,16 +325,24 @@ class Gradient(PointwiseTensorFieldOperator):
         x_arr = x.asarray()
         ndim = self.domain.ndim
         dx = self.domain.cell_sides
+        out_arrs = [out[axis].asarray() for axis in range(ndim)]
 
-        for axis in range(ndim):
-            out_arr = out[axis].asarray()
+        def grad_slabs(slab_axis, slabs):
+            for slab in slabs:
+                for axis in range(ndim):
+                    _finite_diff_slab(
+                        x_arr, axis, slab, slab_axis,
+                        out=out_arrs[axis][_slab_index(slab, slab_axis)],
+                        dx=dx[axis], method=self.method,
+                        pad_mode=self.pad_mode, pad_const=self.pad_const)
+            return []
 
-            finite_diff(x_arr, axis=axis, dx=dx[axis], method=self.method,
-                        pad_mode=self.pad_mode,
-                        pad_const=self.pad_const,
-                        out=out_arr)
+        _map_slabs(grad_slabs, x_arr.shape, self.domain.order,
+                   x_arr.itemsize)
 
-            out[axis][:] = out_arr
+        for axis in range(ndim):
+            # self assignment: no overhead in the case asarray is a view
+            out[axis][:] = out_arrs[axis]
 
         return out
 
@@ -491,17 +514,25 @@ class Divergence(PointwiseTensorFieldOperator):
         ndim = self.range.ndim
         dx = self.range.cell_sides
 
+        x_arrs = [x[axis].asarray() for axis in range(ndim)]
         out_arr = out.asarray()
-        tmp = np.empty(out.shape, out.dtype, order=out.space.order)
-        for axis in range(ndim):
-            finite_diff(x[axis], axis=axis, dx=dx[axis], method=self.method,
-                        pad_mode=self.pad_mode,
-                        pad_const=self.pad_const,
-                        out=tmp)
-            if axis == 0:
-                out_arr[:] = tmp
-            else:
-                out_arr += tmp
+
+        def div_slabs(slab_axis, slabs):
+            for slab in slabs:
+                out_slab = out_arr[_slab_index(slab, slab_axis)]
+                tmp = np.empty_like(out_slab)
+                for axis in range(ndim):
+                    _finite_diff_slab(
+                        x_arrs[axis], axis, slab, slab_axis,
+                        out=out_slab if axis == 0 else tmp,
+                        dx=dx[axis], method=self.method,
+                        pad_mode=self.pad_mode, pad_const=self.pad_const)
+                    if axis > 0:
+                        out_slab += tmp
+            return []
+
+        _map_slabs(div_slabs, out_arr.shape, self.range.order,
+                   out_arr.itemsize)
 
         # self assignment: no overhead in the case asarray is a view
         out[:] = out_arr
@@ -681,6 +712,88 @@ class Laplacian(PointwiseTensorFieldOperator):
         return self
 
 
+def _slab_index(slab, slab_axis):
+    """Return the index tuple selecting ``slab`` along ``slab_axis``."""
+    return (slice(None),) * slab_axis + (slab,)
+
+
+def _map_slabs(func, shape, order, itemsize):
+    """Apply ``func`` to slabs of an array of given ``shape``.
+
+    The array is split along its slowest varying axis into slabs of
+    roughly ``FINITE_DIFF_BLOCK_BYTES`` bytes, but at least one entry
+    thick, which are processed in several threads if the array is large
+    enough.
+
+    Parameters
+    ----------
+    func : callable
+        Function called as ``func(slab_axis, slabs)`` with a list of
+        slices ``slabs`` along ``slab_axis``.
+    shape : sequence of int
+        Shape of the array to be processed.
+    order : {'C', 'F'}
+        Memory layout of the array.
+    itemsize : positive int
+        Number of bytes per array entry.
+    """
+    slab_axis = 0 if order == 'C' else len(shape) - 1
+    num_slabs = shape[slab_axis]
+    slab_size = int(np.prod(shape)) // max(num_slabs, 1)
+    thickness = max(1, FINITE_DIFF_BLOCK_BYTES //
+                    max(slab_size * itemsize, 1))
+    threading_threshold = -(-FINITE_DIFF_THREADING_THRESHOLD //
+                            max(slab_size, 1))
+    map_blocks(partial(func, slab_axis), num_slabs, thickness,
+                threading_threshold, grouped=True)
+
+
+def _finite_diff_slab(f, axis, slab, slab_axis, out, **kwargs):
+    """Compute ``finite_diff(f, axis)`` restricted to a slab.
+
+    The result in the slab is identical to the corresponding part of
+    the result on the full array since every entry is computed with
+    the same arithmetic operations.
+
+    Parameters
+    ----------
+    f : `numpy.ndarray`
+        Full input array.
+    axis : int
+        Axis along which the partial derivative is evaluated.
+    slab : slice
+        Slab along ``slab_axis`` for which the result is computed.
+    slab_axis : int
+        Axis along which the array is split into slabs.
+    out : `numpy.ndarray`
+        Array to which the result in the slab is written.
+    kwargs :
+        Further keyword arguments passed to `finite_diff`.
+    """
+    if axis != slab_axis:
+        finite_diff(f[_slab_index(slab, slab_axis)], axis=axis, out=out,
+                    **kwargs)
+        return
+
+    # Extend the slab such that the boundary stencils of the sub-array
+    # only affect entries outside of the slab
+    n = f.shape[axis]
+    if kwargs.get('pad_mode') == 'periodic':
+        # Wrap around, such that the periodic boundary stencils become
+        # interior stencils of the extended slab
+        start = slab.start - _SLAB_HALO
+        ext = np.take(f, np.arange(start, slab.stop + _SLAB_HALO) % n,
+                      axis=axis)
+    else:
+        start = max(slab.start - _SLAB_HALO, 0)
+        stop = min(slab.stop + _SLAB_HALO, n)
+        ext = f[_slab_index(slice(start, stop), slab_axis)]
+
+    ext_result = finite_diff(ext, axis=axis, **kwargs)
+    crop = slice(slab.start - start, slab.stop - start)
+    out[...] = ext_result[_slab_index(crop, slab_axis)]
+
+
 def finite_diff(f, axis, dx=1.0, method='forward', out=None, **kwargs):
     """Calculate the partial derivative of ``f`` along a given ``axis``.
 
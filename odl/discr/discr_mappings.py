@@ -18,15 +18,18 @@ from future import standard_library
 standard_library.install_aliases()
 from builtins import str, super, zip
 
+from functools import partial
 from itertools import product
 import numpy as np
+import scipy.sparse
 
 from odl.operator import Operator
 from odl.discr.partition import RectPartition
 from odl.space.base_ntuples import NtuplesBase, FnBase
-from odl.space import FunctionSet, FunctionSpace
+from odl.space import FunctionSet, FunctionSpace, fn
 from odl.util import (
-    is_valid_input_meshgrid, out_shape_from_array, out_shape_from_meshgrid)
+    is_valid_input_meshgrid, out_shape_from_array, out_shape_from_meshgrid,
+    writable_array, map_blocks)
 
 
 __all__ = ('FunctionSetMapping',
@@ -35,6 +38,14 @@ __all__ = ('FunctionSetMapping',
 
 _SUPPORTED_INTERP_SCHEMES = ['nearest', 'linear']
 
+# Approximate number of evaluation points per block in per-axis
+# interpolation. All weights and indices of a block stay in the cache.
+INTERP_BLOCK_SIZE = 2 ** 13
+
+# Minimum number of evaluation points from which the blocks are processed
+# in several threads
+INTERP_THREADING_THRESHOLD = 2 ** 17
+
 
 class FunctionSetMapping(Operator):
 
@@ -244,6 +255,12 @@ class PointCollocation(FunctionSetMapping):
             ``(N,)``, where N is the total number of grid points. The
             data type must be the same as in the ``dspace`` of this
             mapping.
+        block_size : positive int, optional
+            If given, evaluate ``func`` on slabs of the grid with about
+            this many points, which bounds the size of temporary arrays
+            created by ``func``. This gives the same result only if
+            ``func`` acts point-wise.
+            Default: ``None`` (evaluate on the full grid at once)
         kwargs :
             Additional keyword arguments, optional
 
@@ -264,17 +281,34 @@ vectorization_guide.html>`_ for a detailed introduction.
         See Also
         --------
         odl.discr.grid.RectGrid.meshgrid
+        odl.discr.grid.RectGrid.iter_meshgrid
         numpy.meshgrid
         """
-        mesh = self.grid.meshgrid
+        block_size = kwargs.pop('block_size', None)
+        if block_size is None:
+            mesh = self.grid.meshgrid
+            if out is None:
+                out = func(mesh, **kwargs).ravel(order=self.order)
+            else:
+                out[:] = np.ravel(
+                    func(mesh, out=out.asarray().reshape(self.grid.shape,
+                                                         order=self.order),
+                         **kwargs),
+                    order=self.order)
+            return out
+
+        slabs = self.grid.iter_meshgrid(block_size, order=self.order)
         if out is None:
-            out = func(mesh, **kwargs).ravel(order=self.order)
+            out = np.empty(self.grid.size, dtype=self.range.dtype)
+            for slc, mesh in slabs:
+                out[slc] = np.ravel(func(mesh, **kwargs), order=self.order)
         else:
-            out[:] = np.ravel(
-                func(mesh, out=out.asarray().reshape(self.grid.shape,
-                                                     order=self.order),
-                     **kwargs),
-                order=self.order)
+            with writable_array(out) as out_arr:
+                for slc, mesh in slabs:
+                    slab_shape = np.broadcast(*mesh).shape
+                    out_slab = out_arr[slc].reshape(slab_shape,
+                                                    order=self.order)
+                    out_slab[:] = func(mesh, out=out_slab, **kwargs)
 
         return out
 
@@ -442,6 +476,66 @@ class NearestInterpolation(FunctionSetMapping):
 
         return self.range.element(nearest, vectorized=True)
 
+    def evaluation_op(self, points, impl='sparse'):
+        """Return the interpolation at fixed ``points`` as operator.
+
+        The operator maps grid values to the values of their nearest
+        neighbor interpolant at ``points``. By default, index search and
+        weights are computed once and stored in a sparse CSR matrix, such
+        that repeated evaluation at the same points is a single sparse
+        matrix-vector product.
+
+        Parameters
+        ----------
+        points : `array-like` or `meshgrid`
+            Evaluation points, given as ``(ndim, N)`` array (shape
+            ``(N,)`` is allowed in 1d) or as `meshgrid`, in the same way
+            as for the evaluation of a vectorized function. The values
+            of a meshgrid are stored in C ordering.
+        impl : {'sparse', 'matrix_free'}, optional
+            Implementation of the evaluation.
+
+            'sparse' : Precompute a sparse CSR matrix. Evaluation is a
+            sparse matrix-vector product (default).
+
+            'matrix_free' : Interpolate on each call, and scatter the
+            values with the interpolation weights in the adjoint. This
+            variant needs no additional memory.
+
+        Returns
+        -------
+        op : `Operator`
+            Linear operator from `Operator.domain` to a space of size
+            ``N``. Its adjoint is exact, taking the weighting of the
+            data space into account. The operator should be stored for
+            repeated use.
+
+        Raises
+        ------
+        TypeError
+            If `Operator.range` is not a `FunctionSpace`, i.e., if the
+            interpolation is not linear.
+
+        Examples
+        --------
+        >>> part = odl.uniform_partition(0, 1, 4)
+        >>> space = odl.FunctionSpace(odl.IntervalProd(0, 1))
+        >>> interp_op = NearestInterpolation(space, part, odl.rn(4))
+        >>> eval_op = interp_op.evaluation_op([0.1, 0.3, 0.9])
+        >>> eval_op([1, 2, 3, 4])
+        rn(3).element([1.0, 2.0, 4.0])
+        >>> interp_op([1, 2, 3, 4])([0.1, 0.3, 0.9])
+        array([ 1.,  2.,  4.])
+        """
+        if not self.is_linear:
+            raise TypeError('evaluation operator only defined for '
+                            '`FunctionSpace` range, got {!r}'
+                            ''.format(self.range))
+        ndim = self.grid.ndim
+        return _InterpolationEvaluation(
+            self, points, schemes=['nearest'] * ndim,
+            nn_variants=[self.variant] * ndim, impl=impl)
+
     def __repr__(self):
         """Return ``repr(self)``."""
         inner_str = '\n  {!r},\n  {!r},\n  {!r}'.format(
@@ -525,6 +619,56 @@ class LinearInterpolation(FunctionSetMapping):
 
         return self.range.element(linear, vectorized=True)
 
+    def evaluation_op(self, points, impl='sparse'):
+        """Return the interpolation at fixed ``points`` as operator.
+
+        The operator maps grid values to the values of their linear
+        interpolant at ``points``. By default, index search and the
+        ``2 ** ndim`` weight products are computed once and stored in a
+        sparse CSR matrix, such that repeated evaluation at the same
+        points is a single sparse matrix-vector product.
+
+        Parameters
+        ----------
+        points : `array-like` or `meshgrid`
+            Evaluation points, given as ``(ndim, N)`` array (shape
+            ``(N,)`` is allowed in 1d) or as `meshgrid`, in the same way
+            as for the evaluation of a vectorized function. The values
+            of a meshgrid are stored in C ordering.
+        impl : {'sparse', 'matrix_free'}, optional
+            Implementation of the evaluation.
+
+            'sparse' : Precompute a sparse CSR matrix. Evaluation is a
+            sparse matrix-vector product (default).
+
+            'matrix_free' : Interpolate on each call, and scatter the
+            values with the interpolation weights in the adjoint. This
+            variant needs no additional memory.
+
+        Returns
+        -------
+        op : `Operator`
+            Linear operator from `Operator.domain` to a space of size
+            ``N``. Its adjoint is exact, taking the weighting of the
+            data space into account. The operator should be stored for
+            repeated use.
+
+        Examples
+        --------
+        >>> part = odl.uniform_partition(0, 1, 4)
+        >>> space = odl.FunctionSpace(odl.IntervalProd(0, 1))
+        >>> interp_op = LinearInterpolation(space, part, odl.rn(4))
+        >>> eval_op = interp_op.evaluation_op([0.25, 0.5])
+        >>> eval_op([1, 2, 3, 4])
+        rn(2).element([1.5, 2.5])
+        >>> eval_op.adjoint([1, 1])
+        rn(4).element([0.5, 1.0, 0.5, 0.0])
+        """
+        ndim = self.grid.ndim
+        return _InterpolationEvaluation(
+            self, points, schemes=['linear'] * ndim,
+            nn_variants=[None] * ndim, impl=impl)
+
     def __repr__(self):
         """Return ``repr(self)``."""
         inner_str = '\n  {!r},\n  {!r},\n  {!r}'.format(self.range,
@@ -660,6 +804,44 @@ class PerAxisInterpolation(FunctionSetMapping):
 
         return self.range.element(per_axis_interp, vectorized=True)
 
+    def evaluation_op(self, points, impl='sparse'):
+        """Return the interpolation at fixed ``points`` as operator.
+
+        The operator maps grid values to the values of their interpolant
+        at ``points``. By default, index search and weights are computed
+        once and stored in a sparse CSR matrix, such that repeated
+        evaluation at the same points is a single sparse matrix-vector
+        product.
+
+        Parameters
+        ----------
+        points : `array-like` or `meshgrid`
+            Evaluation points, given as ``(ndim, N)`` array (shape
+            ``(N,)`` is allowed in 1d) or as `meshgrid`, in the same way
+            as for the evaluation of a vectorized function. The values
+            of a meshgrid are stored in C ordering.
+        impl : {'sparse', 'matrix_free'}, optional
+            Implementation of the evaluation.
+
+            'sparse' : Precompute a sparse CSR matrix. Evaluation is a
+            sparse matrix-vector product (default).
+
+            'matrix_free' : Interpolate on each call, and scatter the
+            values with the interpolation weights in the adjoint. This
+            variant needs no additional memory.
+
+        Returns
+        -------
+        op : `Operator`
+            Linear operator from `Operator.domain` to a space of size
+            ``N``. Its adjoint is exact, taking the weighting of the
+            data space into account. The operator should be stored for
+            repeated use.
+        """
+        return _InterpolationEvaluation(
+            self, points, schemes=self.schemes,
+            nn_variants=self.nn_variants, impl=impl)
+
     def __repr__(self):
         """Return ``repr(self)``."""
         if all(scm == self.schemes[0] for scm in self.schemes):
@@ -734,6 +916,10 @@ scipy.interpolate.RegularGridInterpolator.html>`_ class.
         self.values = values
         self.input_type = input_type
 
+        # Strides of uniform axes, used to find indices by arithmetic
+        # instead of binary search
+        self.uniform_strides = _uniform_strides(self.coord_vecs)
+
     def __call__(self, x, out=None):
         """Do the interpolation.
 
@@ -775,6 +961,13 @@ scipy.interpolate.RegularGridInterpolator.html>`_ class.
                                  'dtype {}'
                                  ''.format(out.dtype, self.values.dtype))
 
+        return self._interpolate(x, out_shape, out)
+
+    def _interpolate(self, x, out_shape, out=None):
+        """Interpolate at ``x`` after checking the input.
+
+        Can be overridden by subclasses, e.g., to split up the work.
+        """
         indices, norm_distances = self._find_indices(x)
         return self._evaluate(indices, norm_distances, out)
 
@@ -783,23 +976,7 @@ scipy.interpolate.RegularGridInterpolator.html>`_ class.
 
         Can be overridden by subclasses to improve efficiency.
         """
-        # find relevant edges between which xi are situated
-        index_vecs = []
-        # compute distance to lower edge in unity units
-        norm_distances = []
-
-        # iterate through dimensions
-        for xi, cvec in zip(x, self.coord_vecs):
-            idcs = np.searchsorted(cvec, xi) - 1
-
-            idcs[idcs < 0] = 0
-            idcs[idcs > cvec.size - 2] = cvec.size - 2
-            index_vecs.append(idcs)
-
-            norm_distances.append((xi - cvec[idcs]) /
-                                  (cvec[idcs + 1] - cvec[idcs]))
-
-        return index_vecs, norm_distances
+        return _find_indices(self.coord_vecs, x, self.uniform_strides)
 
     def _evaluate(self, indices, norm_distances, out=None):
         """Evaluation method, needs to be overridden."""
@@ -852,6 +1029,60 @@ scipy.interpolate.RegularGridInterpolator.html>`_ class.
             return self.values[idx_res]
 
 
+def _uniform_strides(coord_vecs):
+    """Return the strides of uniform coordinate vectors, else ``None``."""
+    strides = []
+    for cvec in coord_vecs:
+        diff = np.diff(cvec)
+        if diff.size > 0 and np.allclose(diff, diff[0], atol=0):
+            strides.append((cvec[-1] - cvec[0]) / (cvec.size - 1))
+        else:
+            strides.append(None)
+    return strides
+
+
+def _find_indices(coord_vecs, x, uniform_strides=None):
+    """Find indices and distances of the given nodes in a grid.
+
+    For axes with a given entry in ``uniform_strides``, the indices
+    are computed by arithmetic instead of binary search. The results
+    are the same in both cases.
+    """
+    if uniform_strides is None:
+        uniform_strides = [None] * len(coord_vecs)
+
+    # find relevant edges between which xi are situated
+    index_vecs = []
+    # compute distance to lower edge in unity units
+    norm_distances = []
+
+    # iterate through dimensions
+    for xi, cvec, stride in zip(x, coord_vecs, uniform_strides):
+        if stride is not None:
+            # The integer part of the position in units of the stride is
+            # the index of the lower neighbor, up to rounding errors
+            idcs = np.floor(np.subtract(xi, cvec[0], dtype=float) /
+                            stride).astype(int)
+            np.clip(idcs, 0, cvec.size - 2, out=idcs)
+
+            # Correct the rounding such that the indices agree with
+            # the binary search
+            idcs -= (xi <= cvec[idcs]) & (idcs > 0)
+            idcs += (xi > cvec[idcs + 1]) & (idcs < cvec.size - 2)
+        else:
+            idcs = np.searchsorted(cvec, xi) - 1
+
+            idcs[idcs < 0] = 0
+            idcs[idcs > cvec.size - 2] = cvec.size - 2
+
+        index_vecs.append(idcs)
+
+        norm_distances.append((xi - cvec[idcs]) /
+                              (cvec[idcs + 1] - cvec[idcs]))
+
+    return index_vecs, norm_distances
+
+
 def _compute_nearest_weights_edge(idcs, ndist, variant):
     """Helper for nearest interpolation mimicing the linear case."""
     # Get out-of-bounds indices from the norm_distances. Negative
@@ -940,6 +1171,382 @@ def _create_weight_edge_lists(indices, norm_distances, schemes, variants):
     return low_weights, high_weights, edge_indices
 
 
+def _flat_neighbors(coord_vecs, x, schemes, nn_variants,
+                    uniform_strides=None, idx_strides=None):
+    """Return flat offsets and weights of the neighbors of points ``x``.
+
+    Parameters
+    ----------
+    coord_vecs : sequence of `numpy.ndarray`'s
+        Coordinate vectors defining the interpolation grid
+    x : `numpy.ndarray` or sequence of `numpy.ndarray`'s
+        Points as ``(ndim, N)`` array.
+    schemes : sequence of strings
+        Interpolation scheme per axis
+    nn_variants : sequence of strings
+        Nearest neighbor variant per axis, ``None`` for non-nearest
+        schemes.
+    uniform_strides : sequence, optional
+        Strides of uniform axes as returned by `_uniform_strides`.
+    idx_strides : sequence of ints, optional
+        Index strides of the flattened grid values per axis. For the
+        default ``None``, C ordering is used.
+
+    Returns
+    -------
+    offsets : list
+        Per axis, the pair of flat offsets of lower and upper neighbors.
+    weights : list
+        Per axis, the pair of weights of lower and upper neighbors.
+    """
+    if idx_strides is None:
+        idx_strides = _grid_idx_strides([cvec.size for cvec in coord_vecs],
+                                        'C')
+
+    indices, norm_distances = _find_indices(coord_vecs, x, uniform_strides)
+    low_weights, high_weights, edge_indices = _create_weight_edge_lists(
+        indices, norm_distances, schemes, nn_variants)
+
+    # Edge indices can be -1 for the last point
+    offsets = [[np.mod(e, cvec.size) * stride for e in edge]
+               for edge, cvec, stride in zip(edge_indices, coord_vecs,
+                                             idx_strides)]
+    weights = list(zip(low_weights, high_weights))
+    return offsets, weights
+
+
+def _fill_neighbors(offsets, weights, idx, weight):
+    """Iterate over all neighbors, filling flat indices and weights.
+
+    For each of the ``2 ** ndim`` combinations of lower and upper
+    neighbors per axis, the buffers ``idx`` and ``weight`` are filled
+    in-place before the generator yields.
+    """
+    ndim = len(offsets)
+    for lo_hi in product([0, 1], repeat=ndim):
+        idx[:] = offsets[0][lo_hi[0]]
+        weight[:] = weights[0][lo_hi[0]]
+        for i in range(1, ndim):
+            idx += offsets[i][lo_hi[i]]
+            weight *= weights[i][lo_hi[i]]
+        yield lo_hi
+
+
+def _grid_idx_strides(shape, order):
+    """Return the index strides of an array with ``shape`` and ``order``."""
+    if order == 'C':
+        return [int(np.prod(shape[i + 1:])) for i in range(len(shape))]
+    else:
+        return [int(np.prod(shape[:i])) for i in range(len(shape))]
+
+
+def _point_array(points, ndim):
+    """Return ``points`` as ``(ndim, N)`` array, flattening meshgrids."""
+    if is_valid_input_meshgrid(points, ndim):
+        return np.array([np.ravel(p) for p in np.broadcast_arrays(*points)],
+                        dtype=float)
+    else:
+        return np.asarray(points, dtype=float).reshape([ndim, -1])
+
+
+def _interpolation_matrix(coord_vecs, points, schemes, nn_variants,
+                          order='C', dtype=float):
+    """Return the sparse matrix of a per-axis interpolation at ``points``.
+
+    The matrix has one row per point and one column per grid point,
+    where the grid points are flattened according to ``order``. Its
+    entries are the same weights as used in `_PerAxisInterpolator`,
+    including the treatment of out-of-bounds points.
+
+    Parameters
+    ----------
+    coord_vecs : sequence of `numpy.ndarray`'s
+        Coordinate vectors defining the interpolation grid
+    points : `numpy.ndarray`
+        Evaluation points as ``(ndim, N)`` array.
+    schemes : sequence of strings
+        Interpolation scheme per axis
+    nn_variants : sequence of strings
+        Nearest neighbor variant per axis, ``None`` for non-nearest
+        schemes.
+    order : {'C', 'F'}, optional
+        Ordering of the flattened grid values.
+    dtype : optional
+        Data type of the matrix entries.
+
+    Returns
+    -------
+    matrix : `scipy.sparse.csr_matrix`
+    """
+    npoints = points.shape[1]
+    shape = tuple(cvec.size for cvec in coord_vecs)
+    offsets, weights = _flat_neighbors(
+        coord_vecs, points, schemes, nn_variants,
+        idx_strides=_grid_idx_strides(shape, order))
+
+    # One matrix entry per point and neighbor; duplicate entries are
+    # summed up in the conversion to CSR
+    rows, cols, data = [], [], []
+    idx_buf = np.empty(npoints, dtype=int)
+    weight_buf = np.empty(npoints, dtype=dtype)
+    for _ in _fill_neighbors(offsets, weights, idx_buf, weight_buf):
+        rows.append(np.arange(npoints))
+        cols.append(idx_buf.copy())
+        data.append(weight_buf.copy())
+
+    matrix = scipy.sparse.coo_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(npoints, int(np.prod(shape)))).tocsr()
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def _scatter_add(acc, idx, vals):
+    """Add ``vals`` to ``acc`` at indices ``idx``, with repeated indices.
+
+    Indices in a short range are accumulated with `numpy.bincount`,
+    scattered ones with the slower, but memory-efficient `numpy.ufunc.at`.
+    """
+    if idx.size == 0:
+        return
+    lo = idx.min()
+    hi = idx.max() + 1
+    if hi - lo > 4 * idx.size:
+        np.add.at(acc, idx, vals)
+    elif np.iscomplexobj(vals):
+        acc[lo:hi] += np.bincount(idx - lo, weights=vals.real,
+                                  minlength=hi - lo)
+        acc[lo:hi] += 1j * np.bincount(idx - lo, weights=vals.imag,
+                                       minlength=hi - lo)
+    else:
+        acc[lo:hi] += np.bincount(idx - lo, weights=vals, minlength=hi - lo)
+
+
+def _per_axis_interp_scatter(coord_vecs, points, values, schemes,
+                             nn_variants, order='C'):
+    """Scatter ``values`` at ``points`` to the grid nodes.
+
+    This is the adjoint (transpose) of per-axis interpolation at
+    ``points`` with respect to the unweighted inner products. Each value
+    is distributed to the neighbors of its point with the interpolation
+    weights. The points are processed in blocks, where each thread
+    accumulates into its own array, and the partial results are summed
+    up at the end.
+
+    Parameters
+    ----------
+    coord_vecs : sequence of `numpy.ndarray`'s
+        Coordinate vectors defining the interpolation grid
+    points : `numpy.ndarray`
+        Points as ``(ndim, N)`` array.
+    values : `numpy.ndarray`
+        Values at the points, shape ``(N,)``.
+    schemes : sequence of strings
+        Interpolation scheme per axis
+    nn_variants : sequence of strings
+        Nearest neighbor variant per axis, ``None`` for non-nearest
+        schemes.
+    order : {'C', 'F'}, optional
+        Ordering of the flattened grid values.
+
+    Returns
+    -------
+    scattered : `numpy.ndarray`
+        Flat array of accumulated values at the grid nodes.
+    """
+    shape = tuple(cvec.size for cvec in coord_vecs)
+    size = int(np.prod(shape))
+    idx_strides = _grid_idx_strides(shape, order)
+    uniform_strides = _uniform_strides(coord_vecs)
+
+    def scatter_blocks(blocks):
+        acc = np.zeros(size, dtype=values.dtype)
+        if not blocks:
+            return [acc]
+        block_size = max(b.stop - b.start for b in blocks)
+        idx_buf = np.empty(block_size, dtype=int)
+        weight_buf = np.empty(block_size, dtype=float)
+        val_buf = np.empty(block_size, dtype=values.dtype)
+
+        for blk in blocks:
+            n = blk.stop - blk.start
+            idx, weight, vals = idx_buf[:n], weight_buf[:n], val_buf[:n]
+            offsets, weights = _flat_neighbors(
+                coord_vecs, [xi[blk] for xi in points], schemes,
+                nn_variants, uniform_strides, idx_strides)
+
+            for _ in _fill_neighbors(offsets, weights, idx, weight):
+                np.multiply(values[blk], weight, out=vals)
+                _scatter_add(acc, idx, vals)
+
+        return [acc]
+
+    partial_sums = map_blocks(scatter_blocks, points.shape[1],
+                               INTERP_BLOCK_SIZE, INTERP_THREADING_THRESHOLD,
+                               grouped=True)
+    scattered = partial_sums[0]
+    for partial_sum in partial_sums[1:]:
+        scattered += partial_sum
+    return scattered
+
+
+class _InterpolationEvaluation(Operator):
+
+    """Interpolation of grid values evaluated at fixed points.
+
+    The operator maps the values of an interpolation operator's data
+    space to the values of the interpolant at fixed points. It is
+    created by the ``evaluation_op`` methods of the interpolation
+    operators.
+    """
+
+    def __init__(self, interp_op, points, schemes, nn_variants,
+                 impl='sparse'):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        interp_op : `FunctionSetMapping`
+            Linear interpolation operator whose interpolant is evaluated.
+        points : `array-like` or `meshgrid`
+            Evaluation points.
+        schemes : sequence of strings
+            Interpolation scheme per axis
+        nn_variants : sequence of strings
+            Nearest neighbor variant per axis, ``None`` for non-nearest
+            schemes.
+        impl : {'sparse', 'matrix_free'}, optional
+            Implementation of the evaluation, see ``evaluation_op``.
+        """
+        impl, impl_in = str(impl).lower(), impl
+        if impl not in ('sparse', 'matrix_free'):
+            raise ValueError("`impl` '{}' not understood".format(impl_in))
+
+        dspace = interp_op.domain
+        self.__interp_op = interp_op
+        self.__points = _point_array(points, interp_op.grid.ndim)
+        self.__schemes = list(schemes)
+        self.__nn_variants = list(nn_variants)
+        self.__impl = impl
+
+        if impl == 'sparse':
+            self.__matrix = _interpolation_matrix(
+                interp_op.grid.coord_vectors, self.points, self.schemes,
+                self.nn_variants, order=interp_op.order,
+                dtype=dspace.real_dtype)
+        else:
+            self.__matrix = None
+
+        range = fn(self.points.shape[1], dtype=dspace.dtype)
+        super().__init__(dspace, range, linear=True)
+
+    @property
+    def interp_op(self):
+        """Interpolation operator evaluated by this operator."""
+        return self.__interp_op
+
+    @property
+    def points(self):
+        """Evaluation points as ``(ndim, N)`` array."""
+        return self.__points
+
+    @property
+    def schemes(self):
+        """List of interpolation schemes, one for each axis."""
+        return self.__schemes
+
+    @property
+    def nn_variants(self):
+        """List of nearest neighbor variants, one for each axis."""
+        return self.__nn_variants
+
+    @property
+    def impl(self):
+        """Implementation of the evaluation."""
+        return self.__impl
+
+    @property
+    def matrix(self):
+        """Sparse interpolation matrix, ``None`` if not precomputed."""
+        return self.__matrix
+
+    def _call(self, x, out):
+        """Evaluate the interpolant of ``x`` at the points."""
+        if self.impl == 'sparse':
+            out[:] = self.matrix.dot(x.asarray())
+        else:
+            grid = self.interp_op.grid
+            interpolator = _PerAxisInterpolator(
+                grid.coord_vectors,
+                x.asarray().reshape(grid.shape, order=self.interp_op.order),
+                input_type='array', schemes=self.schemes,
+                nn_variants=self.nn_variants)
+            with writable_array(out) as out_arr:
+                interpolator(self.points, out=out_arr)
+
+    @property
+    def adjoint(self):
+        """Adjoint operator scattering values at the points to the grid.
+
+        The adjoint takes the weighting of the data space into account.
+        """
+        return _InterpolationEvaluationAdjoint(self)
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{!r}.evaluation_op(<{} points>, impl={!r})'.format(
+            self.interp_op, self.points.shape[1], self.impl)
+
+
+class _InterpolationEvaluationAdjoint(Operator):
+
+    """Adjoint of `_InterpolationEvaluation`, scattering to the grid."""
+
+    def __init__(self, op):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        op : `_InterpolationEvaluation`
+            Operator whose adjoint is represented.
+        """
+        super().__init__(op.range, op.domain, linear=True)
+        self.__op = op
+
+        weighting = op.domain.weighting
+        if hasattr(weighting, 'array'):
+            self.__weights = weighting.array
+        elif hasattr(weighting, 'const'):
+            self.__weights = weighting.const
+        else:
+            raise NotImplementedError(
+                'adjoint not defined for weighting {!r} of the data space'
+                ''.format(weighting))
+
+    def _call(self, y, out):
+        """Scatter the values ``y`` at the points to the grid."""
+        op = self.__op
+        if op.impl == 'sparse':
+            # The interpolation matrix is real, hence no conjugation
+            scattered = op.matrix.T.dot(y.asarray())
+        else:
+            scattered = _per_axis_interp_scatter(
+                op.interp_op.grid.coord_vectors, op.points, y.asarray(),
+                op.schemes, op.nn_variants, order=op.interp_op.order)
+
+        scattered /= self.__weights
+        out[:] = scattered
+
+    @property
+    def adjoint(self):
+        """Evaluation operator whose adjoint this operator is."""
+        return self.__op
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{!r}.adjoint'.format(self.__op)
+
+
 class _PerAxisInterpolator(_Interpolator):
 
     """Interpolator where the scheme is set per axis.
@@ -969,6 +1576,90 @@ class _PerAxisInterpolator(_Interpolator):
         self.schemes = schemes
         self.nn_variants = nn_variants
 
+    def _interpolate(self, x, out_shape, out=None):
+        """Interpolate at ``x`` in blocks of points.
+
+        The points are processed in blocks of about `INTERP_BLOCK_SIZE`
+        points, which are distributed over several threads for large
+        inputs. Array input uses a kernel working on flat indices with
+        buffers that are reused for all ``2 ** ndim`` neighbors.
+        Meshgrid input is split along the first axis.
+        """
+        ndim = len(self.coord_vecs)
+        if self.values.ndim != ndim or not out_shape:
+            # Trailing dimensions in values are handled by the generic code
+            return super()._interpolate(x, out_shape, out)
+
+        if out is None:
+            out = np.empty(out_shape, dtype=self.values.dtype)
+
+        if self.input_type == 'array':
+            values = self.values
+            if not (values.flags.c_contiguous or values.flags.f_contiguous):
+                values = np.ascontiguousarray(values)
+            order = 'C' if values.flags.c_contiguous else 'F'
+            flat_values = values.ravel(order=order)
+            idx_strides = [stride // values.itemsize
+                           for stride in values.strides]
+
+            func = partial(self._evaluate_point_blocks, x, flat_values,
+                           idx_strides, out)
+            map_blocks(func, out.size, INTERP_BLOCK_SIZE,
+                        INTERP_THREADING_THRESHOLD, grouped=True)
+        else:
+            # Slabs along the first axis; vectors with length 1 in that
+            # axis are used as a whole
+            num_slabs = out_shape[0]
+            slab_size = int(np.prod(out_shape[1:]))
+            thickness = max(1, INTERP_BLOCK_SIZE // max(slab_size, 1))
+            threading_threshold = -(-INTERP_THREADING_THRESHOLD //
+                                    max(slab_size, 1))
+
+            def evaluate_slabs(slabs):
+                for slc in slabs:
+                    x_slab = [xi if np.shape(xi)[0] == 1 else xi[slc]
+                              for xi in x]
+                    indices, norm_distances = self._find_indices(x_slab)
+                    self._evaluate(indices, norm_distances, out[slc])
+                return []
+
+            map_blocks(evaluate_slabs, num_slabs, thickness,
+                        threading_threshold, grouped=True)
+
+        return np.array(out, copy=False, ndmin=1)
+
+    def _evaluate_point_blocks(self, x, flat_values, idx_strides, out,
+                               blocks):
+        """Evaluate at point array ``x`` in the given blocks.
+
+        Each neighbor is added as ``out += values[idx] * weight`` with
+        flat indices ``idx``, where index, weight and value buffers are
+        allocated once and reused for all neighbors and blocks.
+        """
+        if not blocks:
+            return []
+        block_size = max(b.stop - b.start for b in blocks)
+        idx_buf = np.empty(block_size, dtype=int)
+        weight_buf = np.empty(block_size, dtype=float)
+        val_buf = np.empty(block_size, dtype=flat_values.dtype)
+
+        for blk in blocks:
+            n = blk.stop - blk.start
+            idx, weight, vals = idx_buf[:n], weight_buf[:n], val_buf[:n]
+            out_blk = out[blk]
+            out_blk[:] = 0
+
+            offsets, weights = _flat_neighbors(
+                self.coord_vecs, [xi[blk] for xi in x], self.schemes,
+                self.nn_variants, self.uniform_strides, idx_strides)
+
+            for _ in _fill_neighbors(offsets, weights, idx, weight):
+                np.take(flat_values, idx, out=vals)
+                vals *= weight
+                out_blk += vals
+
+        return []
+
     def _evaluate(self, indices, norm_distances, out=None):
         """Evaluate linear interpolation.
 
@@ -489,6 +489,11 @@ class DiscretizedSpace(DiscretizedSet, FnBase):
         """Raw linear combination."""
         self.dspace._lincomb(a, x1.ntuple, b, x2.ntuple, out.ntuple)
 
+    def _lincomb_n(self, coeffs, vectors, out):
+        """Raw n-ary linear combination."""
+        self.dspace._lincomb_n(coeffs, [x.ntuple for x in vectors],
+                               out.ntuple)
+
     def _dist(self, x1, x2):
         """Raw distance between two elements."""
         return self.dspace._dist(x1.ntuple, x2.ntuple)
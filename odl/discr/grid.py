@@ -29,6 +29,11 @@ from odl.util import (
 __all__ = ('RectGrid', 'uniform_grid', 'uniform_grid_fromintv')
 
 
+# Default number of points per block in `RectGrid.iter_points` and
+# `RectGrid.iter_meshgrid`
+POINTS_BLOCK_SIZE = 2 ** 16
+
+
 def sparse_meshgrid(*x):
     """Make a sparse `meshgrid` by adding empty dimensions.
 
@@ -760,19 +765,29 @@ class RectGrid(Set):
         coord_vecs = [self.coord_vectors[axis] for axis in nondegen_indcs]
         return RectGrid(*coord_vecs)
 
-    def points(self, order='C'):
+    def points(self, order='C', indices=None):
         """All grid points in a single array.
 
         Parameters
         ----------
         order : {'C', 'F'}, optional
             Axis ordering in the resulting point array
+        indices : `slice` or `array-like` of int, optional
+            Flat indices, with respect to ``order``, of the points to
+            return. Only these points are computed, which avoids
+            creating the full array for large grids.
+            ``None`` means all points.
 
         Returns
         -------
         points : `numpy.ndarray`
             The shape of the array is ``size x ndim``, i.e. the points
-            are stored as rows.
+            are stored as rows. If ``indices`` is given, the number of
+            rows is the number of indices.
+
+        See Also
+        --------
+        iter_points : iterate over blocks of points
 
         Examples
         --------
@@ -791,12 +806,37 @@ class RectGrid(Set):
                [ 1.,  0.],
                [ 0.,  2.],
                [ 1.,  2.]])
+
+        Selected points can be computed without the full array:
+
+        >>> g.points(indices=slice(1, None, 2))
+        array([[ 0.,  0.],
+               [ 1., -1.],
+               [ 1.,  2.]])
+        >>> g.points(order='F', indices=[0, -1])
+        array([[ 0., -1.],
+               [ 1.,  2.]])
         """
         if str(order).upper() not in ('C', 'F'):
             raise ValueError('order {!r} not recognized'.format(order))
         else:
             order = str(order).upper()
 
+        if indices is not None:
+            if isinstance(indices, slice):
+                indices = np.arange(*indices.indices(self.size))
+            else:
+                indices = np.array(indices, dtype=int, ndmin=1).ravel()
+                indices[indices < 0] += self.size
+
+            multi_indices = np.unravel_index(indices, self.shape,
+                                             order=order)
+            point_arr = np.empty((indices.size, self.ndim))
+            for axis, idcs in enumerate(multi_indices):
+                point_arr[:, axis] = self.coord_vectors[axis][idcs]
+
+            return point_arr
+
         axes = range(self.ndim) if order == 'C' else reversed(range(self.ndim))
         shape = self.shape if order == 'C' else tuple(reversed(self.shape))
         point_arr = np.empty((self.size, self.ndim))
@@ -808,6 +848,122 @@ class RectGrid(Set):
 
         return point_arr
 
+    def iter_points(self, block_size=None, order='C'):
+        """Iterate over blocks of consecutive grid points.
+
+        The points are computed block by block, hence the memory
+        needed is bounded by the block size rather than by the grid
+        size.
+
+        Parameters
+        ----------
+        block_size : positive int, optional
+            Number of points per block.
+            Default: `POINTS_BLOCK_SIZE`
+        order : {'C', 'F'}, optional
+            Axis ordering of the points
+
+        Yields
+        ------
+        slc : `slice`
+            Flat indices of the points in the block, i.e., the block is
+            equal to ``points(order)[slc]``.
+        points : `numpy.ndarray`
+            Array of shape ``(n, ndim)`` with ``n <= block_size``,
+            containing the points of the block as rows.
+
+        See Also
+        --------
+        points : all grid points or a selection as array
+        iter_meshgrid : iterate over slabs as sparse meshgrids
+
+        Examples
+        --------
+        >>> g = RectGrid([0, 1], [-1, 0, 2])
+        >>> for slc, pts in g.iter_points(block_size=4):
+        ...     print(slc, pts.tolist())
+        slice(0, 4, None) [[0.0, -1.0], [0.0, 0.0], [0.0, 2.0], [1.0, -1.0]]
+        slice(4, 6, None) [[1.0, 0.0], [1.0, 2.0]]
+        """
+        if block_size is None:
+            block_size = POINTS_BLOCK_SIZE
+        block_size, block_size_in = safe_int_conv(block_size), block_size
+        if block_size <= 0:
+            raise ValueError('`block_size` must be positive, got {}'
+                             ''.format(block_size_in))
+
+        for start in range(0, self.size, block_size):
+            slc = slice(start, min(start + block_size, self.size))
+            yield slc, self.points(order, indices=slc)
+
+    def iter_meshgrid(self, block_size=None, order='C'):
+        """Iterate over slabs of the grid as sparse meshgrids.
+
+        The grid is split along its slowest varying axis with respect
+        to ``order``, i.e., the first axis for ``'C'`` and the last for
+        ``'F'``. Each slab contains as many full grid slices along that
+        axis as fit into ``block_size`` points, but at least one.
+
+        Parameters
+        ----------
+        block_size : positive int, optional
+            Approximate number of points per slab.
+            Default: `POINTS_BLOCK_SIZE`
+        order : {'C', 'F'}, optional
+            Axis ordering of the flat point indices
+
+        Yields
+        ------
+        slc : `slice`
+            Flat indices of the points in the slab with respect to
+            ``order``.
+        meshgrid : tuple of `numpy.ndarray`'s
+            Sparse meshgrid of the slab, see `meshgrid`.
+
+        See Also
+        --------
+        meshgrid : sparse meshgrid of the full grid
+        iter_points : iterate over blocks of points
+
+        Examples
+        --------
+        >>> g = RectGrid([0, 1, 2], [-1, 0, 2])
+        >>> for slc, (x, y) in g.iter_meshgrid(block_size=6):
+        ...     print(slc, x.ravel().tolist(), y.ravel().tolist())
+        slice(0, 6, None) [0.0, 1.0] [-1.0, 0.0, 2.0]
+        slice(6, 9, None) [2.0] [-1.0, 0.0, 2.0]
+        """
+        if str(order).upper() not in ('C', 'F'):
+            raise ValueError('order {!r} not recognized'.format(order))
+        else:
+            order = str(order).upper()
+
+        if block_size is None:
+            block_size = POINTS_BLOCK_SIZE
+        block_size, block_size_in = safe_int_conv(block_size), block_size
+        if block_size <= 0:
+            raise ValueError('`block_size` must be positive, got {}'
+                             ''.format(block_size_in))
+
+        mesh = self.meshgrid
+        if self.ndim == 0:
+            yield slice(0, self.size), mesh
+            return
+
+        axis = 0 if order == 'C' else self.ndim - 1
+        num_slices = self.shape[axis]
+        slice_size = self.size // num_slices
+        slices_per_slab = max(1, block_size // slice_size)
+
+        for start in range(0, num_slices, slices_per_slab):
+            stop = min(start + slices_per_slab, num_slices)
+            slab_idx = [slice(None)] * self.ndim
+            slab_idx[axis] = slice(start, stop)
+            slab_mesh = list(mesh)
+            slab_mesh[axis] = mesh[axis][tuple(slab_idx)]
+            yield (slice(start * slice_size, stop * slice_size),
+                   tuple(slab_mesh))
+
     def corner_grid(self):
         """Return a grid with only the corner points.
 
@@ -951,13 +951,15 @@ def uniform_discr_frompartition(partition, exponent=2.0, interp='nearest',
 
             Default for 'cuda': 'float32'
 
-    weighting : {'const', 'none'}, optional
+    weighting : {'const', 'none'} or `Weighting`, optional
         Weighting of the discretized space functions.
 
             'const' : weight is a constant, the cell volume (default)
 
             'none' : no weighting
 
+        A `Weighting` instance is used as-is.
+
     Returns
     -------
     discr : `DiscreteLp`
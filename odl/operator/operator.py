@@ -20,7 +20,7 @@ from numbers import Number, Integral
 import sys
 
 from odl.set import LinearSpace, LinearSpaceElement, Set, Field
-from odl.util import cache_arguments
+from odl.util import cache_arguments, borrow_element
 
 
 __all__ = ('Operator', 'OperatorComp', 'OperatorSum', 'OperatorVectorSum',
@@ -1028,6 +1028,72 @@ class Operator(object):
     __array_priority__ = 2000000.0
 
 
+def _split_scalar(op):
+    """Split ``op`` into a scalar factor and a remaining operator.
+
+    Chained left scalar multiplications are folded into one coefficient.
+    Scalars are also pulled out of compositions where this is valid,
+    i.e., always on the left and on the right if the left operator is
+    linear.
+
+    Returns
+    -------
+    coeff : scalar
+    operator : `Operator`
+        Operator such that ``op == coeff * operator``.
+    """
+    if isinstance(op, OperatorLeftScalarMult):
+        coeff, inner = _split_scalar(op.operator)
+        return op.scalar * coeff, inner
+    elif isinstance(op, OperatorRightScalarMult) and op.operator.is_linear:
+        coeff, inner = _split_scalar(op.operator)
+        return op.scalar * coeff, inner
+    elif isinstance(op, OperatorComp):
+        left_coeff, left = _split_scalar(op.left)
+        if left.is_linear:
+            right_coeff, right = _split_scalar(op.right)
+        else:
+            right_coeff, right = 1, op.right
+        if left_coeff == 1 and right_coeff == 1:
+            return 1, op
+        else:
+            return left_coeff * right_coeff, OperatorComp(left, right)
+    else:
+        return 1, op
+
+
+def _sum_terms(op):
+    """Return the flattened terms of a sum expression ``op``.
+
+    Nested sums are flattened, scalar factors are folded into one
+    coefficient per term, and the coefficients of identical operators
+    are added up.
+
+    Returns
+    -------
+    terms : list of tuple
+        Pairs ``(coeff, operator)`` such that
+        ``op(x) == sum(c * operator(x) for c, operator in terms)``.
+    """
+    coeff, inner = _split_scalar(op)
+    if isinstance(inner, OperatorSum):
+        raw_terms = [(coeff * c, term_op)
+                     for summand in (inner.left, inner.right)
+                     for c, term_op in _sum_terms(summand)]
+    else:
+        raw_terms = [(coeff, inner)]
+
+    terms = []
+    for c, term_op in raw_terms:
+        for i, (other_c, other_op) in enumerate(terms):
+            if term_op is other_op:
+                terms[i] = (other_c + c, other_op)
+                break
+        else:
+            terms.append((c, term_op))
+    return terms
+
+
 class OperatorSum(Operator):
 
     """Expression type for the sum of operators.
@@ -1037,6 +1103,10 @@ class OperatorSum(Operator):
     The sum is only well-defined for `Operator` instances where
     `Operator.range` is a `LinearSpace`.
 
+    For evaluation, nested sums and scalar multiplications are
+    flattened into a linear combination of operators (see `terms`).
+    Each distinct operator is applied only once, and the scalings are
+    carried out as part of the linear combination of the results.
     """
 
     def __init__(self, left, right, tmp_ran=None, tmp_dom=None):
@@ -1094,6 +1164,7 @@ class OperatorSum(Operator):
         self.__right = right
         self.__tmp_ran = tmp_ran
         self.__tmp_dom = tmp_dom
+        self.__terms = None
 
     @property
     def left(self):
@@ -1105,16 +1176,62 @@ class OperatorSum(Operator):
         """The left/second part of this sum."""
         return self.__right
 
+    @property
+    def terms(self):
+        """Flattened linear combination used for evaluation.
+
+        Returns
+        -------
+        terms : tuple of tuple
+            Pairs ``(coeff, operator)`` such that ``self(x)`` is equal
+            to ``sum(c * op(x) for c, op in self.terms)``. Each operator
+            occurs only once.
+
+        Examples
+        --------
+        >>> r3 = odl.rn(3)
+        >>> op = odl.IdentityOperator(r3)
+        >>> summed = 2 * (3 * op) + op
+        >>> summed.terms == ((7, op),)
+        True
+        >>> summed([1, 2, 3])
+        rn(3).element([7.0, 14.0, 21.0])
+        """
+        if self.__terms is None:
+            self.__terms = tuple(_sum_terms(self))
+        return self.__terms
+
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
+        terms = self.terms
         if out is None:
-            return self.left(x) + self.right(x)
+            if not isinstance(self.range, LinearSpace):
+                return sum(c * op(x) for c, op in terms)
+            out = self.range.element()
+            self._call(x, out=out)
+            return out
+
+        (first_coeff, first_op), other_terms = terms[0], terms[1:]
+        first_op(x, out=out)
+        if not other_terms:
+            if first_coeff != 1:
+                out *= first_coeff
+            return
+
+        if self.__tmp_ran is not None:
+            self._accumulate(x, out, first_coeff, other_terms,
+                             self.__tmp_ran)
         else:
-            tmp = (self.__tmp_ran if self.__tmp_ran is not None
-                   else self.range.element())
-            self.left(x, out=out)
-            self.right(x, out=tmp)
-            out += tmp
+            with borrow_element(self.range) as tmp:
+                self._accumulate(x, out, first_coeff, other_terms, tmp)
+
+    @staticmethod
+    def _accumulate(x, out, out_coeff, terms, tmp):
+        """Add ``terms`` evaluated at ``x`` to ``out_coeff * out``."""
+        for c, op in terms:
+            op(x, out=tmp)
+            out.lincomb(out_coeff, out, c, tmp)
+            out_coeff = 1
 
     def derivative(self, x):
         """Return the operator derivative at ``x``.
@@ -1318,10 +1435,13 @@ class OperatorComp(Operator):
         if out is None:
             return self.left(self.right(x))
         else:
-            tmp = (self.__tmp if self.__tmp is not None
-                   else self.right.range.element())
-            self.right(x, out=tmp)
-            return self.left(tmp, out=out)
+            if self.__tmp is not None:
+                self.right(x, out=self.__tmp)
+                return self.left(self.__tmp, out=out)
+            else:
+                with borrow_element(self.right.range) as tmp:
+                    self.right(x, out=tmp)
+                    return self.left(tmp, out=out)
 
     @property
     def inverse(self):
@@ -1446,10 +1566,10 @@ class OperatorPointwiseProduct(Operator):
         if out is None:
             return self.left(x) * self.right(x)
         else:
-            tmp = self.right.range.element()
             self.left(x, out=out)
-            self.right(x, out=tmp)
-            out *= tmp
+            with borrow_element(self.right.range) as tmp:
+                self.right(x, out=tmp)
+                out *= tmp
 
     def derivative(self, x):
         """Return the derivative at ``x``."""
@@ -1707,11 +1827,12 @@ class OperatorRightScalarMult(Operator):
             return self.operator(self.scalar * x)
         else:
             if self.__tmp is not None:
-                tmp = self.__tmp
+                self.__tmp.lincomb(self.scalar, x)
+                self.operator(self.__tmp, out=out)
             else:
-                tmp = self.domain.element()
-            tmp.lincomb(self.scalar, x)
-            self.operator(tmp, out=out)
+                with borrow_element(self.domain) as tmp:
+                    tmp.lincomb(self.scalar, x)
+                    self.operator(tmp, out=out)
 
     def __mul__(self, other):
         """Implement ``self * other``.
@@ -2086,9 +2207,9 @@ class OperatorRightVectorMult(Operator):
         if out is None:
             return self.operator(x * self.vector)
         else:
-            tmp = self.domain.element()
-            x.multiply(self.vector, out=tmp)
-            self.operator(tmp, out=out)
+            with borrow_element(self.domain) as tmp:
+                x.multiply(self.vector, out=tmp)
+                self.operator(tmp, out=out)
 
     @property
     def inverse(self):
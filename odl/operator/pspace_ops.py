@@ -14,6 +14,7 @@ from future import standard_library
 standard_library.install_aliases()
 from builtins import super
 
+from collections import OrderedDict
 import numpy as np
 import scipy as sp
 from numbers import Integral
@@ -21,6 +22,8 @@ from numbers import Integral
 from odl.operator.operator import Operator
 from odl.operator.default_ops import ZeroOperator
 from odl.space import ProductSpace
+from odl.util import (
+    borrow_element, ELEMENT_POOL, thread_pool, in_worker_thread)
 
 
 __all__ = ('ProductSpaceOperator',
@@ -28,6 +31,11 @@ __all__ = ('ProductSpaceOperator',
            'BroadcastOperator', 'ReductionOperator', 'DiagonalOperator')
 
 
+def _threads_repr(threads):
+    """Return the ``threads`` part of a ``repr`` string."""
+    return '' if threads == 1 else ', threads={}'.format(threads)
+
+
 class ProductSpaceOperator(Operator):
 
     """A "matrix of operators" on product spaces.
@@ -94,7 +102,7 @@ class ProductSpaceOperator(Operator):
     DiagonalOperator : Case where the 'matrix' is diagonal.
     """
 
-    def __init__(self, operators, domain=None, range=None):
+    def __init__(self, operators, domain=None, range=None, threads=1):
         """Initialize a new instance.
 
         Parameters
@@ -109,6 +117,24 @@ class ProductSpaceOperator(Operator):
             Range of the operator. If not provided, it is tried to be
             inferred from the operators. This requires each **row**
             to contain at least one operator.
+        threads : positive int, optional
+            Number of threads used to evaluate the component operators
+            concurrently. This pays off if the component operators
+            release the GIL, e.g., in NumPy, FFT or ASTRA calls.
+            For ``threads > 1``, each component operator that is not the
+            first one in its row needs a temporary element during
+            evaluation. Derived operators like `derivative` and
+            `adjoint` use the same number of threads.
+
+            Operators may keep internal scratch data, e.g.,
+            `OperatorComp` with ``tmp`` or `OperatorSum` with
+            ``tmp_ran``, and are then not safe to run concurrently.
+            Therefore, repeated occurrences of the same operator
+            object are evaluated one after the other in one thread.
+            Distinct operators that share such a component must not be
+            used with ``threads > 1``. Within a worker thread of
+            another threaded evaluation, the operators are evaluated
+            serially.
 
         Examples
         --------
@@ -160,6 +186,12 @@ class ProductSpaceOperator(Operator):
             if range.is_weighted:
                 raise NotImplementedError('weighted spaces not supported')
 
+        threads, threads_in = int(threads), threads
+        if threads != threads_in or threads < 1:
+            raise ValueError('`threads` must be a positive integer, got {}'
+                             ''.format(threads_in))
+        self.__threads = threads
+
         # Convert ops to sparse representation
         self.ops = sp.sparse.coo_matrix(operators)
 
@@ -216,11 +248,21 @@ class ProductSpaceOperator(Operator):
 
         super().__init__(domain=domain, range=range, linear=linear)
 
+    @property
+    def threads(self):
+        """Number of threads used for evaluation."""
+        return self.__threads
+
     def _call(self, x, out=None):
         """Call the operators on the parts of ``x``."""
         # TODO: add optimization in case an operator appears repeatedly in a
         # row
-        if out is None:
+        if (self.threads > 1 and self.ops.nnz > 1 and
+                not in_worker_thread()):
+            if out is None:
+                out = self.range.element()
+            self._call_threaded(x, out)
+        elif out is None:
             out = self.range.zero()
             for i, j, op in zip(self.ops.row, self.ops.col, self.ops.data):
                 out[i] += op(x[j])
@@ -230,8 +272,9 @@ class ProductSpaceOperator(Operator):
                 if not has_evaluated_row[i]:
                     op(x[j], out=out[i])
                 else:
-                    # TODO: optimize
-                    out[i] += op(x[j])
+                    with borrow_element(op.range) as tmp:
+                        op(x[j], out=tmp)
+                        out[i] += tmp
 
                 has_evaluated_row[i] = True
 
@@ -241,6 +284,51 @@ class ProductSpaceOperator(Operator):
 
         return out
 
+    def _call_threaded(self, x, out):
+        """Evaluate the component operators concurrently into ``out``."""
+        # The first operator in each row writes into `out` directly, the
+        # others into temporaries that are added afterwards
+        jobs = []
+        temporaries = []
+        has_evaluated_row = np.zeros(self.range.size, dtype=bool)
+        try:
+            for i, j, op in zip(self.ops.row, self.ops.col, self.ops.data):
+                if not has_evaluated_row[i]:
+                    jobs.append((op, x[j], out[i]))
+                else:
+                    tmp = ELEMENT_POOL.acquire(op.range)
+                    temporaries.append((i, tmp))
+                    jobs.append((op, x[j], tmp))
+
+                has_evaluated_row[i] = True
+
+            # Evaluations of the same operator object are done in the
+            # same task since they may share internal scratch data
+            tasks = OrderedDict()
+            for op, x_j, out_j in jobs:
+                tasks.setdefault(id(op), []).append((op, x_j, out_j))
+
+            def run_task(task):
+                for op, x_j, out_j in task:
+                    op(x_j, out=out_j)
+
+            tasks = list(tasks.values())
+            if len(tasks) == 1:
+                run_task(tasks[0])
+            else:
+                pool = thread_pool(min(self.threads, len(tasks)))
+                pool.map(run_task, tasks)
+
+            for i, tmp in temporaries:
+                out[i] += tmp
+        finally:
+            for _, tmp in temporaries:
+                ELEMENT_POOL.release(tmp)
+
+        for i, evaluated in enumerate(has_evaluated_row):
+            if not evaluated:
+                out[i].set_zero()
+
     def derivative(self, x):
         """Derivative of the product space operator.
 
@@ -307,7 +395,8 @@ class ProductSpaceOperator(Operator):
         indices = [self.ops.row, self.ops.col]
         shape = self.ops.shape
         deriv_matrix = sp.sparse.coo_matrix((deriv_ops, indices), shape)
-        return ProductSpaceOperator(deriv_matrix, self.domain, self.range)
+        return ProductSpaceOperator(deriv_matrix, self.domain, self.range,
+                                    threads=self.threads)
 
     @property
     def adjoint(self):
@@ -350,7 +439,8 @@ class ProductSpaceOperator(Operator):
         indices = [self.ops.col, self.ops.row]  # Swap col/row -> transpose
         shape = (self.ops.shape[1], self.ops.shape[0])
         adj_matrix = sp.sparse.coo_matrix((adjoint_ops, indices), shape)
-        return ProductSpaceOperator(adj_matrix, self.range, self.domain)
+        return ProductSpaceOperator(adj_matrix, self.range, self.domain,
+                                    threads=self.threads)
 
     def __getitem__(self, index):
         """Get sub-operator by index.
@@ -413,7 +503,7 @@ class ProductSpaceOperator(Operator):
                 if ops[i] is None:
                     ops[i] = ZeroOperator(self.domain[i])
 
-            return ReductionOperator(*ops)
+            return ReductionOperator(*ops, threads=self.threads)
 
     @property
     def shape(self):
@@ -434,7 +524,8 @@ class ProductSpaceOperator(Operator):
         aslist = [[0] * self.domain.size for _ in range(self.range.size)]
         for i, j, op in zip(self.ops.row, self.ops.col, self.ops.data):
             aslist[i][j] = op
-        return '{}({!r})'.format(self.__class__.__name__, aslist)
+        return '{}({!r}{})'.format(self.__class__.__name__, aslist,
+                                   _threads_repr(self.threads))
 
 
 class ComponentProjection(Operator):
@@ -645,7 +736,7 @@ class BroadcastOperator(Operator):
     ReductionOperator : Calculates sum of operator results.
     DiagonalOperator : Case where each operator should have its own argument.
     """
-    def __init__(self, *operators):
+    def __init__(self, *operators, **kwargs):
         """Initialize a new instance
 
         Parameters
@@ -654,6 +745,9 @@ class BroadcastOperator(Operator):
             The individual operators that should be evaluated.
             Can also be given as ``operator, n`` with ``n`` integer,
             in which case ``operator`` is repeated ``n`` times.
+        threads : positive int, optional
+            Number of threads used to evaluate the operators
+            concurrently, see `ProductSpaceOperator`.
 
         Examples
         --------
@@ -687,8 +781,14 @@ class BroadcastOperator(Operator):
                 isinstance(operators[1], Integral)):
             operators = (operators[0],) * operators[1]
 
+        threads = kwargs.pop('threads', 1)
+        if kwargs:
+            raise TypeError('got unexpected keyword arguments {}'
+                            ''.format(kwargs))
+
         self.__operators = operators
-        self.__prod_op = ProductSpaceOperator([[op] for op in operators])
+        self.__prod_op = ProductSpaceOperator([[op] for op in operators],
+                                              threads=threads)
 
         super().__init__(self.prod_op.domain[0],
                          self.prod_op.range,
@@ -699,6 +799,11 @@ class BroadcastOperator(Operator):
         """`ProductSpaceOperator` implementation."""
         return self.__prod_op
 
+    @property
+    def threads(self):
+        """Number of threads used for evaluation."""
+        return self.prod_op.threads
+
     @property
     def operators(self):
         """Tuple of sub-operators that comprise ``self``."""
@@ -761,7 +866,8 @@ class BroadcastOperator(Operator):
         ])
         """
         return BroadcastOperator(*[op.derivative(x) for op in
-                                   self.operators])
+                                   self.operators],
+                                 threads=self.threads)
 
     @property
     def adjoint(self):
@@ -778,7 +884,8 @@ class BroadcastOperator(Operator):
         >>> op.adjoint([[1, 2, 3], [2, 3, 4]])
         rn(3).element([5.0, 8.0, 11.0])
         """
-        return ReductionOperator(*[op.adjoint for op in self.operators])
+        return ReductionOperator(*[op.adjoint for op in self.operators],
+                                 threads=self.threads)
 
     def __repr__(self):
         """Return ``repr(self)``.
@@ -794,11 +901,13 @@ class BroadcastOperator(Operator):
         BroadcastOperator(IdentityOperator(rn(3)), ScalingOperator(rn(3), 3.0))
         """
         if all(op == self[0] for op in self):
-            return '{}({!r}, {})'.format(self.__class__.__name__,
-                                         self[0], len(self))
+            return '{}({!r}, {}{})'.format(self.__class__.__name__,
+                                           self[0], len(self),
+                                           _threads_repr(self.threads))
         else:
             op_repr = ', '.join(repr(op) for op in self)
-            return '{}({})'.format(self.__class__.__name__, op_repr)
+            return '{}({}{})'.format(self.__class__.__name__, op_repr,
+                                     _threads_repr(self.threads))
 
 
 class ReductionOperator(Operator):
@@ -815,7 +924,7 @@ class ReductionOperator(Operator):
     BroadcastOperator : Calls several operators with same argument.
     DiagonalOperator : Case where each operator should have its own argument.
     """
-    def __init__(self, *operators):
+    def __init__(self, *operators, **kwargs):
         """Initialize a new instance.
 
         Parameters
@@ -824,6 +933,9 @@ class ReductionOperator(Operator):
             The individual operators that should be evaluated and summed.
             Can also be given as ``operator, n`` with ``n`` integer,
             in which case ``operator`` is repeated ``n`` times.
+        threads : positive int, optional
+            Number of threads used to evaluate the operators
+            concurrently, see `ProductSpaceOperator`.
 
         Examples
         --------
@@ -863,8 +975,13 @@ class ReductionOperator(Operator):
                 isinstance(operators[1], Integral)):
             operators = (operators[0],) * operators[1]
 
+        threads = kwargs.pop('threads', 1)
+        if kwargs:
+            raise TypeError('got unexpected keyword arguments {}'
+                            ''.format(kwargs))
+
         self.__operators = operators
-        self.__prod_op = ProductSpaceOperator([operators])
+        self.__prod_op = ProductSpaceOperator([operators], threads=threads)
 
         super().__init__(self.prod_op.domain,
                          self.prod_op.range[0],
@@ -875,6 +992,11 @@ class ReductionOperator(Operator):
         """`ProductSpaceOperator` implementation."""
         return self.__prod_op
 
+    @property
+    def threads(self):
+        """Number of threads used for evaluation."""
+        return self.prod_op.threads
+
     @property
     def operators(self):
         """Tuple of sub-operators that comprise ``self``."""
@@ -945,7 +1067,8 @@ class ReductionOperator(Operator):
         rn(3).element([9.0, 14.0, 19.0])
         """
         return ReductionOperator(*[op.derivative(xi)
-                                   for op, xi in zip(self.operators, x)])
+                                   for op, xi in zip(self.operators, x)],
+                                 threads=self.threads)
 
     @property
     def adjoint(self):
@@ -965,7 +1088,8 @@ class ReductionOperator(Operator):
             [2.0, 4.0, 6.0]
         ])
         """
-        return BroadcastOperator(*[op.adjoint for op in self.operators])
+        return BroadcastOperator(*[op.adjoint for op in self.operators],
+                                 threads=self.threads)
 
     def __repr__(self):
         """Return ``repr(self)``.
@@ -981,11 +1105,13 @@ class ReductionOperator(Operator):
         ReductionOperator(IdentityOperator(rn(3)), ScalingOperator(rn(3), 3.0))
         """
         if all(op == self[0] for op in self):
-            return '{}({!r}, {})'.format(self.__class__.__name__,
-                                         self[0], len(self))
+            return '{}({!r}, {}{})'.format(self.__class__.__name__,
+                                           self[0], len(self),
+                                           _threads_repr(self.threads))
         else:
             op_repr = ', '.join(repr(op) for op in self)
-            return '{}({})'.format(self.__class__.__name__, op_repr)
+            return '{}({}{})'.format(self.__class__.__name__, op_repr,
+                                     _threads_repr(self.threads))
 
 
 class DiagonalOperator(ProductSpaceOperator):
@@ -1110,7 +1236,8 @@ class DiagonalOperator(ProductSpaceOperator):
 
         derivs = [op.derivative(p) for op, p in zip(self.operators, point)]
         return DiagonalOperator(*derivs,
-                                domain=self.domain, range=self.range)
+                                domain=self.domain, range=self.range,
+                                threads=self.threads)
 
     @property
     def adjoint(self):
@@ -1139,7 +1266,8 @@ class DiagonalOperator(ProductSpaceOperator):
         """
         adjoints = [op.adjoint for op in self.operators]
         return DiagonalOperator(*adjoints,
-                                domain=self.range, range=self.domain)
+                                domain=self.range, range=self.domain,
+                                threads=self.threads)
 
     @property
     def inverse(self):
@@ -1168,7 +1296,8 @@ class DiagonalOperator(ProductSpaceOperator):
         """
         inverses = [op.inverse for op in self.operators]
         return DiagonalOperator(*inverses,
-                                domain=self.range, range=self.domain)
+                                domain=self.range, range=self.domain,
+                                threads=self.threads)
 
     def __repr__(self):
         """Return ``repr(self)``.
@@ -1184,11 +1313,13 @@ class DiagonalOperator(ProductSpaceOperator):
         DiagonalOperator(IdentityOperator(rn(3)), ScalingOperator(rn(3), 3.0))
         """
         if all(op == self[0] for op in self):
-            return '{}({!r}, {})'.format(self.__class__.__name__,
-                                         self[0], len(self))
+            return '{}({!r}, {}{})'.format(self.__class__.__name__,
+                                           self[0], len(self),
+                                           _threads_repr(self.threads))
         else:
             op_repr = ', '.join(repr(op) for op in self)
-            return '{}({})'.format(self.__class__.__name__, op_repr)
+            return '{}({}{})'.format(self.__class__.__name__, op_repr,
+                                     _threads_repr(self.threads))
 
 
 if __name__ == '__main__':
@@ -93,6 +93,34 @@ class LinearSpace(Set):
         resort to `lincomb` which is type-checked.
         """
 
+    def _lincomb_n(self, coeffs, vectors, out):
+        """Implement ``out[:] = sum(c * x for c, x in zip(coeffs, vectors))``.
+
+        This method is intended to be private. Public callers should
+        resort to `lincomb_n` which is type-checked.
+
+        The default implementation chains calls to `_lincomb`, where
+        a summand aliased with ``out`` is taken care of first. Spaces
+        that can evaluate the combination in a single pass over memory
+        should override this method.
+        """
+        # default implementation
+        terms = list(zip(coeffs, vectors))
+        for i, (_, x) in enumerate(terms):
+            if x is out:
+                terms.insert(0, terms.pop(i))
+                break
+
+        if len(terms) == 1:
+            a, x1 = terms[0]
+            self._lincomb(a, x1, 0, x1, out)
+            return
+
+        (a, x1), (b, x2) = terms[:2]
+        self._lincomb(a, x1, b, x2, out)
+        for c, x in terms[2:]:
+            self._lincomb(1, out, c, x, out)
+
     def _dist(self, x1, x2):
         """Return the distance between ``x1`` and ``x2``.
 
@@ -235,6 +263,89 @@ class LinearSpace(Set):
 
         return out
 
+    def lincomb_n(self, coeffs, vectors, out=None):
+        """Implement ``out[:] = sum(c * x for c, x in zip(coeffs, vectors))``.
+
+        This is the n-ary variant of `lincomb`. Spaces may evaluate
+        it in a single pass over memory, which is considerably faster
+        than chaining several calls to `lincomb` if the elements are
+        large.
+
+        Parameters
+        ----------
+        coeffs : sequence of `field` elements
+            Scalars to multiply ``vectors`` with.
+        vectors : sequence of `LinearSpaceElement`
+            Space elements in the linear combination. Must have the
+            same length as ``coeffs``.
+        out : `LinearSpaceElement`, optional
+            Element to which the result is written.
+
+        Returns
+        -------
+        out : `LinearSpaceElement`
+            Result of the linear combination. If ``out`` was provided,
+            the returned object is a reference to it.
+
+        Notes
+        -----
+        The elements in ``vectors`` and ``out`` may be aligned.
+        Coefficients of elements occurring several times in ``vectors``
+        are added up before evaluation, thus a call
+
+            ``space.lincomb_n([1, 2, -1], [x, y, x], out=x)``
+
+        is equivalent to
+
+            ``space.lincomb(0, x, 2, y, out=x)``.
+
+        Examples
+        --------
+        >>> r3 = odl.rn(3)
+        >>> x = r3.element([1, 2, 3])
+        >>> y = r3.element([1, 1, 1])
+        >>> z = r3.element([0, 1, 0])
+        >>> r3.lincomb_n([2, -1, 3], [x, y, z])
+        rn(3).element([1.0, 6.0, 5.0])
+        """
+        coeffs = list(coeffs)
+        vectors = list(vectors)
+        if len(coeffs) != len(vectors):
+            raise ValueError('`coeffs` and `vectors` must have the same '
+                             'length, got {} and {}'
+                             ''.format(len(coeffs), len(vectors)))
+        if not vectors:
+            raise ValueError('need at least one element in `vectors`')
+
+        if out is None:
+            out = self.element()
+
+        if out not in self:
+            raise LinearSpaceTypeError('`out` {!r} is not an element of {!r}'
+                                       ''.format(out, self))
+
+        # Merge coefficients of repeated elements to save passes
+        unique_coeffs, unique_vectors = [], []
+        for i, (c, x) in enumerate(zip(coeffs, vectors)):
+            if c not in self.field:
+                raise LinearSpaceTypeError('`coeffs[{}]` {!r} not an element '
+                                           'of the field {!r} of {!r}'
+                                           ''.format(i, c, self.field, self))
+            if x not in self:
+                raise LinearSpaceTypeError('`vectors[{}]` {!r} is not an '
+                                           'element of {!r}'
+                                           ''.format(i, x, self))
+            for j, y in enumerate(unique_vectors):
+                if x is y:
+                    unique_coeffs[j] += c
+                    break
+            else:
+                unique_coeffs.append(c)
+                unique_vectors.append(x)
+
+        self._lincomb_n(unique_coeffs, unique_vectors, out)
+        return out
+
     def dist(self, x1, x2):
         """Return the distance between ``x1`` and ``x2``.
 
@@ -485,6 +596,22 @@ class LinearSpaceElement(object):
         """
         return self.space.lincomb(a, x1, b, x2, out=self)
 
+    def lincomb_n(self, coeffs, vectors):
+        """Implement ``self[:] = sum(c * x for c, x in zip(coeffs, vectors))``.
+
+        Parameters
+        ----------
+        coeffs : sequence of elements of ``space.field``
+            Scalars to multiply ``vectors`` with.
+        vectors : sequence of `LinearSpaceElement`
+            Space elements in the linear combination.
+
+        See Also
+        --------
+        LinearSpace.lincomb_n
+        """
+        return self.space.lincomb_n(coeffs, vectors, out=self)
+
     def set_zero(self):
         """Set this element to zero.
 
@@ -198,8 +198,7 @@ def douglas_rachford_pd(x, f, g, L, tau, sigma, niter,
         z1.lincomb(1.0, w1, - (tau / 2.0), tmp_domain)
 
         # Compute x += lam(k) * (z1 - p1)
-        x.lincomb(1, x, lam_k, z1)
-        x.lincomb(1, x, -lam_k, p1)
+        x.lincomb_n([1, lam_k, -lam_k], [x, z1, p1])
 
         tmp_domain.lincomb(2, z1, -1, w1)
         for i in range(m):
@@ -214,8 +213,7 @@ def douglas_rachford_pd(x, f, g, L, tau, sigma, niter,
                 z2[i].lincomb(1, w2[i], sigma[i] / 2.0, L[i](tmp_domain))
 
             # Compute v[i] += lam(k) * (z2[i] - p2[i])
-            v[i].lincomb(1, v[i], lam_k, z2[i])
-            v[i].lincomb(1, v[i], -lam_k, p2[i])
+            v[i].lincomb_n([1, lam_k, -lam_k], [v[i], z2[i], p2[i]])
 
         if callback is not None:
             callback(p1)
@@ -28,7 +28,7 @@ from odl.operator import (Operator, IdentityOperator, ScalingOperator,
                           ConstantOperator, DiagonalOperator)
 from odl.space import ProductSpace
 from odl.set import LinearSpaceElement
-from odl.util import cache_arguments
+from odl.util import cache_arguments, borrow_element
 
 
 __all__ = ('combine_proximals', 'proximal_cconj', 'proximal_translation',
@@ -717,7 +717,7 @@ def proximal_l2(space, lam=1, g=None):
                     out.set_zero()
 
             else:
-                x_norm = (x - g).norm() * (1 + eps)
+                x_norm = x.dist(g) * (1 + eps)
                 if x_norm > 0:
                     step = self.sigma * lam / x_norm
                 else:
@@ -982,29 +982,33 @@ def proximal_cconj_l1(space, lam=1, g=None, isotropic=False):
             # lam * (x - sigma * g) / max(lam, |x - sigma * g|)
 
             if g is not None:
-                diff = x - self.sigma * g
+                with borrow_element(self.domain) as diff:
+                    diff.lincomb(1, x, -self.sigma, g)
+                    self._call_shifted(diff, out)
             else:
-                diff = x
+                self._call_shifted(x, out)
 
+        def _call_shifted(self, diff, out):
+            """Compute ``lam * diff / max(lam, |diff|)`` in ``out``."""
             if isotropic:
                 # Calculate |x| = pointwise 2-norm of x
+                with borrow_element(diff[0].space) as tmp, \
+                        borrow_element(diff[0].space) as sq_tmp:
+                    diff[0].multiply(diff[0], out=tmp)
+                    for x_i in diff[1:]:
+                        x_i.multiply(x_i, out=sq_tmp)
+                        tmp += sq_tmp
+                    tmp.ufuncs.sqrt(out=tmp)
 
-                tmp = diff[0] ** 2
-                sq_tmp = x[0].space.element()
-                for x_i in diff[1:]:
-                    x_i.multiply(x_i, out=sq_tmp)
-                    tmp += sq_tmp
-                tmp.ufuncs.sqrt(out=tmp)
+                    # Pointwise maximum of |x| and lambda
+                    tmp.ufuncs.maximum(lam, out=tmp)
 
-                # Pointwise maximum of |x| and lambda
-                tmp.ufuncs.maximum(lam, out=tmp)
-
-                # Global scaling
-                tmp /= lam
+                    # Global scaling
+                    tmp /= lam
 
-                # Pointwise division
-                for out_i, x_i in zip(out, diff):
-                    x_i.divide(tmp, out=out_i)
+                    # Pointwise division
+                    for out_i, x_i in zip(out, diff):
+                        x_i.divide(tmp, out=out_i)
 
             else:
                 # Calculate |x| = pointwise 2-norm of x
@@ -1215,7 +1219,7 @@ def proximal_cconj_kl(space, lam=1, g=None):
             out.lincomb(1, x, -1, out)
 
             # out = lam_X + out
-            out.lincomb(lam, space.one(), 1, out)
+            out += lam
 
             # out = 1/2 * out
             out /= 2
@@ -18,6 +18,9 @@ from . import weighting
 from .npy_ntuples import *
 __all__ += npy_ntuples.__all__
 
+from .npy_memmap import *
+__all__ += npy_memmap.__all__
+
 from .pspace import *
 __all__ += pspace.__all__
 
@@ -127,6 +127,7 @@ class NtuplesBase(Set):
 
         return ((isinstance(self, type(other)) or
                  isinstance(other, type(self))) and
+                getattr(self, 'impl', None) == getattr(other, 'impl', None) and
                 self.size == other.size and
                 self.dtype == other.dtype)
 
@@ -29,6 +29,7 @@ See Also
 --------
 NumpyFn : Numpy based implementation of `FnBase`
 NumpyNtuples : Numpy based implementation of `NtuplesBase`
+NumpyMemmapFn : Out-of-core variant of `NumpyFn` (``impl='numpy_memmap'``)
 """
 
 # Imports for common Python 2/3 codebase
@@ -38,11 +39,12 @@ standard_library.install_aliases()
 
 from pkg_resources import iter_entry_points
 from odl.space.npy_ntuples import NumpyNtuples, NumpyFn
+from odl.space.npy_memmap import NumpyMemmapNtuples, NumpyMemmapFn
 
 __all__ = ('NTUPLES_IMPLS', 'FN_IMPLS')
 
-NTUPLES_IMPLS = {'numpy': NumpyNtuples}
-FN_IMPLS = {'numpy': NumpyFn}
+NTUPLES_IMPLS = {'numpy': NumpyNtuples, 'numpy_memmap': NumpyMemmapNtuples}
+FN_IMPLS = {'numpy': NumpyFn, 'numpy_memmap': NumpyMemmapFn}
 for entry_point in iter_entry_points(group='odl.space', name=None):
     try:
         module = entry_point.load()
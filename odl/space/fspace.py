@@ -40,10 +40,12 @@ def _default_in_place(func, x, out, **kwargs):
 
 def _default_out_of_place(func, x, **kwargs):
     """Default in-place evaluation method."""
-    if is_valid_input_array(x, func.domain.ndim):
-        out_shape = out_shape_from_array(x)
-    elif is_valid_input_meshgrid(x, func.domain.ndim):
+    # Check for meshgrids first since `is_valid_input_array` can fail
+    # on them, e.g., for meshgrids of a single row
+    if is_valid_input_meshgrid(x, func.domain.ndim):
         out_shape = out_shape_from_meshgrid(x)
+    elif is_valid_input_array(x, func.domain.ndim):
+        out_shape = out_shape_from_array(x)
     else:
         raise TypeError('cannot use in-place method to implement '
                         'out-of-place non-vectorized evaluation')
@@ -57,6 +59,57 @@ def _default_out_of_place(func, x, **kwargs):
     return out
 
 
+def _vectorized_input_blocks(x, ndim, block_size):
+    """Return blocks of the vectorized input ``x``, or ``None``.
+
+    Meshgrids are split along their first axis and point arrays along
+    their last axis, into blocks of about ``block_size`` points.
+
+    Parameters
+    ----------
+    x :
+        Input to `FunctionSetElement.__call__`.
+    ndim : int or None
+        Number of dimensions of the function domain.
+    block_size : positive int
+        Approximate number of points per block.
+
+    Returns
+    -------
+    out_shape : tuple of int
+        Shape of the result of evaluating at ``x``.
+    blocks : list of tuple
+        Pairs ``(slc, x_block)``, where ``slc`` is the `slice` of the
+        first output axis corresponding to ``x_block``.
+
+    ``None`` is returned if ``x`` is no vectorized input or has at most
+    ``block_size`` points.
+    """
+    if is_valid_input_meshgrid(x, ndim):
+        out_shape = out_shape_from_meshgrid(x)
+    elif is_valid_input_array(x, ndim):
+        x = np.asarray(x)
+        out_shape = out_shape_from_array(x)
+    else:
+        return None
+
+    size = int(np.prod(out_shape))
+    if size <= block_size or out_shape[0] <= 1:
+        return None
+
+    block_len = max(1, block_size // (size // out_shape[0]))
+    blocks = []
+    for start in range(0, out_shape[0], block_len):
+        slc = slice(start, min(start + block_len, out_shape[0]))
+        if isinstance(x, tuple):
+            x_block = tuple(xi[slc] if xi.shape[0] > 1 else xi for xi in x)
+        else:
+            x_block = x[..., slc]
+        blocks.append((slc, x_block))
+
+    return out_shape, blocks
+
+
 def _broadcast_to(array, shape):
     """Wrapper for the numpy function broadcast_to.
 
@@ -319,6 +372,13 @@ class FunctionSetElement(Operator):
             domain in the case of vectorized evaluation. This requires
             the domain to implement `Set.contains_all`.
             Default: ``True``
+        block_size : positive int, optional
+            If given, vectorized input with more points is evaluated
+            block by block, with blocks of about ``block_size`` points.
+            This bounds the size of temporary arrays created by the
+            function, but gives the same result only for functions
+            acting point-wise.
+            Default: ``None`` (evaluate all points at once)
 
         Returns
         -------
@@ -337,6 +397,26 @@ class FunctionSetElement(Operator):
         ValueError
             If evaluation points fall outside the valid domain
         """
+        ndim = getattr(self.domain, 'ndim', None)
+        block_size = kwargs.pop('block_size', None)
+        if block_size is None:
+            input_blocks = None
+        else:
+            input_blocks = _vectorized_input_blocks(x, ndim, block_size)
+        if input_blocks is not None and (
+                out is None or
+                getattr(out, 'shape', None) == input_blocks[0]):
+            out_shape, blocks = input_blocks
+            for slc, x_block in blocks:
+                if out is None:
+                    # The first block determines the output data type
+                    out_block = self(x_block, **kwargs)
+                    out = np.empty(out_shape, dtype=out_block.dtype)
+                    out[slc] = out_block
+                else:
+                    self(x_block, out=out[slc], **kwargs)
+            return out
+
         bounds_check = kwargs.pop('bounds_check', True)
         if bounds_check and not hasattr(self.domain, 'contains_all'):
             raise AttributeError('bounds check not possible for '
@@ -348,7 +428,6 @@ class FunctionSetElement(Operator):
                                  'range {}, missing `contains_all()` '
                                  'method'.format(self.range))
 
-        ndim = getattr(self.domain, 'ndim', None)
         # Check for input type and determine output shape
         if is_valid_input_meshgrid(x, ndim):
             out_shape = out_shape_from_meshgrid(x)
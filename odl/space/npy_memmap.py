@@ -0,0 +1,245 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Out-of-core ``n``-dimensional spaces backed by memory-mapped files."""
+
+# Imports for common Python 2/3 codebase
+from __future__ import print_function, division, absolute_import
+from future import standard_library
+from future.utils import native
+standard_library.install_aliases()
+from builtins import super
+
+from functools import partial
+import mmap
+import tempfile
+import numpy as np
+
+from odl.space.npy_ntuples import (
+    NumpyNtuples, NumpyFn, LINCOMB_BLOCK_SIZE, LINCOMB_THREADING_THRESHOLD,
+    _lincomb_n_blocks)
+from odl.util import map_blocks
+
+
+__all__ = ('NumpyMemmapNtuples', 'NumpyMemmapFn')
+
+
+# Directory in which the backing files are created. ``None`` means the
+# default temporary directory, see `tempfile.gettempdir`.
+MEMMAP_SCRATCH_DIR = None
+
+
+def _is_file_backed(arr):
+    """Return ``True`` if ``arr`` is a view of a memory-mapped file."""
+    base = arr
+    while base is not None:
+        if isinstance(base, mmap.mmap):
+            return True
+        base = getattr(base, 'base', None)
+    return False
+
+
+def _memmap_empty(size, dtype, scratch_dir=None):
+    """Return an uninitialized array backed by a temporary file.
+
+    The file is removed from the file system right away (on POSIX
+    systems) or when it is closed, hence the disk space is released as
+    soon as the array and all its views are garbage collected.
+    """
+    dtype = np.dtype(dtype)
+    if size == 0 or dtype.itemsize == 0:
+        # Empty files cannot be mapped
+        return np.empty(size, dtype=dtype)
+
+    if scratch_dir is None:
+        scratch_dir = MEMMAP_SCRATCH_DIR
+
+    with tempfile.TemporaryFile(dir=scratch_dir) as fid:
+        # The memory map keeps its own handle, closing ``fid`` is safe
+        return np.memmap(fid, dtype=dtype, mode='w+', shape=(size,))
+
+
+class NumpyMemmapNtuples(NumpyNtuples):
+
+    """Set of n-tuples whose data is stored in memory-mapped files.
+
+    Each element is backed by a temporary file in a scratch directory,
+    such that the operating system can page the data out to disk. This
+    allows working with data sets that do not fit into memory.
+    """
+
+    impl = 'numpy_memmap'
+
+    def __init__(self, size, dtype, scratch_dir=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        size : non-negative int
+            Number of entries in a tuple.
+        dtype :
+            Data type for each tuple entry. Can be provided in any
+            way the `numpy.dtype` function understands, most notably
+            as built-in type, as one of NumPy's internal datatype
+            objects or as string.
+        scratch_dir : str, optional
+            Directory in which the backing files are created.
+            Default: ``MEMMAP_SCRATCH_DIR`` if set, otherwise the
+            default temporary directory.
+        """
+        super().__init__(size, dtype)
+        self.__scratch_dir = scratch_dir
+
+    @property
+    def scratch_dir(self):
+        """Directory in which the backing files are created."""
+        return self.__scratch_dir
+
+    def element(self, inp=None, data_ptr=None):
+        """Create a new element.
+
+        Parameters
+        ----------
+        inp : `array-like`, optional
+            Input to initialize the new element.
+
+            If ``inp`` is ``None``, an empty element is created with no
+            guarantee of its state (disk allocation only).
+
+            If ``inp`` is a view of a memory-mapped file of shape
+            ``(size,)`` and the same data type as this space, the array
+            is wrapped, not copied. Other `array-like` objects are
+            copied into a new memory-mapped file.
+
+        data_ptr : int, optional
+            Memory address of existing data which is wrapped. The data
+            is not copied into a file.
+
+        Returns
+        -------
+        element : `NumpyNtuplesVector`
+            The new element created (from ``inp``).
+
+        Examples
+        --------
+        >>> int3 = NumpyMemmapNtuples(3, dtype='int')
+        >>> x = int3.element([1, 2, 3])
+        >>> x
+        ntuples(3, 'int', impl='numpy_memmap').element([1, 2, 3])
+        >>> isinstance(x.data, np.memmap)
+        True
+        """
+        if data_ptr is not None or (inp is not None and inp in self):
+            return super().element(inp, data_ptr=data_ptr)
+
+        if inp is not None:
+            inp_arr = np.array(inp, copy=False, ndmin=1)
+            if inp_arr.shape != (self.size,):
+                raise ValueError('expected input shape {}, got {}'
+                                 ''.format((self.size,), inp_arr.shape))
+            if inp_arr.dtype == self.dtype and _is_file_backed(inp_arr):
+                return self.element_type(self, inp_arr)
+
+        arr = _memmap_empty(self.size, self.dtype, self.scratch_dir)
+        if inp is not None:
+            arr[:] = inp_arr
+        return self.element_type(self, arr)
+
+
+class NumpyMemmapFn(NumpyFn, NumpyMemmapNtuples):
+
+    """Vector space F^n whose vectors are stored in memory-mapped files.
+
+    This space behaves like `NumpyFn`, but each element is backed by a
+    temporary file in a scratch directory. Linear combinations are
+    computed in a single blocked pass over the data, and inner products,
+    norms and distances are reduced block-wise, such that iterative
+    solvers can run out-of-core.
+    """
+
+    def __init__(self, size, dtype='float64', **kwargs):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        size : positive int
+            The number of dimensions of the space
+        dtype :
+            The data type of the storage array. Can be provided in any
+            way the `numpy.dtype` function understands, most notably
+            as built-in type, as `numpy.dtype` or as string.
+
+            Only scalar data types are allowed.
+
+        scratch_dir : str, optional
+            Directory in which the backing files are created.
+            Default: ``MEMMAP_SCRATCH_DIR`` if set, otherwise the
+            default temporary directory.
+        kwargs :
+            Further keyword arguments are passed to `NumpyFn`.
+
+        Examples
+        --------
+        >>> space = NumpyMemmapFn(3, 'float')
+        >>> space
+        rn(3, impl='numpy_memmap')
+        >>> x = space.element([1, 2, 3])
+        >>> 2 * x
+        rn(3, impl='numpy_memmap').element([2.0, 4.0, 6.0])
+        """
+        self.__scratch_dir = kwargs.pop('scratch_dir', None)
+        super().__init__(size, dtype, **kwargs)
+
+    @property
+    def scratch_dir(self):
+        """Directory in which the backing files are created."""
+        return self.__scratch_dir
+
+    def _astype(self, dtype):
+        """Internal helper for ``astype``."""
+        return type(self)(self.size, dtype=dtype, weighting=self.weighting,
+                          scratch_dir=self.scratch_dir)
+
+    def _part_space(self):
+        """Space of the real and imaginary parts of elements.
+
+        The parts are views of the files backing the complex elements,
+        and new elements of this space are stored in files as well.
+        """
+        return type(self)(self.size, dtype=self.real_dtype,
+                          scratch_dir=self.scratch_dir)
+
+    def _lincomb(self, a, x1, b, x2, out):
+        """Linear combination of ``x1`` and ``x2`` in a single pass.
+
+        In contrast to `NumpyFn`, no BLAS routines are used since they
+        would require several passes over the data on disk.
+        """
+        self._lincomb_n([a, b], [x1, x2], out)
+
+    def _lincomb_n(self, coeffs, vectors, out):
+        """Linear combination of an arbitrary number of vectors.
+
+        The data is processed in blocks, reading each input and writing
+        the output exactly once.
+        """
+        terms = [(c, x) for c, x in zip(coeffs, vectors) if c != 0]
+        if not terms or not np.issubdtype(self.dtype, np.inexact):
+            super()._lincomb_n(coeffs, vectors, out)
+            return
+
+        func = partial(_lincomb_n_blocks, [c for c, _ in terms],
+                       [x.data for _, x in terms], out.data)
+        map_blocks(func, native(self.size), LINCOMB_BLOCK_SIZE,
+                    LINCOMB_THREADING_THRESHOLD, grouped=True)
+
+
+if __name__ == '__main__':
+    # pylint: disable=wrong-import-position
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -29,7 +29,7 @@ from odl.space.weighting import (
     Weighting, MatrixWeighting, ArrayWeighting,
     ConstWeighting, NoWeighting,
     CustomInner, CustomNorm, CustomDist)
-from odl.util import dtype_repr, is_real_dtype
+from odl.util import dtype_repr, is_real_dtype, map_blocks
 from odl.util.ufuncs import NumpyNtuplesUfuncs
 
 
@@ -40,6 +40,18 @@ __all__ = ('NumpyNtuples', 'NumpyNtuplesVector', 'NumpyFn', 'NumpyFnVector',
 _BLAS_DTYPES = (np.dtype('float32'), np.dtype('float64'),
                 np.dtype('complex64'), np.dtype('complex128'))
 
+# Number of entries processed at once in `NumpyFn.lincomb_n`, chosen such
+# that the accumulation buffers stay in the CPU cache
+LINCOMB_BLOCK_SIZE = 2 ** 13
+
+# Minimum size from which `NumpyFn.lincomb_n` uses several threads
+LINCOMB_THREADING_THRESHOLD = 2 ** 22
+
+# Number of entries processed at once in inner products, norms and
+# distances, and minimum size from which these use several threads
+REDUCTION_BLOCK_SIZE = 2 ** 15
+REDUCTION_THREADING_THRESHOLD = 2 ** 20
+
 
 class NumpyNtuples(NtuplesBase):
 
@@ -146,6 +158,8 @@ class NumpyNtuples(NtuplesBase):
 
         inner_str = '{}'.format(self.size)
         inner_str += ', {}'.format(dtype_repr(self.dtype))
+        if self.impl != 'numpy':
+            inner_str += ", impl='{}'".format(self.impl)
 
         return '{}({})'.format(constructor_name, inner_str)
 
@@ -326,7 +340,11 @@ class NumpyNtuplesVector(NtuplesBaseVector):
         >>> vec1 is vec2
         False
         """
-        return self.space.element(self.data.copy())
+        # Fill a new element instead of wrapping ``data.copy()`` such
+        # that the space decides where the copy is stored
+        result = self.space.element()
+        result.data[:] = self.data
+        return result
 
     def __getitem__(self, indices):
         """Access values of this vector.
@@ -576,6 +594,57 @@ def _lincomb_impl(a, x1, b, x2, out, dtype):
                 axpy(x1.data, out.data, size, a)
 
 
+def _lincomb_n_blocks(coeffs, arrays, out_arr, blocks):
+    """Accumulate the linear combination on a sequence of blocks."""
+    if not blocks:
+        return []
+    block_size = max(b.stop - b.start for b in blocks)
+    acc_buf = np.empty(block_size, dtype=out_arr.dtype)
+    tmp_buf = np.empty(block_size, dtype=out_arr.dtype)
+    for blk in blocks:
+        n = blk.stop - blk.start
+        acc, tmp = acc_buf[:n], tmp_buf[:n]
+        np.multiply(arrays[0][blk], coeffs[0], out=acc)
+        for c, arr in zip(coeffs[1:], arrays[1:]):
+            if c == 1:
+                acc += arr[blk]
+            elif c == -1:
+                acc -= arr[blk]
+            else:
+                np.multiply(arr[blk], c, out=tmp)
+                acc += tmp
+        # All inputs of this block have been read, so ``out`` may alias
+        # any of them
+        out_arr[blk] = acc
+    return []
+
+
+def _lincomb_n_impl(coeffs, vectors, out):
+    """Raw n-ary linear combination in a single blocked pass."""
+    terms = [(c, x) for c, x in zip(coeffs, vectors) if c != 0]
+    if not terms:
+        out.data[:] = 0
+        return
+    elif len(terms) <= 2:
+        # The binary implementation is optimal here
+        (a, x1), (b, x2) = terms[0], terms[-1]
+        if len(terms) == 1:
+            b = 0
+        _lincomb_impl(a, x1, b, x2, out, out.dtype)
+        return
+
+    coeffs = [c for c, _ in terms]
+    arrays = [x.data for _, x in terms]
+    if not np.issubdtype(out.dtype, np.inexact):
+        # No in-place scaling possible, evaluate directly
+        out.data[:] = sum(c * arr for c, arr in zip(coeffs, arrays))
+        return
+
+    map_blocks(partial(_lincomb_n_blocks, coeffs, arrays, out.data),
+                native(out.size), LINCOMB_BLOCK_SIZE,
+                LINCOMB_THREADING_THRESHOLD, grouped=True)
+
+
 class NumpyFn(FnBase, NumpyNtuples):
 
     """Vector space F^n with vector multiplication.
@@ -789,6 +858,14 @@ class NumpyFn(FnBase, NumpyNtuples):
         """``True`` if the weighting is not `NumpyFnNoWeighting`."""
         return not isinstance(self.weighting, NumpyFnNoWeighting)
 
+    def _part_space(self):
+        """Space of the real and imaginary parts of elements.
+
+        Used in `NumpyFnVector.real` and `NumpyFnVector.imag`. Can be
+        overridden by subclasses.
+        """
+        return NumpyFn(self.size, self.real_dtype)
+
     def _lincomb(self, a, x1, b, x2, out):
         """Linear combination of ``x1`` and ``x2``.
 
@@ -821,6 +898,40 @@ class NumpyFn(FnBase, NumpyNtuples):
         """
         _lincomb_impl(a, x1, b, x2, out, self.dtype)
 
+    def _lincomb_n(self, coeffs, vectors, out):
+        """Linear combination of an arbitrary number of vectors.
+
+        Calculate ``out = sum(c * x for c, x in zip(coeffs, vectors))``
+        in a single pass over memory. The data is processed in blocks
+        small enough to stay in the CPU cache, and large arrays are
+        split among several threads.
+
+        Parameters
+        ----------
+        coeffs : sequence of `FnBase.field` elements
+            Scalars to multiply ``vectors`` with
+        vectors : sequence of `NumpyFnVector`
+            Summands in the linear combination
+        out : `NumpyFnVector`
+            Vector to which the result is written
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> r3 = NumpyFn(3)
+        >>> x = r3.element([1, 2, 3])
+        >>> y = r3.element([4, 5, 6])
+        >>> z = r3.element([1, 0, -1])
+        >>> r3.lincomb_n([1, -1, 2], [x, y, z], out=x)
+        rn(3).element([-1.0, -3.0, -5.0])
+        >>> x
+        rn(3).element([-1.0, -3.0, -5.0])
+        """
+        _lincomb_n_impl(coeffs, vectors, out)
+
     def _dist(self, x1, x2):
         """Calculate the distance between two vectors.
 
@@ -1062,6 +1173,8 @@ class NumpyFn(FnBase, NumpyNtuples):
         weight_str = self.weighting.repr_part
         if weight_str:
             inner_str += ', ' + weight_str
+        if self.impl != 'numpy':
+            inner_str += ", impl='{}'".format(self.impl)
         return '{}({})'.format(constructor_name, inner_str)
 
     # Copy these to handle bug in ABCmeta
@@ -1152,7 +1265,7 @@ class NumpyFnVector(FnBaseVector, NumpyNtuplesVector):
         >>> x
         cn(3).element([(10+1j), (6+0j), (4-2j)])
         """
-        real_space = NumpyFn(self.space.size, self.space.real_dtype)
+        real_space = self.space._part_space()
         return real_space.element(self.data.real)
 
     @real.setter
@@ -1209,7 +1322,7 @@ class NumpyFnVector(FnBaseVector, NumpyNtuplesVector):
         >>> x
         cn(3).element([(5+2j), (3+0j), (2-4j)])
         """
-        real_space = NumpyFn(self.space.size, self.space.real_dtype)
+        real_space = self.space._part_space()
         return real_space.element(self.data.imag)
 
     @imag.setter
@@ -1413,46 +1526,136 @@ def npy_weighted_dist(weights, exponent=2.0, use_inner=False):
                       dist_using_inner=use_inner).dist
 
 
-def _norm_default(x):
-    """Default Euclidean norm implementation."""
-    if _blas_is_applicable(x):
-        nrm2 = linalg.blas.get_blas_funcs('nrm2', dtype=x.dtype)
-        norm = partial(nrm2, n=native(x.size))
+def _acc_dtype(dtype):
+    """Return the data type used to accumulate reductions of ``dtype``.
+
+    Single precision and integer data is accumulated in double
+    precision, which makes block-wise reductions of large ``float32``
+    arrays accurate to roughly ``float32`` precision.
+    """
+    return np.result_type(dtype, np.float64)
+
+
+def _stable_sum(partials):
+    """Return the pairwise sum of the block-wise partial results.
+
+    Non-finite partials propagate to the result as ``inf`` or ``nan``.
+    """
+    if not partials:
+        return 0.0
     else:
-        norm = np.linalg.norm
-    return norm(x.data)
+        return np.sum(np.array(partials)).item()
 
 
-def _pnorm_default(x, p):
-    """Default p-norm implementation."""
-    return np.linalg.norm(x.data, ord=p)
+def _scaled_ssq_sum(partials):
+    """Return the 2-norm from block-wise ``(scale, ssq)`` pairs.
 
+    Each pair represents the value ``scale ** 2 * ssq``. The pairs are
+    rescaled to the largest ``scale`` before summation, such that the
+    result does not overflow unless the norm itself does.
+    """
+    if not partials:
+        return 0.0
+    scales, ssqs = (np.array(v, dtype=float) for v in zip(*partials))
+    scale = np.max(scales)
+    if scale == 0 or not np.isfinite(scale):
+        return float(scale)
+    return float(scale * np.sqrt(np.sum(ssqs * (scales / scale) ** 2)))
+
+
+def _weights_array(w):
+    """Return the raw array of weights ``w``, or ``None``."""
+    if isinstance(w, NumpyNtuplesVector):
+        return w.data
+    else:
+        return w
+
+
+def _inner_block(arr1, arr2, w, acc_dtype, blk):
+    """Inner product of the block ``blk`` of ``arr1`` and ``arr2``."""
+    a = arr1[blk].astype(acc_dtype, copy=False)
+    b = arr2[blk].astype(acc_dtype, copy=False)
+    if w is not None:
+        a = a * w[blk]
+    if np.issubdtype(acc_dtype, np.complexfloating):
+        # b as first argument because we want linearity in a
+        return np.vdot(b, a)
+    else:
+        return np.dot(a, b)
+
+
+def _pnorm_block(arr1, arr2, p, w, acc_dtype, blk):
+    """Weighted sum of ``|arr1 - arr2|^p`` on the block ``blk``.
+
+    For ``p = inf``, the weighted maximum is returned instead. For
+    ``p = 2``, a pair ``(scale, ssq)`` with ``scale = max(|a|)`` and
+    ``ssq = sum(w * (|a| / scale) ** 2)`` is returned to avoid overflow
+    in the squares, see `_scaled_ssq_sum`.
+    """
+    a = arr1[blk].astype(acc_dtype, copy=False)
+    if arr2 is not None:
+        a = a - arr2[blk]
+    a = np.abs(a)
+    if p == float('inf'):
+        if w is not None:
+            a *= w[blk]
+        return np.max(a) if a.size else 0.0
+    elif p == 2.0:
+        scale = np.max(a) if a.size else 0.0
+        if scale == 0 or not np.isfinite(scale):
+            return scale, 0.0
+        a /= scale
+        if w is None:
+            return scale, np.dot(a, a)
+        else:
+            np.multiply(a, a, out=a)
+            return scale, np.dot(a, w[blk])
+    elif p != 1.0:
+        np.power(a, p, out=a)
 
-def _pnorm_diagweight(x, p, w):
-    """Diagonally weighted p-norm implementation."""
-    # This is faster than first applying the weights and then summing with
-    # BLAS dot or nrm2
-    xp = np.abs(x.data)
-    if np.isfinite(p):
-        xp = np.power(xp, p, out=xp)
-        xp *= w  # w is a plain NumPy array
-        return np.sum(xp) ** (1 / p)
+    if w is None:
+        return np.sum(a)  # pairwise summation
     else:
-        xp *= w
-        return np.max(xp)
+        return np.dot(a, w[blk])
 
 
-def _inner_default(x1, x2):
-    """Default Euclidean inner product implementation."""
-    if _blas_is_applicable(x1, x2):
-        dotc = linalg.blas.get_blas_funcs('dotc', dtype=x1.dtype)
-        dot = partial(dotc, n=native(x1.size))
-    elif is_real_dtype(x1.dtype):
-        dot = np.dot  # still much faster than vdot
+def _inner_default(x1, x2, w=None):
+    """Default (weighted) Euclidean inner product implementation.
+
+    The inner product is computed block-wise without full-size
+    temporaries, using several threads for large vectors.
+    """
+    acc_dtype = _acc_dtype(x1.dtype)
+    func = partial(_inner_block, x1.data, x2.data, _weights_array(w),
+                   acc_dtype)
+    partials = map_blocks(func, native(x1.size), REDUCTION_BLOCK_SIZE,
+                           REDUCTION_THREADING_THRESHOLD)
+    return _stable_sum(partials)
+
+
+def _pnorm_default(x1, p, x2=None, w=None):
+    """Default (weighted) p-norm of ``x1`` or of ``x1 - x2``.
+
+    The norm is computed block-wise without full-size temporaries,
+    using several threads for large vectors.
+    """
+    acc_dtype = _acc_dtype(x1.dtype)
+    arr2 = None if x2 is None else x2.data
+    func = partial(_pnorm_block, x1.data, arr2, float(p), _weights_array(w),
+                   acc_dtype)
+    partials = map_blocks(func, native(x1.size), REDUCTION_BLOCK_SIZE,
+                           REDUCTION_THREADING_THRESHOLD)
+    if p == float('inf'):
+        return float(np.max(partials)) if partials else 0.0
+    elif p == 2.0:
+        return _scaled_ssq_sum(partials)
     else:
-        dot = np.vdot  # slowest alternative
-    # x2 as first argument because we want linearity in x1
-    return dot(x2.data, x1.data)
+        return _stable_sum(partials) ** (1 / p)
+
+
+def _norm_default(x):
+    """Default Euclidean norm implementation."""
+    return _pnorm_default(x, 2.0)
 
 
 class NumpyFnMatrixWeighting(MatrixWeighting):
@@ -1711,7 +1914,7 @@ class NumpyFnArrayWeighting(ArrayWeighting):
                                       'exponent != 2 (got {})'
                                       ''.format(self.exponent))
         else:
-            inner = _inner_default(x1 * self.array, x2)
+            inner = _inner_default(x1, x2, w=self.array)
             if is_real_dtype(x1.dtype):
                 return float(inner)
             else:
@@ -1730,13 +1933,105 @@ class NumpyFnArrayWeighting(ArrayWeighting):
         norm : float
             The norm of the provided vector
         """
-        if self.exponent == 2.0:
-            norm_squared = self.inner(x, x).real  # TODO: optimize?!
-            if norm_squared < 0:
-                norm_squared = 0.0  # Compensate for numerical error
-            return np.sqrt(norm_squared)
+        return float(_pnorm_default(x, self.exponent, w=self.array))
+
+    def dist(self, x1, x2):
+        """Calculate the array-weighted distance between two vectors.
+
+        Parameters
+        ----------
+        x1, x2 : `NumpyFnVector`
+            Vectors whose mutual distance is calculated
+
+        Returns
+        -------
+        dist : float
+            The distance between the vectors
+        """
+        if self.dist_using_inner:
+            return super().dist(x1, x2)
+        else:
+            return float(_pnorm_default(x1, self.exponent, x2=x2,
+                                        w=self.array))
+
+
+class NumpyFnHermitianWeighting(NumpyFnArrayWeighting):
+
+    """Weighting of a space of Hermitian-symmetric half spectra.
+
+    The vectors of such a space store only one half of the values of a
+    Hermitian-symmetric array ``y``, i.e., one satisfying
+    ``y[-k] = conj(y[k])``. The weighting array accounts for the
+    missing half by doubling the weights of the stored entries that
+    have a counterpart in the other half.
+
+    See ``Notes`` for mathematical details.
+    """
+
+    def __init__(self, array, exponent=2.0, dist_using_inner=False):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        array : `array-like`, one-dim.
+            Weighting array of the inner product, norm and distance,
+            including the factor 2 for non-redundant entries.
+        exponent : positive float, optional
+            Exponent of the norm. For values other than 2.0, no inner
+            product is defined.
+        dist_using_inner : bool, optional
+            Calculate ``dist`` using the formula
+
+                ``||x - y||^2 = ||x||^2 + ||y||^2 - 2 * Re <x, y>``
+
+            This avoids the creation of new arrays and is thus faster
+            for large arrays. On the downside, it will not evaluate to
+            exactly zero for equal (but not identical) ``x`` and ``y``.
+
+            This option can only be used if ``exponent`` is 2.0.
+
+        Notes
+        -----
+        - For two Hermitian-symmetric arrays, the inner product of the
+          full arrays is real and equal to
+
+          .. math::
+              \\langle a, b\\rangle_w :=
+              \\mathrm{Re}\\, b^{\mathrm{H}} (w \odot a),
+
+          where the sum runs over the stored half only. Hence, the
+          vectors form a real Hilbert space, and the inner product is
+          returned as a real number.
+
+        - Norm and distance are the same as for `NumpyFnArrayWeighting`.
+          An exponent of :math:`\\infty` is not supported since the
+          doubling does not apply to the maximum norm.
+        """
+        if float(exponent) == float('inf'):
+            raise ValueError('exponent `inf` not supported for Hermitian '
+                             'weighting')
+        super().__init__(array, exponent=exponent,
+                         dist_using_inner=dist_using_inner)
+
+    def inner(self, x1, x2):
+        """Return the weighted inner product of two vectors.
+
+        Parameters
+        ----------
+        x1, x2 : `NumpyFnVector`
+            Vectors whose inner product is calculated
+
+        Returns
+        -------
+        inner : float
+            The real part of the weighted inner product.
+        """
+        if self.exponent != 2.0:
+            raise NotImplementedError('no inner product defined for '
+                                      'exponent != 2 (got {})'
+                                      ''.format(self.exponent))
         else:
-            return float(_pnorm_diagweight(x, self.exponent, self.array))
+            return float(np.real(_inner_default(x1, x2, w=self.array)))
 
 
 class NumpyFnConstWeighting(ConstWeighting):
@@ -1870,12 +2165,13 @@ class NumpyFnConstWeighting(ConstWeighting):
                 dist_squared = 0.0
             return np.sqrt(self.const) * float(np.sqrt(dist_squared))
         elif self.exponent == 2.0:
-            return np.sqrt(self.const) * _norm_default(x1 - x2)
+            return np.sqrt(self.const) * _pnorm_default(x1, 2.0, x2=x2)
         elif self.exponent == float('inf'):
-            return self.const * float(_pnorm_default(x1 - x2, self.exponent))
+            return self.const * float(_pnorm_default(x1, self.exponent,
+                                                     x2=x2))
         else:
             return (self.const ** (1 / self.exponent) *
-                    float(_pnorm_default(x1 - x2, self.exponent)))
+                    float(_pnorm_default(x1, self.exponent, x2=x2)))
 
 
 class NumpyFnNoWeighting(NoWeighting, NumpyFnConstWeighting):
@@ -14,7 +14,9 @@ import pytest
 
 import odl
 from odl.deform import LinDeformFixedTempl, LinDeformFixedDisp
-from odl.util.testutils import almost_equal, simple_fixture
+from odl.deform.linearized import _linear_deform
+from odl.discr import grid as grid_module
+from odl.util.testutils import almost_equal, all_almost_equal, simple_fixture
 
 
 # --- pytest fixtures --- #
@@ -151,6 +153,33 @@ def inv_deformed_template(x):
     return template_function(disp_x)
 
 
+# --- Deformation function --- #
+
+
+def test_linear_deform_blocks(monkeypatch):
+    """Check that block-wise deformation agrees with the full evaluation."""
+    space = odl.uniform_discr([-1, -1], [1, 1], [20, 15], interp='linear')
+    template = space.element(template_function)
+    disp = space.tangent_bundle.element(disp_field_factory(2))
+    expected = _linear_deform(template, disp)
+
+    monkeypatch.setattr(grid_module, 'POINTS_BLOCK_SIZE', 7)
+    assert all_almost_equal(_linear_deform(template, disp), expected)
+
+    out = np.empty(space.size)
+    assert _linear_deform(template, disp, out=out) is out
+    assert all_almost_equal(out, expected)
+
+    # Fortran ordering of the data
+    space_f = odl.uniform_discr([-1, -1], [1, 1], [20, 15], interp='linear',
+                                order='F')
+    template_f = space_f.element(template_function)
+    disp_f = space_f.tangent_bundle.element(disp_field_factory(2))
+    result_f = _linear_deform(template_f, disp_f)
+    assert all_almost_equal(result_f.reshape(space.shape, order='F'),
+                            expected.reshape(space.shape))
+
+
 # --- LinDeformFixedTempl --- #
 
 
@@ -9,6 +9,7 @@
 """Unit tests for `discr_mappings`."""
 
 from __future__ import division
+from itertools import product
 import pytest
 import numpy as np
 
@@ -18,7 +19,7 @@ from odl.discr.discr_mappings import (
     PointCollocation, NearestInterpolation, LinearInterpolation,
     PerAxisInterpolation)
 from odl.util.testutils import (
-    all_almost_equal, all_equal, almost_equal)
+    all_almost_equal, all_equal, almost_equal, noise_element)
 
 
 def test_nearest_interpolation_1d_complex(fn_impl):
@@ -297,6 +298,137 @@ def test_per_axis_interpolation():
     assert all_equal(out, true_mg)
 
 
+def test_interpolation_evaluation_op(monkeypatch):
+    """Test evaluation operators against direct interpolation."""
+    # Tiny blocks and threading threshold to use several blocks and threads
+    discr_mappings = odl.discr.discr_mappings
+    monkeypatch.setattr(discr_mappings, 'INTERP_BLOCK_SIZE', 3)
+    monkeypatch.setattr(discr_mappings, 'INTERP_THREADING_THRESHOLD', 5)
+
+    rect = odl.IntervalProd([0, 0], [1, 1])
+    part = odl.uniform_partition_fromintv(rect, [4, 3], nodes_on_bdry=False)
+    space = odl.FunctionSpace(rect)
+
+    # Includes points close to the boundary, outside the grid
+    pts = np.array([[0.3, 0.6],
+                    [0.1, 0.25],
+                    [0.95, 1.0],
+                    [0.5, 0.5],
+                    [0.3, 0.6],
+                    [0.02, 0.9]])
+    mg = sparse_meshgrid([0.05, 0.3, 1.0], [0.4, 0.85])
+
+    # Unweighted and weighted data space
+    for dspace in (odl.rn(part.size), odl.rn(part.size, weighting=0.5)):
+        for order in ('C', 'F'):
+            interp_ops = [
+                NearestInterpolation(space, part, dspace, variant='left',
+                                     order=order),
+                NearestInterpolation(space, part, dspace, variant='right',
+                                     order=order),
+                LinearInterpolation(space, part, dspace, order=order),
+                PerAxisInterpolation(space, part, dspace, order=order,
+                                     schemes=['linear', 'nearest'],
+                                     nn_variants=[None, 'right'])]
+
+            values = dspace.element(np.arange(1, 13, dtype='float64'))
+            for interp_op, impl in product(interp_ops,
+                                           ['sparse', 'matrix_free']):
+                function = interp_op(values)
+
+                eval_op = interp_op.evaluation_op(pts.T, impl=impl)
+                assert all_almost_equal(eval_op(values), function(pts.T))
+
+                eval_op = interp_op.evaluation_op(mg, impl=impl)
+                assert all_almost_equal(eval_op(values),
+                                        function(mg).ravel())
+
+                # Adjoint is exact
+                y = noise_element(eval_op.range)
+                assert almost_equal(eval_op(values).inner(y),
+                                    values.inner(eval_op.adjoint(y)))
+
+    with pytest.raises(ValueError):
+        interp_op.evaluation_op(pts.T, impl='dense')
+
+
+def test_interpolation_evaluation_op_weighted():
+    """Test the adjoint of evaluation operators on weighted spaces."""
+    pts = np.array([[0.3, 0.6],
+                    [0.1, 0.25],
+                    [0.95, 1.0]])
+    for interp in ('nearest', 'linear'):
+        # Weighted with the cell volume
+        space = odl.uniform_discr([0, 0], [1, 1], (4, 3), interp=interp)
+        eval_op = space.interpolation.evaluation_op(pts.T)
+        assert eval_op.domain == space.dspace
+
+        x = noise_element(eval_op.domain)
+        y = noise_element(eval_op.range)
+        assert almost_equal(eval_op(x).inner(y), x.inner(eval_op.adjoint(y)))
+        assert eval_op.adjoint.adjoint is eval_op
+
+
+def test_linear_interpolation_blocks(monkeypatch):
+    """Test block-wise linear interpolation against SciPy."""
+    from scipy.interpolate import RegularGridInterpolator
+
+    # Tiny blocks and threading threshold to use several blocks and threads
+    discr_mappings = odl.discr.discr_mappings
+    monkeypatch.setattr(discr_mappings, 'INTERP_BLOCK_SIZE', 7)
+    monkeypatch.setattr(discr_mappings, 'INTERP_THREADING_THRESHOLD', 20)
+
+    rect = odl.IntervalProd([0, 0, 0], [1, 2, 1])
+    # Non-uniform last axis to use binary search there
+    grid = odl.RectGrid([0.1, 0.3, 0.5, 0.7, 0.9],
+                        [0.25, 0.75, 1.25, 1.75],
+                        [0.0, 0.1, 0.5, 1.0])
+    part = odl.RectPartition(rect, grid)
+    space = odl.FunctionSpace(rect)
+    dspace = odl.rn(part.size)
+
+    values = np.random.rand(part.size)
+    scipy_interp = RegularGridInterpolator(
+        grid.coord_vectors, values.reshape(grid.shape))
+
+    pts = np.random.uniform(low=grid.min_pt, high=grid.max_pt,
+                            size=(100, 3))
+    mg = sparse_meshgrid(*[np.random.uniform(low=lo, high=hi, size=n)
+                           for lo, hi, n in zip(grid.min_pt, grid.max_pt,
+                                                (9, 5, 3))])
+    mg_pts = np.array(np.broadcast_arrays(*mg)).reshape(3, -1).T
+
+    for order in ('C', 'F'):
+        interp_op = LinearInterpolation(space, part, dspace, order=order)
+        function = interp_op(values.reshape(grid.shape).ravel(order=order))
+
+        assert all_almost_equal(function(pts.T), scipy_interp(pts))
+        out = np.empty(100)
+        function(pts.T, out=out)
+        assert all_almost_equal(out, scipy_interp(pts))
+
+        assert all_almost_equal(function(mg).ravel(), scipy_interp(mg_pts))
+
+
+def test_linear_interpolation_small_scale():
+    """Test that small non-uniform grids are not taken as uniform."""
+    from scipy.interpolate import RegularGridInterpolator
+
+    rect = odl.IntervalProd(0, 1e-9)
+    grid = odl.RectGrid(np.array([1, 2, 3, 4, 5, 6, 90]) * 1e-11)
+    part = odl.RectPartition(rect, grid)
+    space = odl.FunctionSpace(rect)
+    dspace = odl.rn(part.size)
+
+    values = np.random.rand(part.size)
+    scipy_interp = RegularGridInterpolator(grid.coord_vectors, values)
+    pts = np.linspace(grid.min_pt[0], grid.max_pt[0], 17)
+
+    interp_op = LinearInterpolation(space, part, dspace)
+    function = interp_op(values)
+    assert all_almost_equal(function(pts), scipy_interp(pts[:, None]))
+
+
 def test_collocation_interpolation_identity():
     # Check if interpolation followed by collocation on the same grid
     # is the identity
@@ -331,5 +463,38 @@ def test_collocation_interpolation_identity():
         assert all_almost_equal(ident_values, values)
 
 
+def test_collocation_blocks():
+    """Check slab-wise collocation against evaluation on the full grid."""
+    rect = odl.IntervalProd([0, 0, 0], [1, 2, 3])
+    part = odl.uniform_partition_fromintv(rect, [4, 3, 5])
+    space = odl.FunctionSpace(rect)
+    dspace = odl.rn(part.size)
+
+    def func(x):
+        return x[0] ** 2 + x[1] * x[2]
+
+    for order in ['C', 'F']:
+        coll_op = PointCollocation(space, part, dspace, order=order)
+        expected = func(part.meshgrid).ravel(order=order)
+        assert all_almost_equal(coll_op(func, block_size=8), expected)
+
+        out = dspace.element()
+        coll_op(func, out=out, block_size=8)
+        assert all_almost_equal(out, expected)
+
+        # Via sampling in a discretized space
+        discr = odl.uniform_discr_frompartition(part, order=order)
+        assert all_almost_equal(discr.element(func, block_size=8), expected)
+
+    # Functions that do not act point-wise are evaluated on the full grid
+    # by default
+    def centered(x):
+        return x[0] - np.mean(x[0])
+
+    coll_op = PointCollocation(space, part, dspace)
+    expected = np.broadcast_to(centered(part.meshgrid), part.shape).ravel()
+    assert all_almost_equal(coll_op(centered), expected)
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -13,9 +13,11 @@ import pytest
 import numpy as np
 
 import odl
+from odl.discr import discr_ops
 from odl.discr.discr_ops import _SUPPORTED_RESIZE_PAD_MODES
 from odl.util import is_scalar_dtype, is_real_floating_dtype
-from odl.util.testutils import almost_equal, noise_element, dtype_places
+from odl.util.testutils import (
+    almost_equal, all_almost_equal, noise_element, dtype_places)
 
 
 # --- pytest fixtures --- #
@@ -273,5 +275,73 @@ def test_resizing_op_mixed_uni_nonuni():
     assert almost_equal(inner1, inner2)
 
 
+def test_resampling_fourier(monkeypatch):
+    """Check Fourier resampling against trigonometric interpolation."""
+    # Small blocks and threading threshold to exercise the block code
+    monkeypatch.setattr(discr_ops, 'RESAMPLING_BLOCK_SIZE', 8)
+    monkeypatch.setattr(discr_ops, 'RESAMPLING_THREADING_THRESHOLD', 16)
+
+    def func(x):
+        return np.sin(x[0]) * np.cos(2 * x[1]) + np.cos(x[1])
+
+    space = odl.uniform_discr([0, 0], [2 * np.pi, 2 * np.pi], (7, 8))
+    for shape in [(9, 16), (12, 5)]:
+        res_space = odl.uniform_discr_fromdiscr(space, shape=shape)
+        resampling = odl.Resampling(space, res_space, mode='fourier')
+        assert all_almost_equal(resampling(space.element(func)),
+                                res_space.element(func))
+
+        # Upsampling followed by downsampling is the identity
+        if all(n >= m for n, m in zip(shape, space.shape)):
+            x = noise_element(space)
+            assert all_almost_equal(resampling.inverse(resampling(x)), x)
+
+    # Different periods are not supported
+    res_space = odl.uniform_discr([0, 0], [np.pi, 2 * np.pi], (7, 8))
+    with pytest.raises(ValueError):
+        odl.Resampling(space, res_space, mode='fourier')
+
+
+def test_resampling_polyphase():
+    """Check that polyphase resampling preserves constants."""
+    space = odl.uniform_discr([0, -1], [1, 1], (20, 15))
+    res_space = odl.uniform_discr([0.1, -1], [0.9, 1], (7, 40))
+    resampling = odl.Resampling(space, res_space, mode='polyphase')
+    assert all_almost_equal(resampling(space.one()), res_space.one())
+
+    nonuni_part = odl.nonuniform_partition([0, 1, 4])
+    nonuni_space = odl.DiscreteLp(odl.FunctionSpace(nonuni_part.set),
+                                  nonuni_part, odl.rn(3))
+    with pytest.raises(ValueError):
+        odl.Resampling(nonuni_space, nonuni_space, mode='polyphase')
+
+    # Number of dimensions and data types must match
+    with pytest.raises(ValueError):
+        odl.Resampling(space, odl.uniform_discr(0, 1, 7), mode='polyphase')
+    with pytest.raises(ValueError):
+        odl.Resampling(space, res_space.astype('float32'), mode='polyphase')
+
+
+def test_resampling_adjoint(monkeypatch):
+    """Check the exact adjoint of Fourier and polyphase resampling."""
+    monkeypatch.setattr(discr_ops, 'RESAMPLING_BLOCK_SIZE', 8)
+    monkeypatch.setattr(discr_ops, 'RESAMPLING_THREADING_THRESHOLD', 16)
+
+    for dtype in ['float64', 'complex128']:
+        space = odl.uniform_discr([0, -1], [1, 1], (6, 5), dtype=dtype)
+        res_spaces = {
+            'fourier': odl.uniform_discr([0, -1], [1, 1], (9, 4),
+                                         dtype=dtype),
+            'polyphase': odl.uniform_discr([-0.2, -1], [1, 1.5], (11, 3),
+                                           dtype=dtype)}
+        for mode, res_space in res_spaces.items():
+            resampling = odl.Resampling(space, res_space, mode=mode)
+            x = noise_element(space)
+            y = noise_element(res_space)
+            assert almost_equal(resampling(x).inner(y),
+                                x.inner(resampling.adjoint(y)))
+            assert resampling.adjoint.adjoint is resampling
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
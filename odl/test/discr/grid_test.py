@@ -11,6 +11,7 @@ import pytest
 import numpy as np
 
 import odl
+from odl.discr import grid as grid_module
 from odl.discr.grid import RectGrid, uniform_grid, sparse_meshgrid
 from odl.util.testutils import all_equal
 
@@ -345,6 +346,46 @@ def test_RectGrid_points():
         grid.points(order='A')
 
 
+def test_RectGrid_points_blocks(monkeypatch):
+    """Check lazy point views and block-wise iteration."""
+    grid = RectGrid([2, 3, 4, 5], [-4, -2, 0, 2, 4], [0, 0.5, 2])
+
+    for order in ['C', 'F']:
+        points = grid.points(order=order)
+        for indices in [slice(None), slice(3, 40, 7), slice(None, None, -1),
+                        [0, 5, -1], np.array([[1, 2], [3, 59]])]:
+            assert all_equal(grid.points(order=order, indices=indices),
+                             points[indices].reshape(-1, grid.ndim))
+
+        for block_size in [1, 7, 60, 100]:
+            blocks = list(grid.iter_points(block_size, order=order))
+            assert len(blocks) == -(-grid.size // block_size)
+            for slc, pts in blocks:
+                assert len(pts) <= block_size
+                assert all_equal(pts, points[slc])
+
+        # Slabs cover the grid in flat index order
+        for block_size in [1, 16, 20, 100]:
+            start = 0
+            for slc, mesh in grid.iter_meshgrid(block_size, order=order):
+                assert slc.start == start
+                start = slc.stop
+                slab_pts = np.array([np.ravel(xi, order=order) for xi in
+                                     np.broadcast_arrays(*mesh)]).T
+                assert all_equal(slab_pts, points[slc])
+            assert start == grid.size
+
+    # Default block size
+    monkeypatch.setattr(grid_module, 'POINTS_BLOCK_SIZE', 8)
+    assert len(list(grid.iter_points())) == 8
+    assert len(list(grid.iter_meshgrid())) == 4
+
+    with pytest.raises(ValueError):
+        list(grid.iter_points(0))
+    with pytest.raises(ValueError):
+        list(grid.iter_meshgrid(order='A'))
+
+
 def test_RectGrid_corners():
     vec1 = np.array([2, 3, 4, 5])
     vec2 = np.array([-4, -2, 0, 2, 4])
@@ -475,6 +475,43 @@ def test_operator_pointwise_product():
     check_call(adjoint, z, expected)
 
 
+def test_operator_sum_fusion():
+    """Test flattening of nested sums and scalings in OperatorSum."""
+    class CountingOp(odl.Operator):
+        def __init__(self, matrix):
+            super().__init__(odl.rn(matrix.shape[1]), odl.rn(matrix.shape[0]),
+                             linear=True)
+            self.matrix = matrix
+            self.num_calls = 0
+
+        def _call(self, x, out):
+            self.num_calls += 1
+            out[:] = np.dot(self.matrix, x.data)
+
+    A = CountingOp(np.random.rand(4, 3))
+    B = MultiplyAndSquareOp(np.random.rand(4, 3))
+    x = noise_element(A.domain)
+    Ax = A(x)
+
+    # Each operator is applied only once
+    expr = 2 * (3 * A) + A
+    assert expr.terms == ((7, A),)
+    A.num_calls = 0
+    check_call(expr, x, 7 * Ax)
+    assert A.num_calls == 2
+
+    expr = A * 2 + (B - 3 * A) + B
+    assert len(expr.terms) == 2
+    A.num_calls = 0
+    check_call(expr, x, -Ax + 2 * B(x))
+    assert A.num_calls == 2
+
+    # Scalars are only pulled out of the right side of linear operators
+    expr = 2 * (B * 2.0) + B * 2.0
+    assert len(expr.terms) == 2
+    check_call(expr, x, 3 * B(2 * x))
+
+
 # FUNCTIONAL TEST
 class SumFunctional(Operator):
 
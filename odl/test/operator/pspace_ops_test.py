@@ -109,6 +109,57 @@ def test_pspace_op_swap_call():
     assert result == op(z, out=op.range.element())
 
 
+def test_pspace_op_threads():
+    r3 = odl.rn(3)
+    I = odl.IdentityOperator(r3)
+    S = odl.ScalingOperator(r3, 2.0)
+    x = r3.element([1, 2, 3])
+    y = r3.element([7, 8, 9])
+
+    op = odl.ProductSpaceOperator([[I, S, 0],
+                                   [0, 0, 0],
+                                   [S, I, S]],
+                                  domain=odl.ProductSpace(r3, 3),
+                                  range=odl.ProductSpace(r3, 3), threads=3)
+    assert op.threads == 3
+    z = op.domain.element([x, y, x])
+    result = op.range.element([x + 2 * y, r3.zero(), 4 * x + y])
+    assert result == op(z)
+    out = op.range.element([y.copy(), y.copy(), y.copy()])
+    assert result == op(z, out=out)
+    assert op.adjoint.threads == 3
+    assert op.adjoint(z) == op.adjoint.range.element(
+        [x + 2 * x, 2 * x + x, 2 * x])
+
+    bcast = odl.BroadcastOperator(I, S, threads=2)
+    assert bcast.threads == 2
+    assert bcast(x) == bcast.range.element([x, 2 * x])
+    assert bcast.adjoint.threads == 2
+    assert bcast.adjoint([x, y]) == x + 2 * y
+    assert repr(bcast) == ('BroadcastOperator(IdentityOperator(rn(3)), '
+                           'ScalingOperator(rn(3), 2.0), threads=2)')
+
+    diag = odl.DiagonalOperator(I, S, threads=2)
+    assert diag([x, y]) == diag.range.element([x, 2 * y])
+    assert diag.adjoint.threads == 2
+    assert diag.derivative([x, y]).threads == 2
+
+    # The same operator object with internal scratch data is evaluated
+    # serially, nested threaded evaluation as well
+    comp = odl.OperatorComp(S, S + I, tmp=r3.element())
+    bcast = odl.BroadcastOperator(comp, 4, threads=4)
+    assert bcast(x) == bcast.range.element([6 * x] * 4)
+    inner = (odl.ReductionOperator(I, S, threads=2) *
+             odl.BroadcastOperator(I, I, threads=2))
+    nested = odl.BroadcastOperator(inner, S, threads=2)
+    assert nested(x) == nested.range.element([3 * x, 2 * x])
+
+    with pytest.raises(ValueError):
+        odl.ProductSpaceOperator([I], threads=0)
+    with pytest.raises(TypeError):
+        odl.BroadcastOperator(I, S, thread=2)
+
+
 def test_comp_proj():
     r3 = odl.rn(3)
     r3xr3 = odl.ProductSpace(r3, 2)
@@ -317,6 +317,49 @@ def test_fspace_vector_eval_complex():
     assert all_equal(out_mg, true_mg)
 
 
+def test_fspace_vector_eval_blocks():
+    """Check block-wise evaluation of large vectorized input."""
+    rect = odl.IntervalProd([0, 0], [1, 2])
+    points = _points(rect, num=11)
+    true_arr = func_2d_vec_oop(points)
+
+    fspace = FunctionSpace(rect)
+    for func in [func_2d_vec_oop, func_2d_vec_ip, func_2d_vec_dual]:
+        f_vec = fspace.element(func, vectorized=True)
+        assert all_almost_equal(f_vec(points, block_size=4), true_arr)
+        out_arr = np.empty((11,), dtype='float64')
+        f_vec(points, out=out_arr, block_size=4)
+        assert all_almost_equal(out_arr, true_arr)
+
+        # Meshgrids with rows of more than `block_size` points are split
+        # into single rows
+        for shape in [(5, 3), (3, 5)]:
+            mg = _meshgrid(rect, shape=shape)
+            true_mg = func_2d_vec_oop(mg)
+            assert all_almost_equal(f_vec(mg, block_size=4), true_mg)
+            out_mg = np.empty(shape, dtype='float64')
+            f_vec(mg, out=out_mg, block_size=4)
+            assert all_almost_equal(out_mg, true_mg)
+
+    # Functions that do not act point-wise are evaluated at all points
+    # at once by default
+    f_vec = fspace.element(lambda x: x[0] - np.mean(x[0]))
+    assert all_almost_equal(f_vec(points), points[0] - np.mean(points[0]))
+
+    # Points outside the domain are detected in any block
+    points[:, -1] = [0.5, 3]
+    with pytest.raises(ValueError):
+        fspace.element(func_2d_vec_oop)(points, block_size=4)
+
+    # 1d
+    fspace = FunctionSpace(odl.IntervalProd(0, 1))
+    x = np.linspace(0, 1, 11)
+    for func in [func_1d_oop, func_1d_ip, func_1d_dual]:
+        f_vec = fspace.element(func, vectorized=True)
+        assert all_almost_equal(f_vec(x, block_size=4), x ** 2)
+        assert all_almost_equal(f_vec((x,), block_size=4), x ** 2)
+
+
 def test_fspace_vector_ufunc():
     intv = odl.IntervalProd(0, 1)
     points = _points(intv, num=5)
@@ -0,0 +1,133 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.space.npy_memmap import _is_file_backed
+from odl.util.testutils import (all_almost_equal, almost_equal,
+                                noise_elements, simple_fixture)
+
+
+# --- pytest fixtures --- #
+
+
+dtype = simple_fixture('dtype', ['float32', 'float64', 'complex128'])
+
+
+# --- Tests --- #
+
+
+def test_element_storage(dtype):
+    space = odl.fn(10, dtype=dtype, impl='numpy_memmap')
+
+    assert _is_file_backed(space.element().data)
+    assert _is_file_backed(space.zero().data)
+    assert _is_file_backed(space.one().data)
+
+    # Arrays are copied into a file, file-backed arrays are wrapped
+    arr = np.arange(10).astype(dtype)
+    x = space.element(arr)
+    assert _is_file_backed(x.data)
+    assert all_almost_equal(x, arr)
+    y = space.element(x.data)
+    assert np.may_share_memory(y.data, x.data)
+
+    # Copies and slices stay on disk
+    assert _is_file_backed(x.copy().data)
+    assert _is_file_backed(x[2:5].data)
+
+    with pytest.raises(ValueError):
+        space.element(np.zeros(9))
+
+
+def test_real_imag(tmpdir):
+    space = odl.cn(10, impl='numpy_memmap', scratch_dir=str(tmpdir))
+    x = space.element(np.arange(10) + 1j * np.arange(10, 20))
+
+    for part in (x.real, x.imag):
+        # Views of the backing file, with further elements on disk
+        assert part.space == odl.rn(10, impl='numpy_memmap')
+        assert part.space.scratch_dir == str(tmpdir)
+        assert np.may_share_memory(part.data, x.data)
+        assert _is_file_backed(part.copy().data)
+        assert _is_file_backed(part.space.astype('float32').one().data)
+
+    x.real *= 2
+    assert all_almost_equal(x, 2 * np.arange(10) + 1j * np.arange(10, 20))
+
+
+def test_scratch_dir(tmpdir):
+    space = odl.rn(10, impl='numpy_memmap', scratch_dir=str(tmpdir))
+    assert space.scratch_dir == str(tmpdir)
+    assert space.complex_space.scratch_dir == str(tmpdir)
+    assert _is_file_backed(space.one().data)
+
+
+def test_space_equality():
+    space = odl.rn(10, impl='numpy_memmap')
+    assert space == odl.rn(10, impl='numpy_memmap')
+    assert space != odl.rn(10)
+    assert odl.rn(10) != space
+    assert repr(space) == "rn(10, impl='numpy_memmap')"
+
+
+def test_lincomb(dtype, monkeypatch):
+    # Use tiny blocks and force threading to exercise all code paths
+    monkeypatch.setattr(odl.space.npy_memmap, 'LINCOMB_BLOCK_SIZE', 3)
+    monkeypatch.setattr(odl.space.npy_memmap,
+                        'LINCOMB_THREADING_THRESHOLD', 0)
+    space = odl.fn(10, dtype=dtype, impl='numpy_memmap')
+
+    [xarr, yarr, zarr], [x, y, z] = noise_elements(space, 3)
+    space.lincomb(2, x, -3, y, out=z)
+    assert all_almost_equal(z, 2 * xarr - 3 * yarr)
+    assert _is_file_backed(z.data)
+
+    # Aliased output
+    space.lincomb(2, x, -3, y, out=y)
+    assert all_almost_equal(y, 2 * xarr - 3 * yarr)
+
+    [xarr, yarr, zarr], [x, y, z] = noise_elements(space, 3)
+    space.lincomb_n([1, 0.5, -2], [x, y, z], out=x)
+    assert all_almost_equal(x, xarr + 0.5 * yarr - 2 * zarr)
+
+    space.lincomb(0, y, 0, z, out=z)
+    assert all_almost_equal(z, space.zero())
+
+
+def test_reductions_and_ufuncs(dtype):
+    space = odl.fn(10, dtype=dtype, impl='numpy_memmap')
+    [xarr, yarr], [x, y] = noise_elements(space, 2)
+
+    assert almost_equal(x.inner(y), np.vdot(yarr, xarr), places=5)
+    assert almost_equal(x.norm(), np.linalg.norm(xarr), places=5)
+    assert almost_equal(x.dist(y), np.linalg.norm(xarr - yarr), places=5)
+
+    result = x.ufuncs.exp()
+    assert _is_file_backed(result.data)
+    assert all_almost_equal(result, np.exp(xarr), places=5)
+
+
+def test_discretelp():
+    space = odl.uniform_discr([0, 0], [1, 1], (4, 5), impl='numpy_memmap')
+    assert space.impl == 'numpy_memmap'
+    arr = np.arange(20.0).reshape((4, 5))
+    x = space.element(arr)
+    assert _is_file_backed(x.ntuple.data)
+
+    grad = odl.Gradient(space)
+    assert grad(x)[0] in space
+    grad_npy = odl.Gradient(odl.uniform_discr([0, 0], [1, 1], (4, 5)))
+    assert all_almost_equal(grad(x), grad_npy(arr))
+
+
+if __name__ == '__main__':
+    pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -286,6 +286,58 @@ def test_lincomb_exceptions(fn):
         fn.lincomb(1, x, [], y, z)
 
 
+def test_lincomb_n(fn, monkeypatch):
+    # Use tiny blocks and force threading to exercise all code paths
+    monkeypatch.setattr(odl.space.npy_ntuples, 'LINCOMB_BLOCK_SIZE', 3)
+    monkeypatch.setattr(odl.space.npy_ntuples,
+                        'LINCOMB_THREADING_THRESHOLD', 0)
+    coeffs = [2, -1, 0, 3.41, 1]
+
+    # Unaliased arguments
+    arrs, elems = noise_elements(fn, 6)
+    expected = sum(c * arr for c, arr in zip(coeffs, arrs[:5]))
+    out = fn.lincomb_n(coeffs, elems[:5], out=elems[5])
+    assert out is elems[5]
+    assert all_almost_equal(out, expected)
+
+    # Output aliased with one of the summands
+    arrs, elems = noise_elements(fn, 5)
+    expected = sum(c * arr for c, arr in zip(coeffs, arrs))
+    elems[3].lincomb_n(coeffs, elems)
+    assert all_almost_equal(elems[3], expected)
+
+    # Repeated summands
+    [xarr, yarr], [x, y] = noise_elements(fn, 2)
+    expected = 3 * xarr + 3 * yarr
+    fn.lincomb_n([1, 2, 2, 1], [x, y, x, y], out=x)
+    assert all_almost_equal(x, expected)
+
+    # Few terms, delegated to the binary implementation
+    [xarr, yarr], [x, y] = noise_elements(fn, 2)
+    assert all_almost_equal(fn.lincomb_n([0, 2], [x, y]), 2 * yarr)
+    assert all_almost_equal(fn.lincomb_n([0, 0], [x, y]), fn.zero())
+
+
+def test_lincomb_n_exceptions(fn):
+    otherfn = odl.rn(1) if fn.size != 1 else odl.rn(2)
+    x, y = fn.zero(), fn.zero()
+
+    with pytest.raises(ValueError):
+        fn.lincomb_n([1, 2], [x])
+
+    with pytest.raises(ValueError):
+        fn.lincomb_n([], [])
+
+    with pytest.raises(LinearSpaceTypeError):
+        fn.lincomb_n([1, 1], [x, otherfn.zero()])
+
+    with pytest.raises(LinearSpaceTypeError):
+        fn.lincomb_n([1, []], [x, y])
+
+    with pytest.raises(LinearSpaceTypeError):
+        fn.lincomb_n([1, 1], [x, y], out=otherfn.zero())
+
+
 def test_multiply(fn):
     # space method
     [x_arr, y_arr, out_arr], [x, y, out] = noise_elements(fn, 3)
@@ -545,6 +597,75 @@ def test_pdist(exponent):
         assert almost_equal(x.dist(y), correct_dist)
 
 
+def test_blocked_reductions(fn, exponent, monkeypatch):
+    # Use tiny blocks and force threading to exercise all code paths
+    monkeypatch.setattr(odl.space.npy_ntuples, 'REDUCTION_BLOCK_SIZE', 3)
+    monkeypatch.setattr(odl.space.npy_ntuples,
+                        'REDUCTION_THREADING_THRESHOLD', 0)
+    weights = _pos_array(fn)
+    for w in (0.5, weights):
+        wfn = NumpyFn(fn.size, fn.dtype, exponent=exponent, weighting=w)
+        [xarr, yarr], [x, y] = noise_elements(wfn, n=2)
+
+        if exponent == float('inf'):
+            correct_norm = np.max(np.abs(xarr) * w)
+            correct_dist = np.max(np.abs(xarr - yarr) * w)
+        else:
+            correct_norm = np.sum(np.abs(xarr) ** exponent *
+                                  w) ** (1 / exponent)
+            correct_dist = np.sum(np.abs(xarr - yarr) ** exponent *
+                                  w) ** (1 / exponent)
+
+        assert almost_equal(wfn.norm(x), correct_norm, places=5)
+        assert almost_equal(wfn.dist(x, y), correct_dist, places=5)
+        if exponent == 2.0:
+            correct_inner = np.vdot(yarr, xarr * w)
+            assert almost_equal(wfn.inner(x, y), correct_inner, places=5)
+
+
+def test_reduction_accuracy_float32():
+    # Accumulation happens in double precision, hence the result is
+    # accurate to single precision even for many summands
+    fn = odl.rn(10 ** 6, dtype='float32')
+    x = fn.element(np.full(fn.size, 0.1, dtype='float32'))
+    correct_norm = np.sqrt(fn.size * np.float64(np.float32(0.1)) ** 2)
+    assert abs(fn.norm(x) - correct_norm) <= 1e-6 * correct_norm
+    assert abs(fn.inner(x, x) - correct_norm ** 2) <= 1e-6 * correct_norm ** 2
+
+
+def test_blocked_reductions_nonfinite(monkeypatch):
+    # Non-finite partial results in different blocks propagate as in
+    # an unblocked reduction instead of raising
+    monkeypatch.setattr(odl.space.npy_ntuples, 'REDUCTION_BLOCK_SIZE', 3)
+    fn = odl.rn(9)
+    one = fn.one()
+
+    x = fn.zero()
+    x[0], x[6] = float('inf'), -float('inf')
+    with np.errstate(invalid='ignore'):
+        assert np.isnan(x.inner(one))
+
+    x = fn.zero()
+    x[0], x[6] = 1e308, 1e308
+    with np.errstate(over='ignore'):
+        assert x.inner(one) == float('inf')
+
+
+def test_norm_no_overflow(monkeypatch):
+    # The 2-norm is computed with scaling, hence it does not overflow
+    # for large entries
+    monkeypatch.setattr(odl.space.npy_ntuples, 'REDUCTION_BLOCK_SIZE', 3)
+    for w in (1.0, 2.0, np.full(10, 2.0)):
+        fn = odl.rn(10, weighting=w)
+        x = fn.element(np.full(10, 1e300))
+        correct_norm = np.sqrt(10 * np.max(w)) * 1e300
+        assert almost_equal(x.norm() / correct_norm, 1)
+        assert almost_equal(x.dist(-x) / correct_norm, 2)
+
+    x = odl.cn(10).element(np.full(10, 1e300 + 1e300j))
+    assert almost_equal(x.norm() / (np.sqrt(20) * 1e300), 1)
+
+
 def test_setitem(fn):
     x = noise_element(fn)
 
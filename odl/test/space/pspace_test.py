@@ -161,6 +161,20 @@ def test_lincomb():
     assert all_almost_equal(z, expected)
 
 
+def test_lincomb_n():
+    H = odl.rn(2)
+    HxH = odl.ProductSpace(H, H)
+
+    v = HxH.element([[1, 2], [5, 3]])
+    u = HxH.element([[-1, 7], [2, 1]])
+    w = HxH.element([[0, 1], [1, 0]])
+
+    expected = [[4, 1], [15, 8]]
+    HxH.lincomb_n([3, -1, 2], [v, u, w], out=u)
+
+    assert all_almost_equal(u, expected)
+
+
 def test_multiply():
     H = odl.rn(2)
     HxH = odl.ProductSpace(H, H)
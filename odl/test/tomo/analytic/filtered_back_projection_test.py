@@ -0,0 +1,147 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Tests for filtered back-projection."""
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+import odl.tomo as tomo
+from odl.util.testutils import all_almost_equal, noise_element, simple_fixture
+
+
+# --- pytest fixtures --- #
+
+
+padding = simple_fixture('padding', [True, False])
+geometry_params = ['par2d', 'cone2d']
+geometry_ids = [' geometry = {} '.format(p) for p in geometry_params]
+
+
+@pytest.fixture(scope='module', ids=geometry_ids, params=geometry_params)
+def ray_trafo(request):
+    geom = request.param
+    space = odl.uniform_discr([-20, -20], [20, 20], [20, 20])
+
+    if geom == 'par2d':
+        apart = odl.uniform_partition(0, np.pi, 18)
+        dpart = odl.uniform_partition(-30, 30, 25)
+        geometry = tomo.Parallel2dGeometry(apart, dpart)
+    elif geom == 'cone2d':
+        apart = odl.uniform_partition(0, np.pi + 1.0, 18)
+        dpart = odl.uniform_partition(-30, 30, 25)
+        geometry = tomo.FanFlatGeometry(apart, dpart, src_radius=200,
+                                        det_radius=100)
+    else:
+        raise ValueError('geom not valid')
+
+    return tomo.RayTransform(space, geometry, impl='numpy')
+
+
+# --- FBP filter tests --- #
+
+
+def test_fbp_filter_chunked(ray_trafo, padding):
+    """Test that chunked filtering agrees with filtering all at once."""
+    data = noise_element(ray_trafo.range)
+    filter_op = tomo.fbp_filter_op(ray_trafo, padding=padding,
+                                   filter_type='Hann')
+    expected = filter_op(data)
+
+    for chunk_size, threads in [(1, 1), (5, 1), (5, 3), (None, 4)]:
+        chunked_op = tomo.fbp_filter_op(ray_trafo, padding=padding,
+                                        filter_type='Hann',
+                                        chunk_size=chunk_size,
+                                        threads=threads)
+        assert all_almost_equal(chunked_op(data), expected)
+
+
+def test_fbp_filter_weighting(ray_trafo):
+    """Test that the weighting is fused correctly into the filter."""
+    data = noise_element(ray_trafo.range)
+    weighting = noise_element(ray_trafo.range)
+    filter_op = tomo.fbp_filter_op(ray_trafo)
+    expected = filter_op(data * weighting)
+
+    weighted_op = tomo.fbp_filter_op(ray_trafo, weighting=weighting)
+    assert all_almost_equal(weighted_op(data), expected)
+
+    chunked_op = tomo.fbp_filter_op(ray_trafo, weighting=weighting,
+                                    chunk_size=4, threads=2)
+    assert all_almost_equal(chunked_op(data), expected)
+
+
+# --- FBP tests --- #
+
+
+def test_fbp_streaming(ray_trafo):
+    """Test that block-wise FBP agrees with FBP on the full data."""
+    data = noise_element(ray_trafo.range)
+    weighting = noise_element(ray_trafo.range)
+    fbp = tomo.fbp_op(ray_trafo, filter_type='Hann', weighting=weighting)
+    expected = fbp(data)
+
+    # Block size 17 leaves a last block of a single angle
+    for block_size, overlap in [(1, False), (5, False), (5, True),
+                                (17, False), (17, True), (100, True)]:
+        streaming_fbp = tomo.fbp_op(ray_trafo, filter_type='Hann',
+                                    weighting=weighting,
+                                    block_size=block_size, overlap=overlap)
+        assert all_almost_equal(streaming_fbp(data), expected)
+
+    with pytest.raises(ValueError):
+        tomo.fbp_op(ray_trafo, block_size=5, chunk_size=5)
+
+
+# --- Weighting tests --- #
+
+
+def test_parker_weighting():
+    """Test Parker weighting against the defining formula."""
+    space = odl.uniform_discr([-20, -20], [20, 20], [20, 20])
+    apart = odl.uniform_partition(0, np.pi + 1.0, 18)
+    dpart = odl.uniform_partition(-30, 30, 25)
+    geometry = tomo.FanFlatGeometry(apart, dpart, src_radius=200,
+                                    det_radius=100)
+    ray_trafo = tomo.RayTransform(space, geometry, impl='numpy')
+    q = 0.25
+
+    # Reference implementation, names taken from WES2002
+    angles, dx = ray_trafo.range.meshgrid
+    alen = np.pi + 1.0
+    delta = np.arctan2(np.max(np.abs(dx)), 300)
+    epsilon = alen - np.pi - 2 * delta
+
+    def S(betap):
+        return (0.5 * (1.0 + np.sin(np.pi * betap)) * (np.abs(betap) < 0.5) +
+                (betap >= 0.5))
+
+    def b(alpha):
+        return q * (2 * delta - 2 * alpha + epsilon)
+
+    beta = angles
+    alpha = np.arctan2(dx, 300)
+    expected = (S(beta / b(alpha) - 0.5) +
+                S((beta - 2 * delta + 2 * alpha - epsilon) / b(alpha) + 0.5) -
+                S((beta - np.pi + 2 * alpha) / b(-alpha) - 0.5) -
+                S((beta - np.pi - 2 * delta - epsilon) / b(-alpha) + 0.5))
+    expected *= 0.5 * alen / np.pi
+
+    weighting = tomo.parker_weighting(ray_trafo, q=q)
+    assert all_almost_equal(weighting.asarray(), expected)
+
+    # Second call uses the cache and returns an independent element
+    weighting *= 2
+    assert all_almost_equal(tomo.parker_weighting(ray_trafo, q=q).asarray(),
+                            expected)
+
+
+if __name__ == '__main__':
+    pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -15,7 +15,10 @@ import sys
 
 import odl
 from odl.tomo.backends.astra_cpu import (
-    astra_cpu_forward_projector, astra_cpu_back_projector)
+    astra_cpu_forward_projector, astra_cpu_back_projector, astra_cpu_cache,
+    AstraCpuCache)
+from odl.util import thread_pool
+from odl.util.testutils import all_almost_equal
 from odl.tomo.util.testutils import skip_if_no_astra
 
 # TODO: clean up and improve tests
@@ -81,5 +84,89 @@ def test_astra_cpu_projector_fanflat():
     assert backproj.norm() > 0
 
 
+@skip_if_no_astra
+def test_astra_cpu_cache():
+    """ASTRA CPU projector objects are reused and evicted."""
+    reco_space = odl.uniform_discr([-4, -5], [4, 5], (4, 5), dtype='float32')
+    phantom = odl.phantom.cuboid(reco_space, min_pt=[0, 0], max_pt=[4, 5])
+    angle_part = odl.uniform_partition(0, 2 * np.pi, 8)
+    det_part = odl.uniform_partition(-6, 6, 6)
+    geom = odl.tomo.Parallel2dGeometry(angle_part, det_part)
+    proj_space = odl.uniform_discr_frompartition(geom.partition,
+                                                 dtype='float32')
+
+    cache = astra_cpu_cache(geom)
+    assert astra_cpu_cache(geom) is cache
+    assert len(cache) == 0
+
+    # Results must not depend on caching
+    proj_nocache = astra_cpu_forward_projector(phantom, geom, proj_space)
+    assert len(cache) == 0
+    proj_data = astra_cpu_forward_projector(phantom, geom, proj_space,
+                                            use_cache=True)
+    assert all_almost_equal(proj_data, proj_nocache)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    proj_data = astra_cpu_forward_projector(phantom, geom, proj_space,
+                                            use_cache=True)
+    assert all_almost_equal(proj_data, proj_nocache)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    backproj_nocache = astra_cpu_back_projector(proj_data, geom, reco_space)
+    backproj = astra_cpu_back_projector(proj_data, geom, reco_space,
+                                        use_cache=True)
+    assert all_almost_equal(backproj, backproj_nocache)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 2
+
+    # Fill the cache with different spaces to trigger eviction
+    for i in range(cache.max_size):
+        space = odl.uniform_discr([-4, -5], [4, 5], (4 + i, 5),
+                                  dtype='float32')
+        astra_cpu_forward_projector(space.one(), geom, proj_space,
+                                    use_cache=True)
+    assert len(cache) == cache.max_size
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@skip_if_no_astra
+def test_astra_cpu_cache_threads():
+    """ASTRA CPU projector cache used from several threads."""
+    angle_part = odl.uniform_partition(0, 2 * np.pi, 8)
+    det_part = odl.uniform_partition(-6, 6, 6)
+    geom = odl.tomo.Parallel2dGeometry(angle_part, det_part)
+    proj_space = odl.uniform_discr_frompartition(geom.partition,
+                                                 dtype='float32')
+    spaces = [odl.uniform_discr([-4, -5], [4, 5], (4 + i, 5),
+                                dtype='float32')
+              for i in range(3)]
+    expected = [astra_cpu_forward_projector(space.one(), geom, proj_space)
+                for space in spaces]
+
+    # A single entry forces eviction of handles that are still in use
+    cache = AstraCpuCache(max_size=1)
+
+    def project(i):
+        space = spaces[i % len(spaces)]
+        handle = cache.get('forward', geom, space, proj_space, space.interp)
+        return handle(space.one(), proj_space.element())
+
+    results = thread_pool(4).map(project, range(30))
+
+    for i, result in enumerate(results):
+        assert all_almost_equal(result, expected[i % len(spaces)])
+    assert cache.hits + cache.misses == 30
+    assert len(cache) == 1
+
+    # An evicted handle can still be called
+    handle = cache.get('forward', geom, spaces[0], proj_space, 'nearest')
+    cache.clear()
+    result = handle(spaces[0].one(), proj_space.element())
+    assert all_almost_equal(result, expected[0])
+    handle.delete()
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
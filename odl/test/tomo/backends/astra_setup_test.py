@@ -398,6 +398,9 @@ def test_geom_to_vec():
     vec = odl.tomo.astra_conebeam_3d_geom_to_vec(geom_hcf)
     assert vec.shape == (apart.size, 12)
 
+    # Vectors are cached in the geometry
+    assert odl.tomo.astra_conebeam_3d_geom_to_vec(geom_hcf) is vec
+
 
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
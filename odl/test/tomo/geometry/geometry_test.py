@@ -316,5 +316,74 @@ def test_helical_cone_flat():
     assert repr(geom)
 
 
+def test_vectorized_geometry_methods():
+    """Test that geometry methods agree for arrays and single angles."""
+    apart = odl.uniform_partition(0, 4 * np.pi, 10)
+    dpart_2d = odl.uniform_partition(-1, 1, 10)
+    dpart_3d = odl.uniform_partition([-1, -1], [1, 1], [10, 10])
+    geometries = [
+        odl.tomo.Parallel2dGeometry(apart, dpart_2d),
+        odl.tomo.Parallel3dAxisGeometry(apart, dpart_3d, axis=[1, 1, 0]),
+        odl.tomo.FanFlatGeometry(apart, dpart_2d, src_radius=10,
+                                 det_radius=5),
+        odl.tomo.HelicalConeFlatGeometry(apart, dpart_3d, src_radius=10,
+                                         det_radius=5, pitch=1.5,
+                                         pitch_offset=0.5)]
+
+    for geom in geometries:
+        angles = geom.angles
+        dpar = geom.det_params.mid_pt
+
+        rot_mats = geom.rotation_matrix(angles)
+        refpoints = geom.det_refpoint(angles)
+        det_points = geom.det_point_position(angles, dpar)
+        det_to_src = geom.det_to_src(angles, dpar)
+        assert rot_mats.shape == (angles.size, geom.ndim, geom.ndim)
+        assert refpoints.shape == (angles.size, geom.ndim)
+
+        for i, angle in enumerate(angles):
+            assert all_almost_equal(rot_mats[i], geom.rotation_matrix(angle))
+            assert all_almost_equal(refpoints[i], geom.det_refpoint(angle))
+            assert all_almost_equal(det_points[i],
+                                    geom.det_point_position(angle, dpar))
+            assert all_almost_equal(det_to_src[i],
+                                    geom.det_to_src(angle, dpar))
+            if hasattr(geom, 'src_position'):
+                assert all_almost_equal(geom.src_position(angles)[i],
+                                        geom.src_position(angle))
+
+        with pytest.raises(ValueError):
+            geom.det_refpoint([0, 5 * np.pi])
+
+
+def test_geometry_motion_subset():
+    """Test restriction of geometries to a subset of angles."""
+    apart = odl.uniform_partition(0, 4 * np.pi, 10)
+    dpart_2d = odl.uniform_partition(-1, 1, 10)
+    dpart_3d = odl.uniform_partition([-1, -1], [1, 1], [10, 10])
+    geometries = [
+        odl.tomo.Parallel2dGeometry(apart, dpart_2d),
+        odl.tomo.Parallel3dAxisGeometry(apart, dpart_3d, axis=[1, 1, 0]),
+        odl.tomo.FanFlatGeometry(apart, dpart_2d, src_radius=10,
+                                 det_radius=5),
+        odl.tomo.HelicalConeFlatGeometry(apart, dpart_3d, src_radius=10,
+                                         det_radius=5, pitch=1.5,
+                                         pitch_offset=0.5)]
+
+    for geom in geometries:
+        geom.implementation_cache['key'] = 'value'
+        sub_geom = geom.motion_subset(slice(3, 7))
+        assert type(sub_geom) is type(geom)
+        assert sub_geom.motion_partition == geom.motion_partition[3:7]
+        assert sub_geom.det_partition == geom.det_partition
+        assert sub_geom.implementation_cache == {}
+        assert geom.implementation_cache == {'key': 'value'}
+
+        angles = geom.angles[3:7]
+        assert all_almost_equal(sub_geom.angles, angles)
+        assert all_almost_equal(sub_geom.det_refpoint(angles),
+                                geom.det_refpoint(angles))
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -18,7 +18,8 @@ import odl.tomo as tomo
 from odl.tomo.backends import ASTRA_VERSION
 from odl.tomo.util.testutils import (skip_if_no_astra, skip_if_no_astra_cuda,
                                      skip_if_no_skimage)
-from odl.util.testutils import almost_equal, all_almost_equal, simple_fixture
+from odl.util.testutils import (almost_equal, all_almost_equal, never_skip,
+                                noise_element, simple_fixture)
 
 
 # --- pytest fixtures --- #
@@ -26,7 +27,8 @@ from odl.util.testutils import almost_equal, all_almost_equal, simple_fixture
 
 impl_params = [skip_if_no_astra('astra_cpu'),
                skip_if_no_astra_cuda('astra_cuda'),
-               skip_if_no_skimage('skimage')]
+               skip_if_no_skimage('skimage'),
+               never_skip('numpy')]
 impl = simple_fixture('impl', impl_params, fmt=" {name} = '{value.args[1]}' ")
 
 geometry_params = ['par2d', 'par3d', 'cone2d', 'cone3d', 'helical']
@@ -88,7 +90,11 @@ projectors = [skip_if_no_astra('par2d astra_cpu uniform'),
               skip_if_no_astra_cuda('cone3d astra_cuda random'),
               skip_if_no_astra_cuda('helical astra_cuda uniform'),
               skip_if_no_skimage('par2d skimage uniform'),
-              skip_if_no_skimage('par2d skimage half_uniform')]
+              skip_if_no_skimage('par2d skimage half_uniform'),
+              never_skip('par2d numpy uniform'),
+              never_skip('par2d numpy random'),
+              never_skip('cone2d numpy uniform'),
+              never_skip('cone2d numpy nonuniform')]
 
 
 projector_ids = [' geom={}, impl={}, angles={} '
@@ -272,6 +278,59 @@ def test_complex(impl):
     assert all_almost_equal(data.imag, true_data_im)
 
 
+def test_batched(impl):
+    """Test batched evaluation against evaluation per component."""
+    space = odl.uniform_discr([-1, -1], [1, 1], (10, 10), dtype='float32')
+    geom = odl.tomo.parallel_beam_geometry(space)
+    ray_trafo = odl.tomo.RayTransform(space, geom, impl=impl)
+    batch_op = odl.tomo.BatchedRayTransform(ray_trafo, 3)
+    assert batch_op.domain == space ** 3
+    assert batch_op.range == ray_trafo.range ** 3
+
+    vols = batch_op.domain.element([odl.phantom.shepp_logan(space),
+                                    odl.phantom.cuboid(space),
+                                    space.one()])
+    projs = batch_op(vols)
+    for vol, proj in zip(vols, projs):
+        assert all_almost_equal(proj, ray_trafo(vol))
+
+    # In-place evaluation and input with extra leading axis
+    out = batch_op.range.element()
+    batch_op(np.array([vol.asarray() for vol in vols]), out=out)
+    assert all_almost_equal(out, projs)
+
+    backprojs = batch_op.adjoint(projs)
+    for proj, backproj in zip(projs, backprojs):
+        assert all_almost_equal(backproj, ray_trafo.adjoint(proj))
+
+
+def test_batched_complex():
+    """Test batched evaluation for complex spaces."""
+    space = odl.uniform_discr([-1, -1], [1, 1], (10, 10), dtype='complex64')
+    geom = odl.tomo.parallel_beam_geometry(space)
+    ray_trafo = odl.tomo.RayTransform(space, geom, impl='numpy')
+    batch_op = odl.tomo.BatchedRayTransform(ray_trafo, 2)
+
+    vols = noise_element(batch_op.domain)
+    projs = batch_op(vols)
+    for vol, proj in zip(vols, projs):
+        assert all_almost_equal(proj, ray_trafo(vol))
+
+
+def test_numpy_matched_adjoint(geometry):
+    """Test that the NumPy back-end back-projection is the exact adjoint."""
+    ndim = geometry.ndim
+    space = odl.uniform_discr([-20] * ndim, [20] * ndim, shape=[16] * ndim,
+                              dtype='float64')
+    ray_trafo = odl.tomo.RayTransform(space, geometry, impl='numpy')
+
+    vol = noise_element(ray_trafo.domain)
+    data = noise_element(ray_trafo.range)
+
+    assert ray_trafo(vol).inner(data) == pytest.approx(
+        vol.inner(ray_trafo.adjoint(data)), rel=1e-6)
+
+
 def test_anisotropic_voxels(geometry):
     """Test projection and backprojection with anisotropic voxels."""
     ndim = geometry.ndim
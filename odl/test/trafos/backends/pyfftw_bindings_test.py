@@ -7,10 +7,14 @@
 # obtain one at https://mozilla.org/MPL/2.0/.
 
 from __future__ import division
+from threading import Thread
+
 import numpy as np
 import pytest
 
-from odl.trafos.backends import pyfftw_call, PYFFTW_AVAILABLE
+from odl.trafos.backends import (
+    pyfftw_call, PYFFTW_AVAILABLE, FFTWPlanCache, export_fftw_wisdom,
+    import_fftw_wisdom)
 from odl.util import (
     is_real_dtype, complex_dtype)
 from odl.util.testutils import (
@@ -380,5 +384,97 @@ def test_pyfftw_call_backward_with_plan():
         assert all_almost_equal(idft_arr, true_idft)
 
 
+def test_plan_cache_reuse():
+    cache = FFTWPlanCache()
+    shape = (4, 6)
+    arr = _random_array(shape, dtype='float64')
+    arr_cpy = arr.copy()
+    true_dft = np.fft.rfftn(arr)
+
+    dft_arr = np.empty(_halfcomplex_shape(shape), dtype='complex128')
+    plan = pyfftw_call(arr, dft_arr, halfcomplex=True,
+                       planning_effort='measure', plan_cache=cache)
+    assert all_almost_equal(arr, arr_cpy)  # Planner left input alone
+    assert all_almost_equal(dft_arr, true_dft)
+    assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+    assert cache.nbytes == arr.nbytes + dft_arr.nbytes
+
+    # Repeated calls are served from the cache. The same arrays are used
+    # since the SIMD alignment of fresh arrays is part of the cache key.
+    dft_arr.fill(0)
+    assert pyfftw_call(arr, dft_arr, halfcomplex=True,
+                       planning_effort='measure', plan_cache=cache) is plan
+    assert all_almost_equal(dft_arr, true_dft)
+    assert cache.hits == 1
+
+    # Other parameters give new plans
+    pyfftw_call(arr, np.empty(shape, dtype='complex128'), halfcomplex=False,
+                plan_cache=cache)
+    pyfftw_call(dft_arr, np.empty(shape), direction='backward',
+                halfcomplex=True, plan_cache=cache)
+    assert (cache.misses, len(cache)) == (3, 3)
+
+    # In-place transforms
+    carr = _random_array(shape, dtype='complex128')
+    true_dft = np.fft.fftn(carr)
+    pyfftw_call(carr, carr, plan_cache=cache)
+    assert all_almost_equal(carr, true_dft)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_plan_cache_max_bytes():
+    shape = (10,)
+    arr = _random_array(shape, dtype='complex128')
+    out = np.empty_like(arr)
+    cache = FFTWPlanCache(max_bytes=2 * arr.nbytes)
+
+    # Reuse `out` since its SIMD alignment is part of the cache key
+    pyfftw_call(arr, out, plan_cache=cache)
+    pyfftw_call(arr, out, direction='backward', plan_cache=cache)
+
+    # Least recently used plan is dropped
+    assert len(cache) == 1
+    assert cache.nbytes == 2 * arr.nbytes
+    pyfftw_call(arr, out, direction='backward', plan_cache=cache)
+    assert cache.hits == 1
+
+    cache.max_bytes = 0
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        FFTWPlanCache(max_bytes=-1)
+
+
+def test_plan_cache_threads():
+    cache = FFTWPlanCache()
+    arr = _random_array((10,), dtype='complex128')
+    out = np.empty_like(arr)
+    plan = pyfftw_call(arr, out, plan_cache=cache)
+
+    # Plans are not shared between threads
+    other_plans = []
+    thread = Thread(target=lambda: other_plans.append(
+        pyfftw_call(arr, out, plan_cache=cache)))
+    thread.start()
+    thread.join()
+    assert other_plans[0] is not plan
+    assert (cache.misses, len(cache)) == (2, 2)
+    assert pyfftw_call(arr, out, plan_cache=cache) is plan
+
+
+def test_fftw_wisdom_roundtrip(tmpdir):
+    filename = str(tmpdir.join('wisdom.pkl'))
+    assert not import_fftw_wisdom(filename)
+
+    arr = _random_array((16,), dtype='complex128')
+    pyfftw_call(arr, np.empty_like(arr), planning_effort='measure',
+                plan_cache=None)
+    export_fftw_wisdom(filename)
+    assert import_fftw_wisdom(filename)
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
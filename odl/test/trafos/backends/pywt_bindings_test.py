@@ -163,6 +163,21 @@ def test_multilevel_recon_inverts_decomp(shape_setup, floating_dtype):
     assert all_almost_equal(wave_recon, image)
 
 
+def test_multilevel_decomp_out(shape_setup, floating_dtype):
+    """Test that decomp with ``out`` writes the flat coefficient array."""
+    wavelet, pywt_mode, nlevels, image_shape, coeff_shapes = shape_setup
+
+    image = np.random.uniform(size=image_shape).astype(floating_dtype)
+    wave_decomp = pywt_multi_level_decomp(image, wavelet, nlevels, pywt_mode)
+    true_flat_array = pywt_flat_array_from_coeffs(wave_decomp)
+
+    out = np.empty_like(true_flat_array)
+    coeff_list = pywt_multi_level_decomp(image, wavelet, nlevels, pywt_mode,
+                                         out=out)
+    assert all_almost_equal(out, true_flat_array)
+    assert np.may_share_memory(coeff_list[0], out)
+
+
 def test_multilevel_decomp_inverts_recon(shape_setup):
     """Test that decomp is the inverse of recon."""
     dtype = 'float64'  # when fixed, use dtype fixture instead
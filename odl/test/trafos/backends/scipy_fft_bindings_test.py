@@ -0,0 +1,111 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import division
+import numpy as np
+import pytest
+
+from odl.trafos.backends import scipy_fft_call, SCIPY_FFT_AVAILABLE
+from odl.util import is_real_dtype, complex_dtype
+from odl.util.testutils import all_almost_equal, simple_fixture
+
+
+pytestmark = pytest.mark.skipif(not SCIPY_FFT_AVAILABLE,
+                                reason='`scipy.fft` backend not available')
+
+
+# --- pytest fixtures --- #
+
+
+direction = simple_fixture('direction', ['forward', 'backward'])
+workers = simple_fixture('workers', [1, 2])
+
+
+# --- helper functions --- #
+
+
+def _random_array(shape, dtype):
+    if is_real_dtype(dtype):
+        return np.random.rand(*shape).astype(dtype)
+    else:
+        return (np.random.rand(*shape).astype(dtype) +
+                1j * np.random.rand(*shape).astype(dtype))
+
+
+# ---- scipy_fft_call ---- #
+
+
+def test_scipy_fft_call_forward(workers):
+    for dtype in ['float32', 'float64', 'complex64', 'complex128']:
+        halfcomplex = is_real_dtype(dtype)
+        arr = _random_array((3, 4, 5), dtype)
+
+        if halfcomplex:
+            true_dft = np.fft.rfftn(arr)
+            dft_arr = np.empty((3, 4, 3), dtype=complex_dtype(dtype))
+        else:
+            true_dft = np.fft.fftn(arr)
+            dft_arr = np.empty((3, 4, 5), dtype=dtype)
+
+        result = scipy_fft_call(arr, dft_arr, halfcomplex=halfcomplex,
+                                workers=workers)
+        assert result is dft_arr
+        assert all_almost_equal(dft_arr, true_dft, places=4)
+
+
+def test_scipy_fft_call_backward(workers):
+    for dtype in ['float32', 'float64', 'complex64', 'complex128']:
+        halfcomplex = is_real_dtype(dtype)
+        shape = (3, 4, 5)
+
+        if halfcomplex:
+            arr = _random_array((3, 4, 3), complex_dtype(dtype))
+            true_idft = np.fft.irfftn(arr, s=shape)
+        else:
+            arr = _random_array(shape, dtype)
+            true_idft = np.fft.ifftn(arr)
+        idft_arr = np.empty(shape, dtype=dtype)
+
+        scipy_fft_call(arr, idft_arr, direction='backward',
+                       halfcomplex=halfcomplex, workers=workers,
+                       normalise_idft=True)
+        assert all_almost_equal(idft_arr, true_idft, places=4)
+
+        # Unnormalized
+        scipy_fft_call(arr, idft_arr, direction='backward',
+                       halfcomplex=halfcomplex, workers=workers)
+        assert all_almost_equal(idft_arr, true_idft * 60, places=3)
+
+
+def test_scipy_fft_call_in_place(direction):
+    arr = _random_array((4, 5), 'complex128')
+    if direction == 'forward':
+        true_dft = np.fft.fftn(arr, axes=(1,))
+    else:
+        true_dft = np.fft.ifftn(arr, axes=(1,))
+
+    scipy_fft_call(arr, arr, direction=direction, axes=1,
+                   normalise_idft=True)
+    assert all_almost_equal(arr, true_dft)
+
+
+def test_scipy_fft_call_bad_input(direction):
+    arr = _random_array((4, 5), 'complex128')
+
+    with pytest.raises(ValueError):
+        scipy_fft_call(arr, np.empty((4, 4), dtype='complex128'),
+                       direction=direction)
+    with pytest.raises(ValueError):
+        scipy_fft_call(arr, np.empty((4, 5), dtype='complex64'),
+                       direction=direction)
+    with pytest.raises(ValueError):
+        scipy_fft_call(arr, arr, direction='sideways')
+
+
+if __name__ == '__main__':
+    pytest.main([str(__file__.replace('\\', '/')), '-v'])
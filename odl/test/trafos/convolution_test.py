@@ -0,0 +1,113 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import division
+from itertools import product
+import numpy as np
+import pytest
+
+import odl
+from odl.trafos import Convolution
+from odl.util.testutils import (all_almost_equal, almost_equal,
+                                noise_element, simple_fixture)
+
+
+# --- pytest fixtures --- #
+
+
+pad_mode = simple_fixture('pad_mode', ['constant', 'periodic'])
+method_blocks = simple_fixture('method_blocks',
+                               [('direct', None), ('fft', None),
+                                ('fft', 3)])
+dtype = simple_fixture('dtype', ['float64', 'complex128'])
+
+
+# --- helper functions --- #
+
+
+def _convolve_brute_force(x, kernel, center, pad_mode):
+    out = np.zeros_like(x)
+    for i in product(*[range(n) for n in x.shape]):
+        for j in product(*[range(k) for k in kernel.shape]):
+            idx = [ii + c - jj for ii, c, jj in zip(i, center, j)]
+            if pad_mode == 'periodic':
+                idx = [ii % n for ii, n in zip(idx, x.shape)]
+            elif any(not 0 <= ii < n for ii, n in zip(idx, x.shape)):
+                continue
+            out[i] += kernel[j] * x[tuple(idx)]
+    return out
+
+
+# --- Convolution --- #
+
+
+def test_convolution_result(pad_mode, method_blocks, dtype):
+    method, block_shape = method_blocks
+    space = odl.uniform_discr([0, 0], [1, 1], (7, 5), dtype=dtype)
+    kernel = noise_element(odl.uniform_discr([0, 0], [1, 1], (3, 2),
+                                             dtype=dtype)).asarray()
+    x = noise_element(space)
+
+    for center in [None, (0, 1)]:
+        conv = Convolution(space, kernel, center=center, pad_mode=pad_mode,
+                           method=method, block_shape=block_shape)
+        true_center = (1, 1) if center is None else center
+        expected = _convolve_brute_force(x.asarray(), kernel, true_center,
+                                         pad_mode)
+        assert all_almost_equal(conv(x).asarray(), expected)
+
+        # Repeated evaluation uses the cached spectrum
+        out = space.element()
+        conv(x, out=out)
+        assert all_almost_equal(out.asarray(), expected)
+
+
+def test_convolution_adjoint(pad_mode, method_blocks, dtype):
+    method, block_shape = method_blocks
+    space = odl.uniform_discr(0, 1, 10, dtype=dtype)
+    kernel = noise_element(odl.uniform_discr(0, 1, 4, dtype=dtype))
+    conv = Convolution(space, kernel, pad_mode=pad_mode, method=method,
+                       block_shape=block_shape)
+
+    x = noise_element(space)
+    y = noise_element(space)
+    assert almost_equal(conv(x).inner(y), x.inner(conv.adjoint(y)))
+    assert conv.adjoint.adjoint.center == conv.center
+
+
+def test_convolution_method_choice():
+    space = odl.uniform_discr([0, 0], [1, 1], (20, 20))
+    assert Convolution(space, np.ones((3, 3))).method == 'direct'
+    conv = Convolution(space, np.ones((9, 9)))
+    assert conv.method == 'fft'
+    assert conv.fft_shape == (30, 30)
+    assert conv.kernel_ft.shape == (30, 16)
+
+    conv = Convolution(space, np.ones((9, 9)), block_shape=(8, 100))
+    assert conv.block_shape == (8, 20)
+    assert conv.fft_shape == (16, 30)
+
+
+def test_convolution_bad_input():
+    space = odl.uniform_discr(0, 1, 10)
+    with pytest.raises(TypeError):
+        Convolution(odl.rn(10), [1, 2])
+    with pytest.raises(ValueError):
+        Convolution(space, np.ones((2, 2)))
+    with pytest.raises(ValueError):
+        Convolution(space, [1, 2], center=2)
+    with pytest.raises(ValueError):
+        Convolution(space, [1, 2], pad_mode='symmetric')
+    with pytest.raises(ValueError):
+        Convolution(space, [1, 2], method='fast')
+    with pytest.raises(ValueError):
+        Convolution(space, [1, 2], block_shape=0)
+
+
+if __name__ == '__main__':
+    pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -18,7 +18,7 @@ from odl.trafos.fourier import (
     DiscreteFourierTransform, DiscreteFourierTransformInverse,
     FourierTransform)
 from odl.util import (all_almost_equal, never_skip, skip_if_no_pyfftw,
-                      noise_element,
+                      skip_if_no_scipy_fft, noise_element,
                       is_real_dtype, conj_exponent, complex_dtype)
 from odl.util.testutils import simple_fixture
 
@@ -27,6 +27,7 @@ from odl.util.testutils import simple_fixture
 
 
 impl = simple_fixture('impl', [never_skip('numpy'),
+                               skip_if_no_scipy_fft('scipy'),
                                skip_if_no_pyfftw('pyfftw')])
 exponent = simple_fixture('exponent', [2.0, 1.0, float('inf'), 1.5])
 sign = simple_fixture('sign', ['-', '+'])
@@ -252,6 +253,28 @@ def test_dft_call(impl):
     assert (rand_arr_idft - rand_arr).norm() < 1e-6
 
 
+def test_dft_real_full_complex(impl, sign):
+    # Real domain without halfcomplex, the inverse has real range
+    dft_dom = odl.discr_sequence_space((5, 6), dtype='float64')
+    dft = DiscreteFourierTransform(domain=dft_dom, impl=impl, sign=sign)
+    assert dft.range.shape == (5, 6)
+
+    x = noise_element(dft_dom)
+    x_arr = x.asarray()
+    x_dft = dft(x, flags=('FFTW_ESTIMATE',))
+    if sign == '-':
+        assert all_almost_equal(x_dft.asarray(), np.fft.fftn(x_arr))
+    else:
+        assert all_almost_equal(x_dft.asarray(),
+                                x.size * np.fft.ifftn(x_arr))
+    assert all_almost_equal(dft.inverse(x_dft, flags=('FFTW_ESTIMATE',)), x)
+
+    # Also with the default implementation
+    dft = DiscreteFourierTransform(domain=dft_dom, sign=sign)
+    x_dft = dft(x, flags=('FFTW_ESTIMATE',))
+    assert all_almost_equal(dft.inverse(x_dft, flags=('FFTW_ESTIMATE',)), x)
+
+
 def test_dft_sign(impl):
     # Test if the FT sign behaves as expected, i.e. that the FT with sign
     # '+' and '-' have same real parts and opposite imaginary parts.
@@ -298,6 +321,45 @@ def test_dft_sign(impl):
             domain=dft_dom, impl=impl, halfcomplex=True, sign='+', axes=axes)
 
 
+def test_dft_zero_padding(impl):
+    # 2d, complex, padded in both axes
+    shape = (4, 5)
+    dft_dom = odl.discr_sequence_space(shape, dtype='complex128')
+    dft = DiscreteFourierTransform(dft_dom, impl=impl, padded_shape=(6, 8))
+    assert dft.padded_shape == (6, 8)
+    assert dft.range.shape == (6, 8)
+
+    x = noise_element(dft_dom)
+    padded = np.zeros((6, 8), dtype='complex128')
+    padded[:4, :5] = x
+    assert all_almost_equal(dft(x, flags=('FFTW_ESTIMATE',)).asarray(),
+                            np.fft.fftn(padded))
+    assert all_almost_equal(dft.inverse(dft(x)), x)
+
+    with pytest.raises(NotImplementedError):
+        dft.adjoint
+
+    # 2d, halfcomplex, padded in the halved axis
+    dft_dom = odl.discr_sequence_space(shape, dtype='float64')
+    dft = DiscreteFourierTransform(dft_dom, impl=impl, halfcomplex=True,
+                                   axes=1, padded_shape=(9,))
+    assert dft.range.shape == (4, 5)
+
+    x = noise_element(dft_dom)
+    assert all_almost_equal(dft(x, flags=('FFTW_ESTIMATE',)).asarray(),
+                            np.fft.rfft(x.asarray(), n=9, axis=1))
+    idft = DiscreteFourierTransformInverse(dft_dom, impl=impl,
+                                           halfcomplex=True, axes=1,
+                                           padded_shape=(9,))
+    assert idft.domain == dft.range
+    assert all_almost_equal(idft(dft(x)), x)
+
+    with pytest.raises(ValueError):
+        DiscreteFourierTransform(dft_dom, impl=impl, padded_shape=(4, 4))
+    with pytest.raises(ValueError):
+        DiscreteFourierTransform(dft_dom, impl=impl, padded_shape=(8,))
+
+
 def test_dft_init_plan(impl):
 
     # 2d, halfcomplex, first axis
@@ -471,6 +533,26 @@ def test_fourier_trafo_call(impl, floating_dtype):
     assert np.allclose(ift(ft(one)), one)
 
 
+def test_fourier_trafo_halfcomplex_inner(impl):
+    # Inner products and norms in the half-complex range must match those
+    # of the full spectrum
+    for shape in [(4, 6), (4, 5)]:
+        space_discr = odl.uniform_discr([0, 0], [1, 1], shape)
+        ft_half = FourierTransform(space_discr, impl=impl, halfcomplex=True)
+        ft_full = FourierTransform(space_discr, impl=impl, halfcomplex=False)
+
+        x = noise_element(space_discr)
+        y = noise_element(space_discr)
+        assert ft_half.range.inner(ft_half(x), ft_half(y)) == pytest.approx(
+            ft_full.range.inner(ft_full(x), ft_full(y)).real)
+        assert ft_half(x).norm() == pytest.approx(ft_full(x).norm())
+        assert (ft_half(x) - ft_half(y)).norm() == pytest.approx(
+            (ft_full(x) - ft_full(y)).norm())
+
+        # Range is reproducible for equal input
+        assert ft_half.range == FourierTransform(space_discr).range
+
+
 def test_fourier_trafo_charfun_1d():
     # Characteristic function of [0, 1], its Fourier transform is
     # given by exp(-1j * y / 2) * sinc(y/2)
@@ -13,7 +13,8 @@ import pytest
 
 import odl
 from odl.trafos.util.ft_utils import (
-    reciprocal_grid, realspace_grid, dft_preprocess_data)
+    reciprocal_grid, realspace_grid, reciprocal_space, dft_preprocess_data,
+    dft_postprocess_data)
 from odl.util import all_almost_equal, all_equal
 from odl.util.testutils import simple_fixture
 
@@ -186,6 +187,18 @@ def test_reciprocal_grid_nd_halfcomplex():
                        halfcx_parity='+')
 
 
+def test_reciprocal_space_untransformed_axes():
+    # Axes that are not transformed keep their extent, also with only one
+    # point
+    for shape in [(1, 6), (3, 6)]:
+        space = odl.uniform_discr([0, 0], [2, 1], shape)
+        for halfcomplex in [False, True]:
+            recip = reciprocal_space(space, axes=1, halfcomplex=halfcomplex)
+            assert recip.min_pt[0] == 0
+            assert recip.max_pt[0] == 2
+            assert recip.shape[0] == shape[0]
+
+
 # --- dft_preprocess_data --- #
 
 
@@ -295,5 +308,34 @@ def test_dft_preprocess_data_with_axes(sign):
     assert all_almost_equal(arr.ravel(), correct_arr)
 
 
+def test_dft_factor_cache(sign):
+    space = odl.uniform_discr([0, -1], [1, 1], (4, 5), dtype='complex128')
+    recip = reciprocal_space(space, shift=False)
+    shape = space.shape
+    arr = np.ones(shape, dtype='complex128')
+
+    # Factors are computed once and reused
+    odl.trafos.util.ft_utils._DFT_FACTOR_CACHE.clear()
+    first = dft_postprocess_data(arr, space.grid, recip.grid, shift=False,
+                                 axes=(0, 1), interp='nearest', sign=sign)
+    num_factors = len(odl.trafos.util.ft_utils._DFT_FACTOR_CACHE)
+    assert num_factors == 2
+    second = dft_postprocess_data(arr, space.grid, recip.grid, shift=False,
+                                  axes=(0, 1), interp='nearest', sign=sign)
+    assert len(odl.trafos.util.ft_utils._DFT_FACTOR_CACHE) == num_factors
+    assert all_equal(first, second)
+
+    # Separable result, the factors are the values at the axis slices
+    assert all_almost_equal(first, np.outer(first[:, 0], first[0, :]) /
+                            first[0, 0])
+
+    # Pre-processing, out-of-place into a given array
+    out = np.empty(shape, dtype='complex128')
+    dft_preprocess_data(arr, shift=True, sign=sign, out=out)
+    assert all_equal(arr, np.ones(shape))
+    assert all_almost_equal(out, dft_preprocess_data(arr, shift=True,
+                                                     sign=sign))
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -10,6 +10,8 @@ from __future__ import division
 import numpy as np
 import pytest
 
+import odl
+
 from odl.util import (
     apply_on_boundary, fast_1d_tensor_mult, resize_array, is_real_dtype)
 from odl.util.numerics import _SUPPORTED_RESIZE_PAD_MODES
@@ -279,6 +281,26 @@ def test_fast_1d_tensor_mult():
     assert all_equal(out, true_result)
 
 
+def test_fast_1d_tensor_mult_blocks(monkeypatch):
+    # Tiny blocks to process the array in several chunks
+    monkeypatch.setattr(odl.util.numerics, 'TENSOR_MULT_BLOCK_SIZE', 5)
+
+    shape = (5, 3, 4)
+    x, y, z = (np.arange(size, dtype='float64') + 1 for size in shape)
+    true_result = x[:, None, None] * y[None, :, None] * z[None, None, :]
+
+    arr = np.ones(shape)
+    assert all_equal(fast_1d_tensor_mult(arr, [x, y, z]), true_result)
+    arr = np.asfortranarray(np.ones(shape))
+    fast_1d_tensor_mult(arr, [x, y, z], out=arr)
+    assert all_equal(arr, true_result)
+
+    # Real input, complex output
+    out = np.empty(shape, dtype='complex128')
+    fast_1d_tensor_mult(np.ones(shape), [x, 1j * y, z], out=out)
+    assert all_equal(out, 1j * true_result)
+
+
 def test_fast_1d_tensor_mult_error():
 
     shape = (2, 3, 4)
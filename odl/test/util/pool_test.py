@@ -0,0 +1,95 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import division
+import pytest
+
+import odl
+from odl.util.pool import ElementPool, ELEMENT_POOL
+from odl.util.testutils import all_almost_equal, noise_element
+
+
+def test_element_pool_reuse():
+    pool = ElementPool()
+    space = odl.rn(10)
+
+    with pool.borrow(space) as x:
+        assert x in space
+        # Nested requests get distinct elements
+        with pool.borrow(space) as y:
+            assert y is not x
+
+    assert len(pool) == 2
+    assert pool.nbytes == 2 * 10 * 8
+    assert pool.misses == 2
+
+    with pool.borrow(odl.rn(10)) as z:
+        assert z is x or z is y
+    assert pool.hits == 1
+
+    # Other spaces get their own elements
+    with pool.borrow(odl.rn(10, dtype='float32')) as w:
+        assert w is not x and w is not y
+
+    pool.clear()
+    assert len(pool) == 0
+    assert pool.nbytes == 0
+
+
+def test_element_pool_max_bytes():
+    space = odl.rn(10)
+    pool = ElementPool(max_bytes=2 * 10 * 8)
+
+    x, y, z = [pool.acquire(space) for _ in range(3)]
+    for elem in (x, y, z):
+        pool.release(elem)
+
+    # Least recently returned element is dropped
+    assert len(pool) == 2
+    assert pool.nbytes == 2 * 10 * 8
+    assert pool.acquire(space) is z
+    assert pool.acquire(space) is y
+
+    # Elements that are larger than the pool are not stored
+    pool.release(odl.rn(100).element())
+    assert len(pool) == 0
+
+    pool.release(x)
+    pool.max_bytes = 0
+    assert len(pool) == 0
+
+    with pytest.raises(ValueError):
+        ElementPool(max_bytes=-1)
+
+
+def test_element_pool_product_space():
+    space = odl.ProductSpace(odl.uniform_discr(0, 1, 5), 3)
+    pool = ElementPool()
+    with pool.borrow(space) as x:
+        assert x in space
+    assert pool.nbytes == 3 * 5 * 8
+
+
+def test_operator_temporaries():
+    space = odl.rn(10)
+    op = odl.ScalingOperator(space, 2.0)
+    x = noise_element(space)
+    out = space.element()
+
+    ELEMENT_POOL.clear()
+    (op * op)(x, out=out)
+    assert all_almost_equal(out, 4 * x)
+    misses = ELEMENT_POOL.misses
+    (op * op)(x, out=out)
+    (op + op)(x, out=out)
+    assert all_almost_equal(out, 4 * x)
+    assert ELEMENT_POOL.misses == misses
+
+
+if __name__ == '__main__':
+    pytest.main([str(__file__.replace('\\', '/')), '-v'])
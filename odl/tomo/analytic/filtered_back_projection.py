@@ -11,10 +11,20 @@ from __future__ import print_function, division, absolute_import
 from future import standard_library
 standard_library.install_aliases()
 
+from builtins import super
+
 import numpy as np
 import scipy as sp
-from odl.discr import ResizingOperator
-from odl.trafos import FourierTransform, PYFFTW_AVAILABLE
+
+from odl.discr import (
+    DiscreteLp, ResizingOperator, uniform_partition,
+    uniform_discr_frompartition)
+from odl.operator import Operator
+from odl.space import FunctionSpace
+from odl.tomo.operators import RayBackProjection
+from odl.trafos import FourierTransform
+from odl.util import (
+    borrow_element, real_dtype, in_worker_thread, thread_pool)
 
 
 __all__ = ('fbp_op', 'fbp_filter_op', 'tam_danielson_window',
@@ -51,6 +61,58 @@ def _rotation_direction_in_detector(geometry):
     return c / cnorm
 
 
+def _cached_geometry_array(geometry, key, func):
+    """Return ``func()``, cached in ``geometry.implementation_cache``.
+
+    The returned array is read-only since it is shared between calls.
+    """
+    try:
+        return geometry.implementation_cache[key]
+    except KeyError:
+        arr = func()
+        arr.flags.writeable = False
+        geometry.implementation_cache[key] = arr
+        return arr
+
+
+def _rotation_distance_in_detector(ray_trafo):
+    """Distance of the detector points from the projected rotation axis.
+
+    The result is a sparse array that broadcasts against the detector
+    axes of ``ray_trafo.range`` and has length 1 along the angle axis.
+    """
+    meshgrid = ray_trafo.range.meshgrid
+    if ray_trafo.geometry.ndim == 2:
+        return meshgrid[1]
+
+    # If axis is aligned to a coordinate axis, save some memory and time by
+    # using broadcasting
+    rot_dir = _rotation_direction_in_detector(ray_trafo.geometry)
+    if rot_dir[0] == 0:
+        return rot_dir[1] * meshgrid[2]
+    elif rot_dir[1] == 0:
+        return rot_dir[0] * meshgrid[1]
+    else:
+        return rot_dir[0] * meshgrid[1] + rot_dir[1] * meshgrid[2]
+
+
+def _parker_s(betap):
+    """Smooth step ``S`` of the Parker weighting, evaluated in-place.
+
+    This is the closed form of ::
+
+        0.5 * (1 + sin(pi * betap))  if |betap| < 0.5
+        1                            if betap >= 0.5
+        0                            otherwise
+    """
+    np.clip(betap, -0.5, 0.5, out=betap)
+    betap *= np.pi
+    np.sin(betap, out=betap)
+    betap += 1
+    betap *= 0.5
+    return betap
+
+
 def _fbp_filter(norm_freq, filter_type, frequency_scaling):
     """Create a smoothing filter for FBP.
 
@@ -135,9 +197,10 @@ def tam_danielson_window(ray_trafo, smoothing_width=0.05, n_half_rot=1):
     .. _TAM1998: http://iopscience.iop.org/article/10.1088/0031-9155/43/4/028
     """
     # Extract parameters
-    src_radius = ray_trafo.geometry.src_radius
-    det_radius = ray_trafo.geometry.det_radius
-    pitch = ray_trafo.geometry.pitch
+    geometry = ray_trafo.geometry
+    src_radius = geometry.src_radius
+    det_radius = geometry.det_radius
+    pitch = geometry.pitch
 
     if pitch == 0:
         raise ValueError('Tam-Danielson window is only defined with '
@@ -150,47 +213,53 @@ def tam_danielson_window(ray_trafo, smoothing_width=0.05, n_half_rot=1):
     if n_half_rot % 2 != 1:
         raise ValueError('`n_half_rot` must be odd, got {}'.format(n_half_rot))
 
-    # Find projection of axis on detector
-    axis_proj = _axis_in_detector(ray_trafo.geometry)
-    rot_dir = _rotation_direction_in_detector(ray_trafo.geometry)
-
-    # Find distance from projection of rotation axis for each pixel
-    dx = (rot_dir[0] * ray_trafo.range.meshgrid[1] +
-          rot_dir[1] * ray_trafo.range.meshgrid[2])
-
-    # Compute angles
-    phi = np.arctan(dx / (src_radius + det_radius))
-    theta = phi * 2
+    def window():
+        # The window does not depend on the angle, hence it is computed
+        # on the detector only and broadcast along the angle axis
+        meshgrid = ray_trafo.range.meshgrid
 
-    # Compute lower and upper bound
-    source_to_line_distance = src_radius + src_radius * np.cos(theta)
-    scale = (src_radius + det_radius) / source_to_line_distance
+        # Find projection of axis on detector
+        axis_proj = _axis_in_detector(geometry)
+        rot_dir = _rotation_direction_in_detector(geometry)
 
-    source_to_line_lower = pitch * (theta - n_half_rot * np.pi) / (2 * np.pi)
-    source_to_line_upper = pitch * (theta + n_half_rot * np.pi) / (2 * np.pi)
+        # Find distance from projection of rotation axis for each pixel
+        dx = rot_dir[0] * meshgrid[1] + rot_dir[1] * meshgrid[2]
 
-    lower_proj = source_to_line_lower * scale
-    upper_proj = source_to_line_upper * scale
+        # Compute angles
+        theta = 2 * np.arctan(dx / (src_radius + det_radius))
 
-    # Compute a smoothed width
-    interval = (upper_proj - lower_proj)
-    width = interval * smoothing_width / np.sqrt(2)
+        # Compute lower and upper bound
+        scale = ((src_radius + det_radius) /
+                 (src_radius + src_radius * np.cos(theta)))
+        lower_proj = pitch * (theta - n_half_rot * np.pi) / (2 * np.pi)
+        lower_proj *= scale
+        upper_proj = pitch * (theta + n_half_rot * np.pi) / (2 * np.pi)
+        upper_proj *= scale
 
-    # Create window function
-    def window_fcn(x):
-        x_along_axis = axis_proj[0] * x[1] + axis_proj[1] * x[2]
+        x_along_axis = axis_proj[0] * meshgrid[1] + axis_proj[1] * meshgrid[2]
         if smoothing_width != 0:
-            lower_wndw = 0.5 * (
-                1 + sp.special.erf((x_along_axis - lower_proj) / width))
-            upper_wndw = 0.5 * (
-                1 + sp.special.erf((upper_proj - x_along_axis) / width))
+            # Smoothed width
+            inv_width = np.sqrt(2) / (smoothing_width *
+                                      (upper_proj - lower_proj))
+            wndw = sp.special.erf((x_along_axis - lower_proj) * inv_width)
+            wndw += 1
+            upper_wndw = sp.special.erf((upper_proj - x_along_axis) *
+                                        inv_width)
+            upper_wndw += 1
+            wndw *= upper_wndw
+            wndw *= 0.25 / n_half_rot
         else:
-            lower_wndw = (x_along_axis >= lower_proj)
-            upper_wndw = (x_along_axis <= upper_proj)
+            wndw = ((x_along_axis >= lower_proj) &
+                    (x_along_axis <= upper_proj)) / n_half_rot
 
-        return lower_wndw * upper_wndw
+        return np.asarray(wndw, dtype=ray_trafo.range.dtype)
 
-    return ray_trafo.range.element(window_fcn) / n_half_rot
+    key = ('tam_danielson_window', smoothing_width, int(n_half_rot),
+           ray_trafo.range.dtype)
+    wndw = _cached_geometry_array(geometry, key, window)
+    # Copy since the cached array is shared
+    return ray_trafo.range.element(
+        np.broadcast_to(wndw, ray_trafo.range.shape).copy())
 
 
 def parker_weighting(ray_trafo, q=0.25):
@@ -231,35 +300,22 @@ def parker_weighting(ray_trafo, q=0.25):
     # Note: Parameter names taken from WES2002
 
     # Extract parameters
-    src_radius = ray_trafo.geometry.src_radius
-    det_radius = ray_trafo.geometry.det_radius
-    ndim = ray_trafo.geometry.ndim
-    angles = ray_trafo.range.meshgrid[0]
-    min_rot_angle = ray_trafo.geometry.motion_partition.min_pt
-    alen = ray_trafo.geometry.motion_params.length
+    geometry = ray_trafo.geometry
+    src_radius = geometry.src_radius
+    det_radius = geometry.det_radius
+    min_rot_angle = geometry.motion_partition.min_pt
+    alen = geometry.motion_params.length
+    dtype = ray_trafo.range.dtype
 
     # Parker weightings are not defined for helical geometries
-    if ray_trafo.geometry.ndim != 2:
-        pitch = ray_trafo.geometry.pitch
+    if geometry.ndim != 2:
+        pitch = geometry.pitch
         if pitch != 0:
             raise ValueError('Parker weighting window is only defined with '
                              '`pitch==0`')
 
     # Find distance from projection of rotation axis for each pixel
-    if ndim == 2:
-        dx = ray_trafo.range.meshgrid[1]
-    elif ndim == 3:
-        # Find projection of axis on detector
-        rot_dir = _rotation_direction_in_detector(ray_trafo.geometry)
-        # If axis is aligned to a coordinate axis, save some memory and time by
-        # using broadcasting
-        if rot_dir[0] == 0:
-            dx = rot_dir[1] * ray_trafo.range.meshgrid[2]
-        elif rot_dir[1] == 0:
-            dx = rot_dir[0] * ray_trafo.range.meshgrid[1]
-        else:
-            dx = (rot_dir[0] * ray_trafo.range.meshgrid[1] +
-                  rot_dir[1] * ray_trafo.range.meshgrid[2])
+    dx = _rotation_distance_in_detector(ray_trafo)
 
     # Compute parameters
     dx_abs_max = np.max(np.abs(dx))
@@ -270,79 +326,62 @@ def parker_weighting(ray_trafo, q=0.25):
     if epsilon < 0:
         raise Exception('data not sufficiently sampled for parker weighting')
 
-    # Define utility functions
-    def S(betap):
-        return (0.5 * (1.0 + np.sin(np.pi * betap)) * (np.abs(betap) < 0.5) +
-                (betap >= 0.5))
-
-    def b(alpha):
-        return q * (2 * delta - 2 * alpha + epsilon)
-
-    # Create weighting function
-    beta = np.asarray(angles - min_rot_angle,
-                      dtype=ray_trafo.range.dtype)  # rotation angle
-    alpha = np.asarray(np.arctan2(dx, src_radius + det_radius),
-                       dtype=ray_trafo.range.dtype)
-
-    # Compute sum in place to save memory
-    S_sum = S(beta / b(alpha) - 0.5)
-    S_sum += S((beta - 2 * delta + 2 * alpha - epsilon) / b(alpha) + 0.5)
-    S_sum -= S((beta - np.pi + 2 * alpha) / b(-alpha) - 0.5)
-    S_sum -= S((beta - np.pi - 2 * delta - epsilon) / b(-alpha) + 0.5)
-
-    scale = 0.5 * alen / np.pi
-    return ray_trafo.range.element(S_sum * scale)
-
-
-def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
-                  frequency_scaling=1.0):
-    """Create a filter operator for FBP from a `RayTransform`.
+    def weights():
+        # Rotation angle, varying along the angle axis only, and fan angle,
+        # varying along the detector axes only. The weights are computed
+        # on their broadcast shape, which is smaller than the full shape
+        # if the rotation direction is aligned with a detector axis.
+        beta = np.asarray(ray_trafo.range.meshgrid[0] - min_rot_angle,
+                          dtype=dtype)
+        alpha = np.asarray(np.arctan2(dx, src_radius + det_radius),
+                           dtype=dtype)
+
+        # Reciprocals of b(alpha) = q * (2 * delta - 2 * alpha + epsilon)
+        # and b(-alpha)
+        inv_b_pos = 1 / (q * (2 * delta - 2 * alpha + epsilon))
+        inv_b_neg = 1 / (q * (2 * delta + 2 * alpha + epsilon))
+
+        # Compute sum in place to save memory
+        S_sum = _parker_s(beta * inv_b_pos - 0.5)
+        S_sum += _parker_s(
+            (beta - 2 * delta + 2 * alpha - epsilon) * inv_b_pos + 0.5)
+        S_sum -= _parker_s((beta - np.pi + 2 * alpha) * inv_b_neg - 0.5)
+        S_sum -= _parker_s(
+            (beta - np.pi - 2 * delta - epsilon) * inv_b_neg + 0.5)
+
+        S_sum *= 0.5 * alen / np.pi
+        return S_sum
+
+    key = ('parker_weighting', float(q), dtype)
+    S_sum = _cached_geometry_array(geometry, key, weights)
+    # Copy since the cached array is shared
+    return ray_trafo.range.element(
+        np.broadcast_to(S_sum, ray_trafo.range.shape).copy())
+
+
+def _fbp_fourier_and_filter(ray_trafo, space, padding, filter_type,
+                            frequency_scaling):
+    """Return the (padded) Fourier transform and the filter function.
 
     Parameters
     ----------
     ray_trafo : `RayTransform`
-        The ray transform (forward operator) whose approximate inverse should
-        be computed. Its geometry has to be any of the following
-
-        `Parallel2DGeometry` : Exact reconstruction
-
-        `Parallel3dAxisGeometry` : Exact reconstruction
-
-        `FanFlatGeometry` : Approximate reconstruction, correct in limit of fan
-        angle = 0.
-
-        `CircularConeFlatGeometry` : Approximate reconstruction, correct in
-        limit of fan angle = 0 and cone angle = 0.
-
-        `HelicalConeFlatGeometry` : Very approximate unless a
-        `tam_danielson_window` is used. Accurate with the window.
-
-        Other geometries: Not supported
-
-    padding : bool, optional
-        If the data space should be zero padded. Without padding, the data may
-        be corrupted due to the circular convolution used. Using padding makes
-        the algorithm slower.
-    filter_type : string, optional
-        The type of filter to be used. The options are, approximate order from
-        most noise senstive to least noise sensitive: 'Ram-Lak', 'Shepp-Logan',
-        'Cosine', 'Hamming' and 'Hann'.
-    frequency_scaling : float, optional
-        Relative cutoff frequency for the filter.
-        The normalized frequencies are rescaled so that they fit into the range
-        [0, frequency_scaling]. Any frequency above ``frequency_scaling`` is
-        set to zero.
+        The ray transform for which the filter is created.
+    space : `DiscreteLp`
+        Space of the data to be filtered. Its detector axes must be
+        those of ``ray_trafo.range``, while the angle axis is arbitrary.
+    padding, filter_type, frequency_scaling
+        See `fbp_filter_op`.
 
     Returns
     -------
-    filter_op : `Operator`
-        Filtering operator for FBP based on ``ray_trafo``.
-
-    See Also
-    --------
-    tam_danielson_window : Windowing for helical data
+    fourier : `Operator`
+        Fourier transform along the detector axes, possibly composed
+        with a zero-padding operator, with domain ``space``.
+    fourier_filter : callable
+        Function of the frequency meshgrid of ``fourier.range`` that
+        returns the filter.
     """
-    impl = 'pyfftw' if PYFFTW_AVAILABLE else 'numpy'
     alen = ray_trafo.geometry.motion_params.length
 
     if ray_trafo.domain.ndim == 2:
@@ -357,14 +396,14 @@ def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
         # Define (padded) fourier transform
         if padding:
             # Define padding operator
-            ran_shp = (ray_trafo.range.shape[0],
-                       ray_trafo.range.shape[1] * 2 - 1)
-            resizing = ResizingOperator(ray_trafo.range, ran_shp=ran_shp)
+            ran_shp = (space.shape[0],
+                       space.shape[1] * 2 - 1)
+            resizing = ResizingOperator(space, ran_shp=ran_shp)
 
-            fourier = FourierTransform(resizing.range, axes=1, impl=impl)
+            fourier = FourierTransform(resizing.range, axes=1)
             fourier = fourier * resizing
         else:
-            fourier = FourierTransform(ray_trafo.range, axes=1, impl=impl)
+            fourier = FourierTransform(space, axes=1)
 
     elif ray_trafo.domain.ndim == 3:
         # Find the direction that the filter should be taken in
@@ -414,36 +453,337 @@ def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
         if padding:
             # Define padding operator
             if used_axes[0]:
-                padded_shape_u = ray_trafo.range.shape[1] * 2 - 1
+                padded_shape_u = space.shape[1] * 2 - 1
             else:
-                padded_shape_u = ray_trafo.range.shape[1]
+                padded_shape_u = space.shape[1]
 
             if used_axes[1]:
-                padded_shape_v = ray_trafo.range.shape[2] * 2 - 1
+                padded_shape_v = space.shape[2] * 2 - 1
             else:
-                padded_shape_v = ray_trafo.range.shape[2]
+                padded_shape_v = space.shape[2]
 
-            ran_shp = (ray_trafo.range.shape[0],
+            ran_shp = (space.shape[0],
                        padded_shape_u,
                        padded_shape_v)
-            resizing = ResizingOperator(ray_trafo.range, ran_shp=ran_shp)
+            resizing = ResizingOperator(space, ran_shp=ran_shp)
 
-            fourier = FourierTransform(resizing.range, axes=axes, impl=impl)
+            fourier = FourierTransform(resizing.range, axes=axes)
             fourier = fourier * resizing
         else:
-            fourier = FourierTransform(ray_trafo.range, axes=axes, impl=impl)
+            fourier = FourierTransform(space, axes=axes)
     else:
         raise NotImplementedError('FBP only implemented in 2d and 3d')
 
+    return fourier, fourier_filter
+
+
+def _cached_fbp_filter_array(geometry, fourier, fourier_filter, padding,
+                             filter_type, frequency_scaling):
+    """Return the filter as array broadcastable to ``fourier.range``.
+
+    The array only extends along the detector axes and is stored in
+    ``geometry.implementation_cache``.
+    """
+    key = ('fbp_filter', filter_type, float(frequency_scaling), bool(padding),
+           fourier.range.shape[1:], fourier.range.dtype)
+    return _cached_geometry_array(
+        geometry, key,
+        lambda: np.array(fourier_filter(fourier.range.meshgrid),
+                         dtype=real_dtype(fourier.range.dtype), ndmin=1))
+
+
+class _ChunkedFBPFilter(Operator):
+
+    """FBP filter that processes the data in chunks of angles.
+
+    Each chunk is weighted, Fourier transformed along the detector axes,
+    filtered and transformed back in one pass, such that only a few
+    chunk-sized temporaries exist at a time. Chunks can be processed in
+    parallel by several threads.
+    """
+
+    def __init__(self, ray_trafo, padding, filter_type, frequency_scaling,
+                 weighting, chunk_size, threads):
+        """Initialize a new instance.
+
+        See `fbp_filter_op` for a description of the parameters.
+        """
+        super().__init__(ray_trafo.range, ray_trafo.range, linear=True)
+        num_angles = ray_trafo.range.shape[0]
+        self.__chunk_size = max(1, min(int(chunk_size), num_angles))
+        self.__threads = int(threads)
+        if self.threads < 1:
+            raise ValueError('`threads` must be positive, got {}'
+                             ''.format(threads))
+        self.__weighting = (None if weighting is None else
+                            ray_trafo.range.element(weighting))
+
+        # The operators only depend on the number of angles in a chunk,
+        # which takes at most two different values
+        det_part = ray_trafo.range.partition.byaxis[1:]
+        self._chunk_ops = {}
+        for length in set([self.chunk_size, num_angles % self.chunk_size]):
+            if length == 0:
+                continue
+            part = uniform_partition(0, 1, length).append(det_part)
+            space = uniform_discr_frompartition(
+                part, dtype=ray_trafo.range.dtype, weighting='none')
+            fourier, fourier_filter = _fbp_fourier_and_filter(
+                ray_trafo, space, padding, filter_type, frequency_scaling)
+            filt = _cached_fbp_filter_array(
+                ray_trafo.geometry, fourier, fourier_filter, padding,
+                filter_type, frequency_scaling)
+            self._chunk_ops[length] = (fourier, fourier.inverse, filt)
+
+    @property
+    def chunk_size(self):
+        """Number of angles processed in one pass."""
+        return self.__chunk_size
+
+    @property
+    def threads(self):
+        """Number of threads processing chunks in parallel."""
+        return self.__threads
+
+    @property
+    def weighting(self):
+        """Weighting applied to the data before filtering, or ``None``."""
+        return self.__weighting
+
+    def _filter_chunk(self, x_arr, w_arr, slc):
+        """Return the filtered chunk ``slc`` of ``x_arr`` as array.
+
+        If given, ``w_arr`` is multiplied with the chunk before filtering.
+        """
+        chunk = x_arr[slc]
+        if w_arr is not None:
+            chunk = chunk * w_arr[slc]
+        fourier, ifourier, filt = self._chunk_ops[chunk.shape[0]]
+        chunk_f = fourier(chunk)
+        chunk_f = fourier.range.element(chunk_f.asarray() * filt)
+        return ifourier(chunk_f).asarray()
+
+    def _call(self, x, out):
+        """Filter ``x`` chunk by chunk and write the result to ``out``."""
+        x_arr = x.asarray()
+        out_arr = out.asarray()
+        w_arr = None if self.weighting is None else self.weighting.asarray()
+
+        def filter_chunk(slc):
+            out_arr[slc] = self._filter_chunk(x_arr, w_arr, slc)
+
+        slices = _angle_slices(self.domain.shape[0], self.chunk_size)
+        num_threads = min(self.threads, len(slices))
+        if num_threads == 1 or in_worker_thread():
+            for slc in slices:
+                filter_chunk(slc)
+        else:
+            thread_pool(num_threads).map(filter_chunk, slices)
+
+        if not np.may_share_memory(out_arr, out.asarray()):
+            out[:] = out_arr
+
+
+def _angle_slices(num_angles, block_size):
+    """Return slices splitting ``num_angles`` into blocks."""
+    return [slice(i, min(i + block_size, num_angles))
+            for i in range(0, num_angles, block_size)]
+
+
+def _angle_block_backprojection(ray_trafo, slc):
+    """Return the back-projection for the angles ``slc`` of ``ray_trafo``.
+
+    The geometry of the returned operator is that of ``ray_trafo``
+    restricted to the angles ``slc``. Its domain has the same weighting
+    as ``ray_trafo.range``, such that the back-projections of all blocks
+    sum up to ``ray_trafo.adjoint``.
+    """
+    geometry = ray_trafo.geometry.motion_subset(slc)
+
+    proj_space = ray_trafo.range
+    block_dspace = proj_space.dspace_type(
+        geometry.partition.size, weighting=proj_space.weighting,
+        dtype=proj_space.dtype)
+    block_space = DiscreteLp(
+        FunctionSpace(geometry.params, out_dtype=proj_space.dtype),
+        geometry.partition, block_dspace, exponent=proj_space.exponent,
+        interp=proj_space.interp, order=proj_space.order,
+        axis_labels=proj_space.axis_labels)
+
+    return RayBackProjection(ray_trafo.domain, geometry, domain=block_space,
+                             impl=ray_trafo.impl,
+                             use_cache=ray_trafo.use_cache,
+                             threads=ray_trafo.threads)
+
+
+class _StreamingFBP(Operator):
+
+    """FBP that filters and back-projects one block of angles at a time.
+
+    The filtered projection stack is never formed as a whole; instead,
+    each filtered block is back-projected and accumulated into the
+    reconstruction right away. Optionally, the next block is filtered
+    in a separate thread while the current one is back-projected.
+    """
+
+    def __init__(self, ray_trafo, filter_op, overlap):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        ray_trafo : `RayTransform`
+            The ray transform whose approximate inverse is computed.
+        filter_op : `_ChunkedFBPFilter`
+            Filter operator, its `_ChunkedFBPFilter.chunk_size` is used
+            as block size.
+        overlap : bool
+            If ``True``, filter the next block while back-projecting the
+            current one.
+        """
+        super().__init__(ray_trafo.range, ray_trafo.domain, linear=True)
+        self.__filter_op = filter_op
+        self.__overlap = bool(overlap)
+        self._blocks = [
+            (slc, _angle_block_backprojection(ray_trafo, slc))
+            for slc in _angle_slices(ray_trafo.range.shape[0],
+                                     filter_op.chunk_size)]
+
+    @property
+    def filter_op(self):
+        """Filter applied to each block before back-projection."""
+        return self.__filter_op
+
+    @property
+    def block_size(self):
+        """Number of angles processed in one block."""
+        return self.filter_op.chunk_size
+
+    @property
+    def overlap(self):
+        """Whether filtering and back-projection run concurrently."""
+        return self.__overlap
+
+    def _call(self, x, out):
+        """Reconstruct from ``x`` block by block and store it in ``out``."""
+        x_arr = x.asarray()
+        weighting = self.filter_op.weighting
+        w_arr = None if weighting is None else weighting.asarray()
+
+        def filter_block(slc):
+            return self.filter_op._filter_chunk(x_arr, w_arr, slc)
+
+        # Filter in the shared pool unless this already runs in one of
+        # its workers, where waiting for the pool could deadlock
+        if self.overlap and not in_worker_thread():
+            pool = thread_pool(1)
+            pending = pool.apply_async(filter_block, (self._blocks[0][0],))
+        else:
+            pool = None
+
+        with borrow_element(self.range) as tmp:
+            for i, (slc, backproj) in enumerate(self._blocks):
+                if pool is None:
+                    block = filter_block(slc)
+                else:
+                    block = pending.get()
+                    if i + 1 < len(self._blocks):
+                        pending = pool.apply_async(
+                            filter_block, (self._blocks[i + 1][0],))
+
+                # The first block initializes ``out``, whose contents
+                # may be arbitrary, in particular NaN
+                if i == 0:
+                    backproj(block, out=out)
+                else:
+                    backproj(block, out=tmp)
+                    out += tmp
+
+
+def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
+                  frequency_scaling=1.0, weighting=None, chunk_size=None,
+                  threads=1):
+    """Create a filter operator for FBP from a `RayTransform`.
+
+    Parameters
+    ----------
+    ray_trafo : `RayTransform`
+        The ray transform (forward operator) whose approximate inverse should
+        be computed. Its geometry has to be any of the following
+
+        `Parallel2DGeometry` : Exact reconstruction
+
+        `Parallel3dAxisGeometry` : Exact reconstruction
+
+        `FanFlatGeometry` : Approximate reconstruction, correct in limit of fan
+        angle = 0.
+
+        `CircularConeFlatGeometry` : Approximate reconstruction, correct in
+        limit of fan angle = 0 and cone angle = 0.
+
+        `HelicalConeFlatGeometry` : Very approximate unless a
+        `tam_danielson_window` is used. Accurate with the window.
+
+        Other geometries: Not supported
+
+    padding : bool, optional
+        If the data space should be zero padded. Without padding, the data may
+        be corrupted due to the circular convolution used. Using padding makes
+        the algorithm slower.
+    filter_type : string, optional
+        The type of filter to be used. The options are, approximate order from
+        most noise senstive to least noise sensitive: 'Ram-Lak', 'Shepp-Logan',
+        'Cosine', 'Hamming' and 'Hann'.
+    frequency_scaling : float, optional
+        Relative cutoff frequency for the filter.
+        The normalized frequencies are rescaled so that they fit into the range
+        [0, frequency_scaling]. Any frequency above ``frequency_scaling`` is
+        set to zero.
+    weighting : ``ray_trafo.range`` `element-like`, optional
+        Weighting applied to the data before filtering, for instance
+        `parker_weighting` or `tam_danielson_window`.
+    chunk_size : positive int, optional
+        If given, the data is filtered in chunks of this many angles,
+        with the weighting applied in the same pass. This reduces the
+        memory footprint to a few chunk-sized temporaries.
+        Default: ``None`` (filter all angles at once) if ``threads``
+        is 1, otherwise an even split of the angles across threads.
+    threads : positive int, optional
+        Number of threads filtering chunks in parallel.
+
+    Returns
+    -------
+    filter_op : `Operator`
+        Filtering operator for FBP based on ``ray_trafo``.
+
+    See Also
+    --------
+    tam_danielson_window : Windowing for helical data
+    parker_weighting : Weighting for short scan data
+    """
+    if chunk_size is None and threads != 1:
+        chunk_size = -(-ray_trafo.range.shape[0] // int(threads))
+
+    if chunk_size is not None:
+        return _ChunkedFBPFilter(ray_trafo, padding, filter_type,
+                                 frequency_scaling, weighting, chunk_size,
+                                 threads)
+
+    fourier, fourier_filter = _fbp_fourier_and_filter(
+        ray_trafo, ray_trafo.range, padding, filter_type, frequency_scaling)
+
     # Create ramp in the detector direction
     ramp_function = fourier.range.element(fourier_filter)
 
     # Create ramp filter via the convolution formula with fourier transforms
-    return fourier.inverse * ramp_function * fourier
+    filter_op = fourier.inverse * ramp_function * fourier
+    if weighting is not None:
+        filter_op = filter_op * ray_trafo.range.element(weighting)
+    return filter_op
 
 
 def fbp_op(ray_trafo, padding=True, filter_type='Ram-Lak',
-           frequency_scaling=1.0):
+           frequency_scaling=1.0, weighting=None, chunk_size=None, threads=1,
+           block_size=None, overlap=False):
     """Create filtered back-projection operator from a `RayTransform`.
 
     The filtered back-projection is an approximate inverse to the ray
@@ -483,6 +823,23 @@ def fbp_op(ray_trafo, padding=True, filter_type='Ram-Lak',
         The normalized frequencies are rescaled so that they fit into the range
         [0, frequency_scaling]. Any frequency above ``frequency_scaling`` is
         set to zero.
+    weighting : ``ray_trafo.range`` `element-like`, optional
+        Weighting applied to the data before filtering, for instance
+        `parker_weighting` or `tam_danielson_window`.
+    chunk_size : positive int, optional
+        Number of angles filtered in one pass, see `fbp_filter_op`.
+    threads : positive int, optional
+        Number of threads used for filtering, see `fbp_filter_op`.
+    block_size : positive int, optional
+        If given, the data is filtered and back-projected in blocks of
+        this many angles, and the back-projections are accumulated in
+        the result. Only a few blocks of filtered data are held in
+        memory at any time, which allows reconstructing from very long
+        scans. This option cannot be combined with ``chunk_size`` or
+        ``threads``.
+    overlap : bool, optional
+        If ``True`` and ``block_size`` is given, filter the next block
+        in a separate thread while the current one is back-projected.
 
     Returns
     -------
@@ -493,8 +850,18 @@ def fbp_op(ray_trafo, padding=True, filter_type='Ram-Lak',
     --------
     tam_danielson_window : Windowing for helical data
     """
-    return ray_trafo.adjoint * fbp_filter_op(ray_trafo, padding, filter_type,
-                                             frequency_scaling)
+    if block_size is not None:
+        if chunk_size is not None or threads != 1:
+            raise ValueError('`block_size` cannot be combined with '
+                             '`chunk_size` or `threads`')
+        filter_op = _ChunkedFBPFilter(ray_trafo, padding, filter_type,
+                                      frequency_scaling, weighting,
+                                      block_size, threads=1)
+        return _StreamingFBP(ray_trafo, filter_op, overlap)
+
+    return ray_trafo.adjoint * fbp_filter_op(
+        ray_trafo, padding, filter_type, frequency_scaling,
+        weighting=weighting, chunk_size=chunk_size, threads=threads)
 
 
 if __name__ == '__main__':
@@ -25,3 +25,6 @@ __all__ += astra_cuda.__all__
 
 from .skimage_radon import *
 __all__ += skimage_radon.__all__
+
+from .numpy_ray_trafo import *
+__all__ += numpy_ray_trafo.__all__
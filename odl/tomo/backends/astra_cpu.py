@@ -13,6 +13,9 @@ from __future__ import print_function, division, absolute_import
 from future import standard_library
 standard_library.install_aliases()
 
+from collections import OrderedDict
+import numpy as np
+from threading import Lock
 try:
     import astra
 except ImportError:
@@ -23,16 +26,269 @@ from odl.tomo.backends.astra_setup import (
     astra_projection_geometry, astra_volume_geometry, astra_data,
     astra_projector, astra_algorithm)
 from odl.tomo.geometry import Geometry
-from odl.util import writable_array
 
 
-__all__ = ('astra_cpu_forward_projector', 'astra_cpu_back_projector')
+__all__ = ('astra_cpu_forward_projector', 'astra_cpu_back_projector',
+           'AstraCpuProjectorImpl', 'AstraCpuCache', 'astra_cpu_cache')
 
 
-# TODO: use context manager when creating data structures
-# TODO: is magnification scaling at the right place?
+# Maximum number of projector handles kept alive per geometry
+ASTRA_CPU_CACHE_SIZE = 8
 
-def astra_cpu_forward_projector(vol_data, geometry, proj_space, out=None):
+
+class AstraCpuProjectorImpl(object):
+
+    """Thin wrapper around ASTRA keeping CPU objects alive between calls.
+
+    The ASTRA geometries, projector, data objects and algorithm are
+    created once and reused for each call. Data are copied into and out
+    of internal ``float32`` arrays linked to the ASTRA data objects.
+    """
+
+    def __init__(self, direction, geometry, reco_space, proj_space,
+                 interp):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        direction : {'forward', 'backward'}
+            Create a forward projector if 'forward', otherwise a
+            back-projector.
+        geometry : `Geometry`
+            Geometry defining the tomographic setup.
+        reco_space : `DiscreteLp`
+            Reconstruction space, the domain of the forward projector.
+        proj_space : `DiscreteLp`
+            Projection space, the range of the forward projector.
+        interp : {'nearest', 'linear'}
+            Interpolation type used to select the ASTRA projector.
+        """
+        # Set first such that `delete` works if creation fails
+        self.algo_id = self.vol_id = self.sino_id = self.proj_id = None
+        # Guards the ASTRA objects and internal arrays against concurrent
+        # calls and deletion
+        self.lock = Lock()
+
+        assert direction in ('forward', 'backward')
+        assert isinstance(geometry, Geometry)
+        assert isinstance(reco_space, DiscreteLp)
+        assert isinstance(proj_space, DiscreteLp)
+
+        self.direction = direction
+        self.geometry = geometry
+        self.reco_space = reco_space
+        self.proj_space = proj_space
+        self.interp = interp
+
+        self.create_ids()
+
+    def create_ids(self):
+        """Create ASTRA objects."""
+        ndim = self.geometry.ndim
+
+        self.vol_array = np.zeros(self.reco_space.shape, dtype='float32',
+                                  order='C')
+        self.sino_array = np.zeros(self.proj_space.shape, dtype='float32',
+                                   order='C')
+
+        vol_geom = astra_volume_geometry(self.reco_space)
+        proj_geom = astra_projection_geometry(self.geometry)
+        self.proj_id = astra_projector(self.interp, vol_geom, proj_geom, ndim,
+                                       impl='cpu')
+        self.vol_id = astra_data(vol_geom, datatype='volume',
+                                 data=self.vol_array, ndim=ndim)
+        self.sino_id = astra_data(proj_geom, datatype='projection',
+                                  data=self.sino_array, ndim=ndim)
+        self.algo_id = astra_algorithm(self.direction, ndim, self.vol_id,
+                                       self.sino_id, self.proj_id,
+                                       impl='cpu')
+
+    def __call__(self, x, out):
+        """Run the ASTRA algorithm on ``x`` and write the result to ``out``.
+
+        Parameters
+        ----------
+        x : `DiscreteLpElement`
+            Input data, an element of ``reco_space`` for the forward
+            and of ``proj_space`` for the backward direction.
+        out : `DiscreteLpElement`
+            Element to which the result is written.
+
+        Returns
+        -------
+        out : `DiscreteLpElement`
+            The ``out`` parameter.
+        """
+        if self.direction == 'forward':
+            in_array, out_array = self.vol_array, self.sino_array
+        else:
+            in_array, out_array = self.sino_array, self.vol_array
+
+        with self.lock:
+            if self.algo_id is None:
+                # Deleted after eviction from a cache while still in use
+                self.create_ids()
+            in_array[:] = x.asarray()
+            astra.algorithm.run(self.algo_id)
+            out[:] = out_array
+
+        return out
+
+    def delete(self):
+        """Delete the ASTRA objects of this instance.
+
+        This waits for a running call to finish. A later call creates
+        the ASTRA objects anew.
+        """
+        with self.lock:
+            if self.algo_id is not None:
+                astra.algorithm.delete(self.algo_id)
+                self.algo_id = None
+            if self.vol_id is not None:
+                astra.data2d.delete(self.vol_id)
+                self.vol_id = None
+            if self.sino_id is not None:
+                astra.data2d.delete(self.sino_id)
+                self.sino_id = None
+            if self.proj_id is not None:
+                astra.projector.delete(self.proj_id)
+                self.proj_id = None
+
+    def __del__(self):
+        """Delete ASTRA objects."""
+        self.delete()
+
+
+class AstraCpuCache(object):
+
+    """Bounded cache of `AstraCpuProjectorImpl` objects.
+
+    Entries are keyed by direction, reconstruction space, projection
+    space and interpolation. If the cache is full, the least recently
+    used entry is evicted and its ASTRA objects are deleted.
+
+    Lookup, insertion and eviction are thread-safe. Evicted entries are
+    deleted only once running calls on them have finished.
+    """
+
+    def __init__(self, max_size=ASTRA_CPU_CACHE_SIZE):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        max_size : positive int, optional
+            Maximum number of projector handles kept alive.
+        """
+        self.__max_size = int(max_size)
+        if self.max_size < 1:
+            raise ValueError('`max_size` must be positive, got {}'
+                             ''.format(max_size))
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = Lock()
+
+    @property
+    def max_size(self):
+        """Maximum number of entries in this cache."""
+        return self.__max_size
+
+    @property
+    def hits(self):
+        """Number of lookups that found an existing entry."""
+        return self.__hits
+
+    @property
+    def misses(self):
+        """Number of lookups that created a new entry."""
+        return self.__misses
+
+    def __len__(self):
+        """Return ``len(self)``."""
+        return len(self.__entries)
+
+    def get(self, direction, geometry, reco_space, proj_space, interp):
+        """Return a projector handle, creating it if necessary.
+
+        Parameters
+        ----------
+        direction : {'forward', 'backward'}
+            Direction of the projector.
+        geometry : `Geometry`
+            Geometry defining the tomographic setup.
+        reco_space, proj_space : `DiscreteLp`
+            Reconstruction and projection spaces.
+        interp : {'nearest', 'linear'}
+            Interpolation type used to select the ASTRA projector.
+
+        Returns
+        -------
+        handle : `AstraCpuProjectorImpl`
+        """
+        key = (direction, reco_space, proj_space, interp)
+        evicted = []
+        with self.__lock:
+            try:
+                handle = self.__entries.pop(key)
+            except KeyError:
+                self.__misses += 1
+                handle = AstraCpuProjectorImpl(direction, geometry,
+                                               reco_space, proj_space, interp)
+                while len(self.__entries) >= self.max_size:
+                    evicted.append(self.__entries.popitem(last=False)[1])
+            else:
+                self.__hits += 1
+
+            # (Re-)insert as most recently used entry
+            self.__entries[key] = handle
+
+        # Outside of the cache lock since this waits for running calls
+        for old_handle in evicted:
+            old_handle.delete()
+
+        return handle
+
+    def clear(self):
+        """Delete all entries and their ASTRA objects."""
+        with self.__lock:
+            handles = list(self.__entries.values())
+            self.__entries.clear()
+
+        for handle in handles:
+            handle.delete()
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{}(max_size={})'.format(self.__class__.__name__,
+                                        self.max_size)
+
+
+def astra_cpu_cache(geometry):
+    """Return the ASTRA CPU projector cache of ``geometry``.
+
+    The cache is stored in `Geometry.implementation_cache` and created
+    on first access, such that its lifetime is bound to the geometry.
+
+    Parameters
+    ----------
+    geometry : `Geometry`
+        Geometry whose cache should be returned.
+
+    Returns
+    -------
+    cache : `AstraCpuCache`
+    """
+    try:
+        return geometry.implementation_cache['astra_cpu']
+    except KeyError:
+        # `setdefault` is atomic, hence concurrent callers get the same
+        # cache
+        return geometry.implementation_cache.setdefault('astra_cpu',
+                                                        AstraCpuCache())
+
+
+def astra_cpu_forward_projector(vol_data, geometry, proj_space, out=None,
+                                use_cache=False):
     """Run an ASTRA forward projection on the given data using the CPU.
 
     Parameters
@@ -46,6 +302,10 @@ def astra_cpu_forward_projector(vol_data, geometry, proj_space, out=None):
     out : ``proj_space`` element, optional
         Element of the projection space to which the result is written. If
         ``None``, an element in ``proj_space`` is created.
+    use_cache : bool, optional
+        If ``True``, reuse the ASTRA objects stored in the
+        `astra_cpu_cache` of ``geometry``, creating them if necessary.
+        Otherwise, they are created for this call only.
 
     Returns
     -------
@@ -80,45 +340,29 @@ def astra_cpu_forward_projector(vol_data, geometry, proj_space, out=None):
             raise TypeError('`out` {} is neither None nor a '
                             'DiscreteLpElement instance'.format(out))
 
-    ndim = vol_data.ndim
-
-    # Create astra geometries
-    vol_geom = astra_volume_geometry(vol_data.space)
-    proj_geom = astra_projection_geometry(geometry)
-
-    # Create projector
     if not all(s == vol_data.space.interp_byaxis[0]
                for s in vol_data.space.interp_byaxis):
         raise ValueError('volume interpolation must be the same in each '
                          'dimension, got {}'.format(vol_data.space.interp))
     vol_interp = vol_data.space.interp
-    proj_id = astra_projector(vol_interp, vol_geom, proj_geom, ndim,
-                              impl='cpu')
-
-    # Create ASTRA data structures
-    vol_id = astra_data(vol_geom, datatype='volume', data=vol_data,
-                        allow_copy=True)
-
-    with writable_array(out, dtype='float32', order='C') as arr:
-        sino_id = astra_data(proj_geom, datatype='projection', data=arr,
-                             ndim=proj_space.ndim)
-
-        # Create algorithm
-        algo_id = astra_algorithm('forward', ndim, vol_id, sino_id, proj_id,
-                                  impl='cpu')
-
-        # Run algorithm
-        astra.algorithm.run(algo_id)
 
-    # Delete ASTRA objects
-    astra.algorithm.delete(algo_id)
-    astra.data2d.delete((vol_id, sino_id))
-    astra.projector.delete(proj_id)
+    if use_cache:
+        projector = astra_cpu_cache(geometry).get(
+            'forward', geometry, vol_data.space, proj_space, vol_interp)
+        projector(vol_data, out)
+    else:
+        projector = AstraCpuProjectorImpl(
+            'forward', geometry, vol_data.space, proj_space, vol_interp)
+        try:
+            projector(vol_data, out)
+        finally:
+            projector.delete()
 
     return out
 
 
-def astra_cpu_back_projector(proj_data, geometry, reco_space, out=None):
+def astra_cpu_back_projector(proj_data, geometry, reco_space, out=None,
+                             use_cache=False):
     """Run an ASTRA back-projection on the given data using the CPU.
 
     Parameters
@@ -132,6 +376,10 @@ def astra_cpu_back_projector(proj_data, geometry, reco_space, out=None):
     out : ``reco_space`` element, optional
         Element of the reconstruction space to which the result is written.
         If ``None``, an element in ``reco_space`` is created.
+    use_cache : bool, optional
+        If ``True``, reuse the ASTRA objects stored in the
+        `astra_cpu_cache` of ``geometry``, creating them if necessary.
+        Otherwise, they are created for this call only.
 
     Returns
     -------
@@ -167,17 +415,6 @@ def astra_cpu_back_projector(proj_data, geometry, reco_space, out=None):
             raise TypeError('`out` {} is neither None nor a '
                             'DiscreteLpElement instance'.format(out))
 
-    ndim = proj_data.ndim
-
-    # Create astra geometries
-    vol_geom = astra_volume_geometry(reco_space)
-    proj_geom = astra_projection_geometry(geometry)
-
-    # Create ASTRA data structure
-    sino_id = astra_data(proj_geom, datatype='projection', data=proj_data,
-                         allow_copy=True)
-
-    # Create projector
     # TODO: implement with different schemes for angles and detector
     if not all(s == proj_data.space.interp_byaxis[0]
                for s in proj_data.space.interp_byaxis):
@@ -185,19 +422,18 @@ def astra_cpu_back_projector(proj_data, geometry, reco_space, out=None):
                          'dimension, got {}'
                          ''.format(proj_data.space.interp_byaxis))
     proj_interp = proj_data.space.interp
-    proj_id = astra_projector(proj_interp, vol_geom, proj_geom, ndim,
-                              impl='cpu')
 
-    # convert out to correct dtype and order if needed
-    with writable_array(out, dtype='float32', order='C') as arr:
-        vol_id = astra_data(vol_geom, datatype='volume', data=arr,
-                            ndim=reco_space.ndim)
-        # Create algorithm
-        algo_id = astra_algorithm('backward', ndim, vol_id, sino_id, proj_id,
-                                  impl='cpu')
-
-        # Run algorithm and delete it
-        astra.algorithm.run(algo_id)
+    if use_cache:
+        projector = astra_cpu_cache(geometry).get(
+            'backward', geometry, reco_space, proj_data.space, proj_interp)
+        projector(proj_data, out)
+    else:
+        projector = AstraCpuProjectorImpl(
+            'backward', geometry, reco_space, proj_data.space, proj_interp)
+        try:
+            projector(proj_data, out)
+        finally:
+            projector.delete()
 
     # Weight the adjoint by appropriate weights
     scaling_factor = float(proj_data.space.weighting.const)
@@ -205,11 +441,6 @@ def astra_cpu_back_projector(proj_data, geometry, reco_space, out=None):
 
     out *= scaling_factor
 
-    # Delete ASTRA objects
-    astra.algorithm.delete(algo_id)
-    astra.data2d.delete((vol_id, sino_id))
-    astra.projector.delete(proj_id)
-
     return out
 
 
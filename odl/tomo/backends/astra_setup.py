@@ -228,26 +228,32 @@ def astra_conebeam_3d_geom_to_vec(geometry):
     Returns
     -------
     vectors : `numpy.ndarray`
-        Numpy array of shape ``(number of angles, 12)``
+        Numpy array of shape ``(number of angles, 12)``. It is cached
+        in the `Geometry.implementation_cache` and should not be
+        modified.
     """
+    cache_key = 'astra_conebeam_3d_vec'
+    if cache_key in geometry.implementation_cache:
+        return geometry.implementation_cache[cache_key]
+
+    # All quantities are evaluated for all angles at once, with one row
+    # per angle
     angles = geometry.angles
     vectors = np.zeros((angles.size, 12))
+    rot_matrices = geometry.rotation_matrix(angles)
 
-    for ang_idx, angle in enumerate(angles):
-        rot_matrix = geometry.rotation_matrix(angle)
-
-        # source position
-        vectors[ang_idx, 0:3] = geometry.src_position(angle)
+    # source position
+    vectors[:, 0:3] = geometry.src_position(angles)
 
-        # center of detector
-        mid_pt = geometry.det_params.mid_pt
-        vectors[ang_idx, 3:6] = geometry.det_point_position(angle, mid_pt)
+    # center of detector
+    mid_pt = geometry.det_params.mid_pt
+    vectors[:, 3:6] = geometry.det_point_position(angles, mid_pt)
 
-        # vector from detector pixel (0,0) to (0,1)
-        unit_vecs = geometry.detector.axes
-        strides = geometry.det_grid.stride
-        vectors[ang_idx, 6:9] = rot_matrix.dot(unit_vecs[0] * strides[0])
-        vectors[ang_idx, 9:12] = rot_matrix.dot(unit_vecs[1] * strides[1])
+    # vector from detector pixel (0,0) to (0,1)
+    unit_vecs = geometry.detector.axes
+    strides = geometry.det_grid.stride
+    vectors[:, 6:9] = rot_matrices.dot(unit_vecs[0] * strides[0])
+    vectors[:, 9:12] = rot_matrices.dot(unit_vecs[1] * strides[1])
 
     # Astra order, needed for data to match what we expect from astra.
     # Astra has a different axis convention to ODL (z, y, x), so we need
@@ -257,6 +263,7 @@ def astra_conebeam_3d_geom_to_vec(geometry):
         newind += [2 + 3 * i, 1 + 3 * i, 0 + 3 * i]
     vectors = vectors[:, newind]
 
+    geometry.implementation_cache[cache_key] = vectors
     return vectors
 
 
@@ -282,25 +289,31 @@ def astra_conebeam_2d_geom_to_vec(geometry):
     Returns
     -------
     vectors : `numpy.ndarray`
-        Numpy array of shape ``(number of angles, 6)``
+        Numpy array of shape ``(number of angles, 6)``. It is cached
+        in the `Geometry.implementation_cache` and should not be
+        modified.
     """
+    cache_key = 'astra_conebeam_2d_vec'
+    if cache_key in geometry.implementation_cache:
+        return geometry.implementation_cache[cache_key]
+
+    # All quantities are evaluated for all angles at once, with one row
+    # per angle
     angles = geometry.angles
     vectors = np.zeros((angles.size, 6))
+    rot_matrices = geometry.rotation_matrix(angles)
 
-    for ang_idx, angle in enumerate(angles):
-        rot_matrix = geometry.rotation_matrix(angle)
-
-        # source position
-        vectors[ang_idx, 0:2] = geometry.src_position(angle)
+    # source position
+    vectors[:, 0:2] = geometry.src_position(angles)
 
-        # center of detector
-        mid_pt = geometry.det_params.mid_pt
-        vectors[ang_idx, 2:4] = geometry.det_point_position(angle, mid_pt)
+    # center of detector
+    mid_pt = geometry.det_params.mid_pt
+    vectors[:, 2:4] = geometry.det_point_position(angles, mid_pt)
 
-        # vector from detector pixel (0) to (1)
-        unit_vec = geometry.detector.axis
-        strides = geometry.det_grid.stride
-        vectors[ang_idx, 4:6] = rot_matrix.dot(unit_vec * strides[0])
+    # vector from detector pixel (0) to (1)
+    unit_vec = geometry.detector.axis
+    strides = geometry.det_grid.stride
+    vectors[:, 4:6] = rot_matrices.dot(unit_vec * strides[0])
 
     # Astra order, needed for data to match what we expect from astra.
     # Astra has a different axis convention to ODL (z, y, x), so we need
@@ -310,6 +323,7 @@ def astra_conebeam_2d_geom_to_vec(geometry):
         newind += [1 + 2 * i, 0 + 2 * i]
     vectors = vectors[:, newind]
 
+    geometry.implementation_cache[cache_key] = vectors
     return vectors
 
 
@@ -336,27 +350,33 @@ def astra_parallel_3d_geom_to_vec(geometry):
     Returns
     -------
     vectors : `numpy.ndarray`
-        Numpy array of shape ``(number of angles, 12)``
+        Numpy array of shape ``(number of angles, 12)``. It is cached
+        in the `Geometry.implementation_cache` and should not be
+        modified.
     """
+    cache_key = 'astra_parallel_3d_vec'
+    if cache_key in geometry.implementation_cache:
+        return geometry.implementation_cache[cache_key]
+
+    # All quantities are evaluated for all angles at once, with one row
+    # per angle
     angles = geometry.angles
     vectors = np.zeros((angles.size, 12))
+    rot_matrices = geometry.rotation_matrix(angles)
 
-    for ang_idx, angle in enumerate(angles):
-        rot_matrix = geometry.rotation_matrix(angle)
-
-        mid_pt = geometry.det_params.mid_pt
+    mid_pt = geometry.det_params.mid_pt
 
-        # source position
-        vectors[ang_idx, 0:3] = geometry.det_to_src(angle, mid_pt)
+    # source position
+    vectors[:, 0:3] = geometry.det_to_src(angles, mid_pt)
 
-        # center of detector
-        vectors[ang_idx, 3:6] = geometry.det_point_position(angle, mid_pt)
+    # center of detector
+    vectors[:, 3:6] = geometry.det_point_position(angles, mid_pt)
 
-        # vector from detector pixel (0,0) to (0,1)
-        unit_vecs = geometry.detector.axes
-        strides = geometry.det_grid.stride
-        vectors[ang_idx, 6:9] = rot_matrix.dot(unit_vecs[0] * strides[0])
-        vectors[ang_idx, 9:12] = rot_matrix.dot(unit_vecs[1] * strides[1])
+    # vector from detector pixel (0,0) to (0,1)
+    unit_vecs = geometry.detector.axes
+    strides = geometry.det_grid.stride
+    vectors[:, 6:9] = rot_matrices.dot(unit_vecs[0] * strides[0])
+    vectors[:, 9:12] = rot_matrices.dot(unit_vecs[1] * strides[1])
 
     # Astra order, needed for data to match what we expect from astra.
     # Astra has a different axis convention to ODL (z, y, x), so we need
@@ -365,6 +385,8 @@ def astra_parallel_3d_geom_to_vec(geometry):
     for i in range(4):
         new_ind += [2 + 3 * i, 1 + 3 * i, 0 + 3 * i]
     vectors = vectors[:, new_ind]
+
+    geometry.implementation_cache[cache_key] = vectors
     return vectors
 
 
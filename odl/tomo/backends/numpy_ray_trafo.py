@@ -0,0 +1,462 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Ray transform back-end using NumPy only.
+
+The forward projector implements Joseph's method: each ray is sampled
+once per volume slice perpendicular to its dominant direction, and the
+volume is linearly interpolated in the remaining axes at the
+intersection point. The back-projector applies the transpose of exactly
+the same weights, hence forward and back-projection are matched.
+"""
+
+# Imports for common Python 2/3 codebase
+from __future__ import print_function, division, absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from builtins import range
+
+from itertools import product
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+import numpy as np
+
+from odl.discr import DiscreteLp, DiscreteLpElement
+from odl.tomo.geometry import (
+    Geometry, DivergentBeamGeometry, ParallelGeometry)
+from odl.tomo.geometry.detector import Flat1dDetector, Flat2dDetector
+
+
+__all__ = ('numpy_forward_projector', 'numpy_back_projector')
+
+
+# Number of rays processed together in one vectorized step. This is a
+# trade-off between Python overhead and the size of the temporaries.
+RAYS_PER_CHUNK = 2 ** 15
+
+
+def _check_spaces(vol_space, geometry, proj_space):
+    """Check that the spaces are supported by this back-end."""
+    if not isinstance(geometry, Geometry):
+        raise TypeError('`geometry` {!r} is not a `Geometry` instance'
+                        ''.format(geometry))
+    if not isinstance(geometry, (ParallelGeometry, DivergentBeamGeometry)):
+        raise TypeError('`geometry` {!r} is neither parallel nor divergent '
+                        'beam'.format(geometry))
+    if not isinstance(geometry.detector, (Flat1dDetector, Flat2dDetector)):
+        raise NotImplementedError('only flat detectors are supported, got '
+                                  '{!r}'.format(geometry.detector))
+    if not isinstance(vol_space, DiscreteLp):
+        raise TypeError('volume space {!r} is not a `DiscreteLp` instance'
+                        ''.format(vol_space))
+    if not vol_space.is_uniform:
+        raise ValueError('volume space {!r} is not uniformly discretized'
+                         ''.format(vol_space))
+    if not isinstance(proj_space, DiscreteLp):
+        raise TypeError('projection space {!r} is not a `DiscreteLp` '
+                        'instance'.format(proj_space))
+    if vol_space.ndim != geometry.ndim:
+        raise ValueError('dimensions {} of volume space and {} of geometry '
+                         'do not match'.format(vol_space.ndim, geometry.ndim))
+    if proj_space.shape != geometry.partition.shape:
+        raise ValueError('projection space shape {} not equal to geometry '
+                         'shape {}'.format(proj_space.shape,
+                                           geometry.partition.shape))
+
+
+def _angle_rays(geometry, mpar):
+    """Return ray origins and unit directions for motion parameter ``mpar``.
+
+    Parameters
+    ----------
+    geometry : `Geometry`
+        Geometry defining the rays.
+    mpar : `Geometry.motion_params` element
+        Motion parameter at which to compute the rays.
+
+    Returns
+    -------
+    origins, directions : `numpy.ndarray`'s, shape ``(det_size, ndim)``
+        Points on the rays and the unit ray directions, one per
+        detector pixel in 'C' order.
+    """
+    det_axes = np.array(geometry.detector.surface_deriv(), dtype=float,
+                        ndmin=2)
+    det_params = geometry.det_grid.points()
+    rot = geometry.rotation_matrix(mpar)
+    det_pts = (geometry.det_refpoint(mpar) +
+               det_params.dot(det_axes).dot(rot.T))
+
+    if isinstance(geometry, DivergentBeamGeometry):
+        src = geometry.src_position(mpar)
+        directions = det_pts - src
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        origins = np.broadcast_to(src, det_pts.shape)
+    else:
+        direction = rot.dot(geometry.detector.normal)
+        directions = np.broadcast_to(direction, det_pts.shape)
+        origins = det_pts
+
+    return origins, directions
+
+
+def _joseph_weights(origins, directions, vol_space):
+    """Generate the Joseph interpolation weights for a set of rays.
+
+    For each axis ``k``, the rays for which ``k`` is the dominant
+    direction (in index units) are intersected with all slices
+    perpendicular to ``k``.
+
+    Parameters
+    ----------
+    origins, directions : `numpy.ndarray`, shape ``(num_rays, ndim)``
+        Points on the rays and unit ray directions.
+    vol_space : `DiscreteLp`
+        Uniformly discretized volume space.
+
+    Yields
+    ------
+    axis : int
+        Dominant axis of the current group of rays.
+    slc : int
+        Index of the slice along ``axis``.
+    rays : `numpy.ndarray`
+        Indices of the rays in the current group.
+    indices : list of tuple of `numpy.ndarray`
+        For each interpolation corner, the multi-index into the
+        slice, clipped to valid values.
+    weights : list of `numpy.ndarray`
+        For each interpolation corner, the weight including the ray
+        length per slice. Out-of-bounds corners have weight 0.
+    """
+    ndim = vol_space.ndim
+    shape = np.array(vol_space.shape)
+    min_pt = vol_space.min_pt
+    cell_sides = vol_space.cell_sides
+
+    dominant = np.argmax(np.abs(directions) / cell_sides, axis=1)
+    for axis in range(ndim):
+        rays = np.where(dominant == axis)[0]
+        if rays.size == 0:
+            continue
+
+        other = [i for i in range(ndim) if i != axis]
+        orig = origins[rays]
+        dirs = directions[rays]
+        # Length of the ray segment between two neighboring slices
+        step = cell_sides[axis] / np.abs(dirs[:, axis])
+
+        for slc in range(shape[axis]):
+            coord = min_pt[axis] + (slc + 0.5) * cell_sides[axis]
+            t = (coord - orig[:, axis]) / dirs[:, axis]
+
+            # Fractional index coordinates in the other axes, measured
+            # from the first cell midpoint
+            lower, frac = [], []
+            for i in other:
+                pos = ((orig[:, i] + t * dirs[:, i] - min_pt[i]) /
+                       cell_sides[i] - 0.5)
+                idx = np.floor(pos)
+                lower.append(idx.astype(int))
+                frac.append(pos - idx)
+
+            if not all(np.any((lo >= -1) & (lo < n))
+                       for lo, n in zip(lower, shape[other])):
+                continue
+
+            indices, weights = [], []
+            for corner in product((0, 1), repeat=ndim - 1):
+                weight = step.copy()
+                index = []
+                for c, lo, fr, n in zip(corner, lower, frac, shape[other]):
+                    idx = lo + c
+                    weight *= fr if c else 1 - fr
+                    weight[(idx < 0) | (idx >= n)] = 0
+                    index.append(np.clip(idx, 0, n - 1))
+                indices.append(tuple(index))
+                weights.append(weight)
+
+            yield axis, slc, rays, indices, weights
+
+
+def _slice_view(arr, axis, index):
+    """Return a view of the slice ``index`` of ``arr`` along ``axis``."""
+    slc = [slice(None)] * arr.ndim
+    slc[axis] = index
+    return arr[tuple(slc)]
+
+
+def _forward_chunk(vol_arr, vol_space, geometry, mpars):
+    """Forward project the stack ``vol_arr`` for motion parameters ``mpars``.
+
+    The interpolation weights are computed once and applied to all
+    volumes along the first axis of ``vol_arr``.
+    """
+    det_size = geometry.det_partition.size
+    rays = [_angle_rays(geometry, mpar) for mpar in mpars]
+    origins = np.concatenate([r[0] for r in rays])
+    directions = np.concatenate([r[1] for r in rays])
+
+    batch_size = len(vol_arr)
+    result = np.zeros((batch_size, len(mpars) * det_size))
+    for axis, slc, idcs, indices, weights in _joseph_weights(
+            origins, directions, vol_space):
+        vol_slice = _slice_view(vol_arr, axis + 1, slc)
+        for index, weight in zip(indices, weights):
+            result[:, idcs] += weight * vol_slice[(slice(None),) + index]
+
+    return result.reshape((batch_size, len(mpars)) +
+                          geometry.det_partition.shape)
+
+
+def _back_chunk(proj_arr, vol_space, geometry, mpars, out):
+    """Back-project the stack ``proj_arr`` for ``mpars`` and add to ``out``.
+
+    The interpolation weights are computed once and applied to all
+    data sets along the first axis of ``proj_arr``.
+    """
+    rays = [_angle_rays(geometry, mpar) for mpar in mpars]
+    origins = np.concatenate([r[0] for r in rays])
+    directions = np.concatenate([r[1] for r in rays])
+    proj_flat = proj_arr.reshape((len(proj_arr), -1))
+
+    for axis, slc, idcs, indices, weights in _joseph_weights(
+            origins, directions, vol_space):
+        out_slice = _slice_view(out, axis + 1, slc)
+        slice_shape = out_slice.shape[1:]
+        values = proj_flat[:, idcs]
+        for index, weight in zip(indices, weights):
+            flat_index = np.ravel_multi_index(index, slice_shape)
+            for out_slc, vals in zip(out_slice, values):
+                out_slc += np.bincount(
+                    flat_index, weights=weight * vals,
+                    minlength=out_slc.size).reshape(slice_shape)
+
+    return out
+
+
+def _mpar_chunks(geometry, threads):
+    """Split the motion grid into chunks of roughly equal work."""
+    mpars = geometry.motion_grid.points()
+    if geometry.motion_partition.ndim == 1:
+        mpars = mpars[:, 0]
+    det_size = geometry.det_partition.size
+    per_chunk = max(1, RAYS_PER_CHUNK // det_size)
+    num_chunks = max(threads, -(-len(mpars) // per_chunk))
+    bounds = np.linspace(0, len(mpars), num_chunks + 1).astype(int)
+    return [(bounds[i], bounds[i + 1]) for i in range(num_chunks)
+            if bounds[i] < bounds[i + 1]], mpars
+
+
+def _default_threads(size):
+    """Return the default number of threads for ``size`` rays."""
+    return 1 if size <= RAYS_PER_CHUNK else cpu_count()
+
+
+def _as_batch(data, space_name):
+    """Return ``data`` as list of elements and whether it was a sequence."""
+    if isinstance(data, DiscreteLpElement):
+        return [data], False
+
+    batch = list(data)
+    if not batch:
+        raise ValueError('{} batch is empty'.format(space_name))
+    for elem in batch:
+        if not isinstance(elem, DiscreteLpElement):
+            raise TypeError('{} data {!r} is not a `DiscreteLpElement` '
+                            'instance'.format(space_name, elem))
+        if elem.space != batch[0].space:
+            raise ValueError('{} data in the batch have different spaces '
+                             '{!r} and {!r}'.format(space_name, elem.space,
+                                                    batch[0].space))
+    return batch, True
+
+
+def _as_out_batch(out, space, batch_size, is_batch, space_name):
+    """Return ``out`` as list of ``space`` elements, creating if needed."""
+    if out is None:
+        return [space.element() for _ in range(batch_size)]
+
+    out_batch = list(out) if is_batch else [out]
+    if len(out_batch) != batch_size:
+        raise ValueError('`out` has length {}, expected {}'
+                         ''.format(len(out_batch), batch_size))
+    for elem in out_batch:
+        if elem not in space:
+            raise TypeError('`out` {!r} is not an element of the {} '
+                            'space {!r}'.format(elem, space_name, space))
+    return out_batch
+
+
+def numpy_forward_projector(vol_data, geometry, proj_space, out=None,
+                            threads=None):
+    """Run a NumPy forward projection on the given data.
+
+    Parameters
+    ----------
+    vol_data : `DiscreteLpElement` or sequence of `DiscreteLpElement`
+        Volume data to which the forward projector is applied. If a
+        sequence of elements of the same space is given, all of them
+        are projected in one pass, sharing the ray geometry and the
+        interpolation weights.
+    geometry : `Geometry`
+        Geometry defining the tomographic setup.
+    proj_space : `DiscreteLp`
+        Space to which the calling operator maps.
+    out : ``proj_space`` element or sequence, optional
+        Element(s) of the projection space to which the result is
+        written. If ``None``, new elements in ``proj_space`` are
+        created.
+    threads : positive int, optional
+        Number of threads to use. The angles are split into chunks
+        that are processed concurrently.
+        Default: 1 for small problems, otherwise the number of CPUs
+
+    Returns
+    -------
+    out : ``proj_space`` element or list
+        Projection data resulting from the application of the projector,
+        a list if ``vol_data`` is a sequence.
+        If ``out`` was provided, the returned elements are references
+        to it.
+
+    Examples
+    --------
+    The projection of a constant volume along the coordinate axes is
+    its extent:
+
+    >>> space = odl.uniform_discr([-1, -1], [1, 1], (4, 4))
+    >>> apart = odl.nonuniform_partition([0, np.pi / 2])
+    >>> dpart = odl.uniform_partition(-0.5, 0.5, 2)
+    >>> geometry = odl.tomo.Parallel2dGeometry(apart, dpart)
+    >>> proj_space = odl.uniform_discr_frompartition(geometry.partition)
+    >>> proj = numpy_forward_projector(space.one(), geometry, proj_space)
+    >>> np.allclose(proj, 2)
+    True
+
+    Several volumes can be projected at once:
+
+    >>> projs = numpy_forward_projector([space.one(), 2 * space.one()],
+    ...                                 geometry, proj_space)
+    >>> np.allclose(projs[1], 4)
+    True
+    """
+    vol_batch, is_batch = _as_batch(vol_data, 'volume')
+    vol_space = vol_batch[0].space
+    _check_spaces(vol_space, geometry, proj_space)
+    out_batch = _as_out_batch(out, proj_space, len(vol_batch), is_batch,
+                              'projection')
+
+    vol_arr = np.array([vol.asarray() for vol in vol_batch])
+    if threads is None:
+        threads = _default_threads(geometry.partition.size)
+    chunks, mpars = _mpar_chunks(geometry, threads)
+
+    def project(chunk):
+        return _forward_chunk(vol_arr, vol_space, geometry,
+                              mpars[chunk[0]:chunk[1]])
+
+    if threads == 1:
+        results = [project(chunk) for chunk in chunks]
+    else:
+        pool = ThreadPool(threads)
+        try:
+            results = pool.map(project, chunks)
+        finally:
+            pool.close()
+
+    out_arr = np.concatenate(results, axis=1)
+    for out_elem, arr in zip(out_batch, out_arr):
+        out_elem[:] = arr
+
+    return out_batch if is_batch else out_batch[0]
+
+
+def numpy_back_projector(proj_data, geometry, reco_space, out=None,
+                         threads=None):
+    """Run a NumPy back-projection on the given data.
+
+    The back-projection is the exact adjoint of
+    `numpy_forward_projector` with respect to the inner products of
+    the projection and reconstruction spaces.
+
+    Parameters
+    ----------
+    proj_data : `DiscreteLpElement` or sequence of `DiscreteLpElement`
+        Projection data to which the back-projector is applied. If a
+        sequence of elements of the same space is given, all of them
+        are back-projected in one pass, sharing the ray geometry and
+        the interpolation weights.
+    geometry : `Geometry`
+        Geometry defining the tomographic setup.
+    reco_space : `DiscreteLp`
+        Space to which the calling operator maps.
+    out : ``reco_space`` element or sequence, optional
+        Element(s) of the reconstruction space to which the result is
+        written. If ``None``, new elements in ``reco_space`` are
+        created.
+    threads : positive int, optional
+        Number of threads to use. Each thread accumulates into its own
+        copy of the volumes, hence memory usage grows with the number
+        of threads.
+        Default: 1 for small problems, otherwise the number of CPUs
+
+    Returns
+    -------
+    out : ``reco_space`` element or list
+        Reconstruction data resulting from the application of the
+        back-projector, a list if ``proj_data`` is a sequence.
+        If ``out`` was provided, the returned elements are references
+        to it.
+    """
+    proj_batch, is_batch = _as_batch(proj_data, 'projection')
+    proj_space = proj_batch[0].space
+    _check_spaces(reco_space, geometry, proj_space)
+    out_batch = _as_out_batch(out, reco_space, len(proj_batch), is_batch,
+                              'reconstruction')
+
+    proj_arr = np.array([proj.asarray() for proj in proj_batch])
+    if threads is None:
+        threads = _default_threads(geometry.partition.size)
+    chunks, mpars = _mpar_chunks(geometry, threads)
+
+    # Distribute the chunks evenly among the threads such that each
+    # thread needs only one accumulator
+    groups = [chunks[i::threads] for i in range(threads)]
+
+    def backproject(group):
+        acc = np.zeros((len(proj_batch),) + reco_space.shape)
+        for start, stop in group:
+            _back_chunk(proj_arr[:, start:stop], reco_space, geometry,
+                        mpars[start:stop], acc)
+        return acc
+
+    if threads == 1:
+        out_arr = backproject(chunks)
+    else:
+        pool = ThreadPool(threads)
+        try:
+            out_arr = sum(pool.map(backproject, groups))
+        finally:
+            pool.close()
+
+    # Weight the adjoint by appropriate weights
+    scaling_factor = float(proj_space.weighting.const)
+    scaling_factor /= float(reco_space.weighting.const)
+    out_arr *= scaling_factor
+
+    for out_elem, arr in zip(out_batch, out_arr):
+        out_elem[:] = arr
+
+    return out_batch if is_batch else out_batch[0]
+
+
+if __name__ == '__main__':
+    # pylint: disable=wrong-import-position
+    from odl.util.testutils import run_doctests
+    run_doctests()
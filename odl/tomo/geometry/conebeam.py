@@ -165,23 +165,21 @@ class HelicalConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
 
         Parameters
         ----------
-        angle : float
+        angle : float or `array-like`
             Rotation angle given in radians, must be contained in
-            this geometry's `motion_params`
+            this geometry's `motion_params`. An array of ``N`` angles
+            can be given.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (3,)
+        point : `numpy.ndarray`, shape (3,) or (N, 3)
             Detector reference point corresponding to the given angle
 
         See Also
         --------
         rotation_matrix
         """
-        angle = float(angle)
-        if angle not in self.motion_params:
-            raise ValueError('`angle` {} is not in the valid range {}'
-                             ''.format(angle, self.motion_params))
+        angle = self._checked_motion_params(angle, name='angle')
 
         # Initial vector from 0 to the detector. It can be computed this way
         # since source and detector are at maximum distance, i.e. the
@@ -191,7 +189,8 @@ class HelicalConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
 
         # Increment along the rotation axis according to pitch and pitch_offset
         pitch_component = self.axis * (self.pitch_offset +
-                                       self.pitch * angle / (2 * np.pi))
+                                       self.pitch * angle[..., None] /
+                                       (2 * np.pi))
 
         return circle_component + pitch_component
 
@@ -208,23 +207,21 @@ class HelicalConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
 
         Parameters
         ----------
-        angle : float
+        angle : float or `array-like`
             Rotation angle given in radians, must be contained in
-            this geometry's `motion_params`
+            this geometry's `motion_params`. An array of ``N`` angles
+            can be given.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (3,)
+        point : `numpy.ndarray`, shape (3,) or (N, 3)
             Detector reference point corresponding to the given angle
 
         See Also
         --------
         rotation_matrix
         """
-        angle = float(angle)
-        if angle not in self.motion_params:
-            raise ValueError('`angle` {} is not in the valid range {}'
-                             ''.format(angle, self.motion_params))
+        angle = self._checked_motion_params(angle, name='angle')
 
         # Initial vector from 0 to the source. It can be computed this way
         # since source and detector are at maximum distance, i.e. the
@@ -234,7 +231,8 @@ class HelicalConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
 
         # Increment by pitch
         pitch_component = self.axis * (self.pitch_offset +
-                                       self.pitch * angle / (np.pi * 2))
+                                       self.pitch * angle[..., None] /
+                                       (2 * np.pi))
 
         return circle_component + pitch_component
 
@@ -121,18 +121,17 @@ class FanFlatGeometry(DivergentBeamGeometry):
 
         Parameters
         ----------
-        angle : float
+        angle : float or `array-like`
             Rotation angle given in radians, must be contained in
-            this geometry's `motion_params`
+            this geometry's `motion_params`. An array of ``N`` angles
+            can be given.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape ``(2,)``
+        point : `numpy.ndarray`, shape ``(2,)`` or ``(N, 2)``
             Source position corresponding to the given angle
         """
-        if angle not in self.motion_params:
-            raise ValueError('`angle` {} is not in the valid range {}'
-                             ''.format(angle, self.motion_params))
+        angle = self._checked_motion_params(angle, name='angle')
 
         # Initial vector from 0 to the source. It can be computed this way
         # since source and detector are at maximum distance, i.e. the
@@ -152,22 +151,21 @@ class FanFlatGeometry(DivergentBeamGeometry):
 
         Parameters
         ----------
-        angle : float
+        angle : float or `array-like`
             Rotation angle given in radians, must be contained in
-            this geometry's `motion_params`
+            this geometry's `motion_params`. An array of ``N`` angles
+            can be given.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (2,)
+        point : `numpy.ndarray`, shape (2,) or (N, 2)
             Detector reference point corresponding to the given angle
 
         See Also
         --------
         rotation_matrix
         """
-        if angle not in self.motion_params:
-            raise ValueError('`angle` {} is not in the valid range {}'
-                             ''.format(angle, self.motion_params))
+        angle = self._checked_motion_params(angle, name='angle')
 
         # Initial vector from 0 to the detector. It can be computed this way
         # since source and detector are at maximum distance, i.e. the
@@ -185,22 +183,20 @@ class FanFlatGeometry(DivergentBeamGeometry):
 
         Parameters
         ----------
-        angle : float
+        angle : float or `array-like`
             Rotation angle given in radians, must be contained in
-            this geometry's `motion_params`
+            this geometry's `motion_params`. An array of ``N`` angles
+            can be given.
 
         Returns
         -------
-        rot : `numpy.ndarray`, shape (2, 2)
+        rot : `numpy.ndarray`, shape (2, 2) or (N, 2, 2)
             The rotation matrix mapping the standard basis vectors in
             the fixed ("lab") coordinate system to the basis vectors of
             the local coordinate system of the detector reference point,
             expressed in the fixed system
         """
-        angle = float(angle)
-        if angle not in self.motion_params:
-            raise ValueError('`angle` {} not in the valid range {}'
-                             ''.format(angle, self.motion_params))
+        angle = self._checked_motion_params(angle, name='angle')
         return euler_matrix(angle)
 
     # TODO: back projection weighting function?
@@ -15,10 +15,12 @@ standard_library.install_aliases()
 from builtins import object
 
 from abc import ABCMeta, abstractmethod
+from copy import copy
 import numpy as np
 
 from odl.discr import RectPartition
 from odl.tomo.geometry.detector import Detector
+from odl.tomo.util.utility import axis_rotation_matrix
 from odl.util.utility import with_metaclass
 
 
@@ -138,6 +140,38 @@ class Geometry(with_metaclass(ABCMeta, object)):
         """
         return self.partition.grid
 
+    def motion_subset(self, indices):
+        """Return this geometry restricted to a subset of motion parameters.
+
+        Parameters
+        ----------
+        indices : index expression
+            Indices for `motion_partition`, e.g., a slice selecting a
+            range of angles.
+
+        Returns
+        -------
+        geometry : `Geometry`
+            Geometry of the same type and with the same detector, whose
+            `motion_partition` is ``self.motion_partition[indices]``.
+            It has an empty `implementation_cache`.
+
+        Examples
+        --------
+        >>> apart = odl.uniform_partition(0, 1, 10)
+        >>> dpart = odl.uniform_partition(-1, 1, 20)
+        >>> geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+        >>> sub_geom = geom.motion_subset(slice(2, 5))
+        >>> sub_geom.angles
+        array([ 0.25,  0.35,  0.45])
+        >>> sub_geom.det_partition == geom.det_partition
+        True
+        """
+        geometry = copy(self)
+        geometry._motion_part = self.motion_partition[indices]
+        geometry._implementation_cache = {}
+        return geometry
+
     @abstractmethod
     def det_refpoint(self, mpar):
         """Detector reference point function.
@@ -146,11 +180,12 @@ class Geometry(with_metaclass(ABCMeta, object)):
         ----------
         mpar : `motion_params` element
             Motion parameter for which to calculate the detector
-            reference point
+            reference point. For 1d motion parameters, an array of
+            ``N`` parameters can be given.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (`ndim`,)
+        point : `numpy.ndarray`, shape (`ndim`,) or (N, `ndim`)
             The reference point, an `ndim`-dimensional vector
         """
 
@@ -163,11 +198,12 @@ class Geometry(with_metaclass(ABCMeta, object)):
         ----------
         mpar : `motion_params` element
             Motion parameter for which to calculate the detector
-            reference rotation
+            reference rotation. For 1d motion parameters, an array of
+            ``N`` parameters can be given.
 
         Returns
         -------
-        rot : `numpy.ndarray`, shape (`ndim`, `ndim`)
+        rot : `numpy.ndarray`, shape (`ndim`, `ndim`) or (N, `ndim`, `ndim`)
             The rotation matrix mapping the standard basis vectors in
             the fixed ("lab") coordinate system to the basis vectors of
             the local coordinate system of the detector reference point,
@@ -201,20 +237,56 @@ class Geometry(with_metaclass(ABCMeta, object)):
         Parameters
         ----------
         mpar : `motion_params` element
-            Motion parameter at which to evaluate
+            Motion parameter at which to evaluate. For 1d motion
+            parameters, an array of ``N`` parameters can be given.
         dpar : `det_params` element
             Detector parameter at which to evaluate
 
         Returns
         -------
-        pos : `numpy.ndarray` (shape (`ndim`,))
-            Source position, an `ndim`-dimensional vector
+        pos : `numpy.ndarray`, shape (`ndim`,) or (N, `ndim`)
+            Detector point position, an `ndim`-dimensional vector
         """
-        # TODO: check and write test
+        # For N motion parameters, the stacked (N, ndim, ndim) rotation
+        # matrices are applied to the surface point at once
         return np.asarray(
             (self.det_refpoint(mpar) +
              self.rotation_matrix(mpar).dot(self.detector.surface(dpar))))
 
+    def _checked_motion_params(self, mpar, name='mpar'):
+        """Return ``mpar`` as array after checking its range.
+
+        For 1d `motion_params`, ``mpar`` can be a single parameter or an
+        array of parameters, which is checked as a whole. Otherwise,
+        ``mpar`` must be a single element of `motion_params`.
+
+        Parameters
+        ----------
+        mpar : `motion_params` element or `array-like`
+            Motion parameter(s) to be checked.
+        name : str, optional
+            Name of the parameter used in the error message.
+
+        Returns
+        -------
+        mpar : `numpy.ndarray`
+            The checked motion parameter(s) as floating point array.
+
+        Raises
+        ------
+        ValueError
+            If any of the parameters is not in `motion_params`.
+        """
+        mpar = np.asarray(mpar, dtype=float)
+        if self.motion_params.ndim == 1:
+            contained = self.motion_params.contains_all(mpar.reshape(1, -1))
+        else:
+            contained = mpar in self.motion_params
+        if not contained:
+            raise ValueError('`{}` {} is not in the valid range {}'
+                             ''.format(name, mpar, self.motion_params))
+        return mpar
+
     @property
     def implementation_cache(self):
         """Dictionary acting as a cache for this geometry.
@@ -246,11 +318,13 @@ class DivergentBeamGeometry(Geometry):
         Parameters
         ----------
         mpar : `motion_params` element
-            Motion parameter for which to calculate the source position
+            Motion parameter for which to calculate the source position.
+            For 1d motion parameters, an array of ``N`` parameters can
+            be given.
 
         Returns
         -------
-        pos : `numpy.ndarray` (shape (`ndim`,))
+        pos : `numpy.ndarray`, shape (`ndim`,) or (N, `ndim`)
             Source position, an `ndim`-dimensional vector
         """
 
@@ -266,7 +340,8 @@ class DivergentBeamGeometry(Geometry):
         Parameters
         ----------
         mpar : `motion_params` element
-            Motion parameter at which to evaluate
+            Motion parameter at which to evaluate. For 1d motion
+            parameters, an array of ``N`` parameters can be given.
         dpar : `det_params` element
             Detector parameter at which to evaluate
         normalized : bool, optional
@@ -274,12 +349,10 @@ class DivergentBeamGeometry(Geometry):
 
         Returns
         -------
-        vec : `numpy.ndarray`, shape (`ndim`,)
-            (Unit) vector pointing from the detector to the source
+        vec : `numpy.ndarray`, shape (`ndim`,) or (N, `ndim`)
+            (Unit) vector(s) pointing from the detector to the source
         """
-        if mpar not in self.motion_params:
-            raise ValueError('`mpar` {} is not in the valid range {}'
-                             ''.format(mpar, self.motion_params))
+        mpar = self._checked_motion_params(mpar)
         if dpar not in self.det_params:
             raise ValueError('`dpar` {} is not in the valid range {}'
                              ''.format(dpar, self.det_params))
@@ -288,7 +361,7 @@ class DivergentBeamGeometry(Geometry):
 
         if normalized:
             # axis = -1 allows this to be vectorized
-            vec /= np.linalg.norm(vec, axis=-1)
+            vec /= np.linalg.norm(vec, axis=-1, keepdims=True)
 
         return vec
 
@@ -331,34 +404,21 @@ class AxisOrientedGeometry(object):
 
         Parameters
         ----------
-        angle : float
+        angle : float or `array-like`
             The motion parameter given in radian. It must be
-            contained in this geometry's `motion_params`.
+            contained in this geometry's `motion_params`. For an array
+            of ``N`` angles, one matrix per angle is returned.
 
         Returns
         -------
-        rot_mat : `numpy.ndarray`, shape ``(3, 3)``
+        rot_mat : `numpy.ndarray`, shape ``(3, 3)`` or ``(N, 3, 3)``
             The rotation matrix mapping the standard basis vectors in
             the fixed ("lab") coordinate system to the basis vectors of
             the local coordinate system of the detector reference point,
             expressed in the fixed system.
         """
-        angle = float(angle)
-        if angle not in self.motion_params:
-            raise ValueError('`angle` {} is not in the valid range {}'
-                             ''.format(angle, self.motion_params))
-
-        axis = self.axis
-
-        cross_mat = np.array([[0, -axis[2], axis[1]],
-                              [axis[2], 0, -axis[0]],
-                              [-axis[1], axis[0], 0]])
-        dy_mat = np.outer(axis, axis)
-        id_mat = np.eye(3)
-        cos_ang = np.cos(angle)
-        sin_ang = np.sin(angle)
-
-        return cos_ang * id_mat + (1. - cos_ang) * dy_mat + sin_ang * cross_mat
+        angle = self._checked_motion_params(angle, name='angle')
+        return axis_rotation_matrix(self.axis, angle)
 
 
 if __name__ == '__main__':
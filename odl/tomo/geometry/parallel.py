@@ -76,18 +76,17 @@ class ParallelGeometry(Geometry):
 
         Parameters
         ----------
-        angles : float
+        angles : float or `array-like`
             Parameters describing the detector rotation, must be
-            contained in `motion_params`.
+            contained in `motion_params`. For 1d motion parameters,
+            an array of ``N`` angles can be given.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (`ndim`,)
+        point : `numpy.ndarray`, shape (`ndim`,) or (N, `ndim`)
             The reference point for the given parameters
         """
-        if angles not in self.motion_params:
-            raise ValueError('`angles` {} not in the valid range {}'
-                             ''.format(angles, self.motion_params))
+        angles = self._checked_motion_params(angles, name='angles')
         return self.rotation_matrix(angles).dot(self._det_init_pos)
 
     def det_to_src(self, angles, dpar, normalized=True):
@@ -103,7 +102,8 @@ class ParallelGeometry(Geometry):
         ----------
         angles : `array-like`
             Euler angles given in radians, must be contained
-            in this geometry's `motion_params`
+            in this geometry's `motion_params`. For 1d motion
+            parameters, an array of ``N`` angles can be given.
         dpar : float
             Detector parameters, must be contained in this
             geometry's `det_params`
@@ -113,7 +113,7 @@ class ParallelGeometry(Geometry):
 
         Returns
         -------
-        vec : `numpy.ndarray`, shape (`ndim`,)
+        vec : `numpy.ndarray`, shape (`ndim`,) or (N, `ndim`)
             Unit vector pointing from the detector to the source
 
         Raises
@@ -122,9 +122,7 @@ class ParallelGeometry(Geometry):
             if ``normalized=False`` is given, since this case is not
             well defined.
         """
-        if angles not in self.motion_params:
-            raise ValueError('`angles` {} not in the valid range {}'
-                             ''.format(angles, self.motion_params))
+        angles = self._checked_motion_params(angles, name='angles')
 
         if dpar not in self.det_params:
             raise ValueError('`dpar` {} not in the valid range '
@@ -209,21 +207,20 @@ class Parallel2dGeometry(ParallelGeometry):
 
         Parameters
         ----------
-        angle : float
+        angle : float or `array-like`
             Rotation angle given in radians, must be contained in
-            this geometry's `motion_params`
+            this geometry's `motion_params`. For an array of ``N``
+            angles, one matrix per angle is returned.
 
         Returns
         -------
-        rot : `numpy.ndarray`, shape (2, 2)
+        rot : `numpy.ndarray`, shape (2, 2) or (N, 2, 2)
             The rotation matrix mapping the standard basis vectors in
             the fixed ("lab") coordinate system to the basis vectors of
             the local coordinate system of the detector reference point,
             expressed in the fixed system
         """
-        if angle not in self.motion_params:
-            raise ValueError('`angle` {} not in the valid range {}'
-                             ''.format(angle, self.motion_params))
+        angle = self._checked_motion_params(angle, name='angle')
         return euler_matrix(angle)
 
     def __repr__(self):
@@ -315,9 +312,7 @@ class Parallel3dEulerGeometry(ParallelGeometry):
             the local coordinate system of the detector reference point,
             expressed in the fixed system.
         """
-        if angles not in self.motion_params:
-            raise ValueError('`angles` {} not in the valid range {}'
-                             ''.format(angles, self.motion_params))
+        angles = self._checked_motion_params(angles, name='angles')
         return euler_matrix(*angles)
 
     def __repr__(self):
@@ -28,11 +28,12 @@ from odl.tomo.backends import (
     astra_supports, ASTRA_VERSION,
     astra_cpu_forward_projector, astra_cpu_back_projector,
     AstraCudaProjectorImpl, AstraCudaBackProjectorImpl,
-    skimage_radon_forward, skimage_radon_back_projector)
+    skimage_radon_forward, skimage_radon_back_projector,
+    numpy_forward_projector, numpy_back_projector)
 
 
 ASTRA_CPU_AVAILABLE = ASTRA_AVAILABLE
-_SUPPORTED_IMPL = ('astra_cpu', 'astra_cuda', 'skimage')
+_SUPPORTED_IMPL = ('astra_cpu', 'astra_cuda', 'skimage', 'numpy')
 _AVAILABLE_IMPLS = []
 if ASTRA_CPU_AVAILABLE:
     _AVAILABLE_IMPLS.append('astra_cpu')
@@ -40,9 +41,10 @@ if ASTRA_CUDA_AVAILABLE:
     _AVAILABLE_IMPLS.append('astra_cuda')
 if SKIMAGE_AVAILABLE:
     _AVAILABLE_IMPLS.append('skimage')
+_AVAILABLE_IMPLS.append('numpy')
 
 
-__all__ = ('RayTransform', 'RayBackProjection')
+__all__ = ('RayTransform', 'RayBackProjection', 'BatchedRayTransform')
 
 
 class RayTransformBase(Operator):
@@ -66,16 +68,20 @@ class RayTransformBase(Operator):
 
         Other Parameters
         ----------------
-        impl : {`None`, 'astra_cuda', 'astra_cpu', 'skimage'}, optional
-            Implementation back-end for the transform. Supported back-ends:
+        impl : {`None`, 'astra_cuda', 'astra_cpu', 'skimage', 'numpy'}
+            Implementation back-end for the transform, optional.
+            Supported back-ends:
 
             - ``'astra_cuda'``: ASTRA toolbox, using CUDA, 2D or 3D
             - ``'astra_cpu'``: ASTRA toolbox using CPU, only 2D
             - ``'skimage'``: scikit-image, only 2D parallel with square
               reconstruction space.
+            - ``'numpy'``: Joseph's method in pure NumPy, 2D or 3D with
+              flat detector and uniform reconstruction space. Always
+              available, but slower than the other back-ends.
 
-            For the default ``None``, the fastest available back-end is
-            used.
+            For the default ``None``, the fastest available back-end
+            supporting ``geometry`` is used.
 
         interp : {'nearest', 'linear'}, optional
             Interpolation type for the discretization of the projection
@@ -89,8 +95,13 @@ class RayTransformBase(Operator):
             If ``True``, data is cached. This gives a significant speed-up
             at the expense of a notable memory overhead, both on the GPU
             and on the CPU, since a full volume and a projection dataset
-            are stored. That may be prohibitive in 3D.
+            are stored. That may be prohibitive in 3D. For
+            ``impl='astra_cpu'``, the ASTRA objects are kept alive in
+            the `astra_cpu_cache` of ``geometry``.
             Default: True
+        threads : positive int, optional
+            Number of threads used by the ``'numpy'`` back-end.
+            Default: 1 for small problems, otherwise the number of CPUs
 
         Notes
         -----
@@ -119,21 +130,18 @@ class RayTransformBase(Operator):
                             '{!r}'.format(geometry))
 
         # Handle backend choice
-        if not _AVAILABLE_IMPLS:
-            raise RuntimeError('no ray transform back-end available; '
-                               'this requires 3rd party packages, please '
-                               'check the install docs')
         impl = kwargs.pop('impl', None)
         if impl is None:
             # Select fastest available
             if ASTRA_CUDA_AVAILABLE:
                 impl = 'astra_cuda'
-            elif ASTRA_AVAILABLE:
+            elif ASTRA_AVAILABLE and geometry.ndim == 2:
                 impl = 'astra_cpu'
-            elif SKIMAGE_AVAILABLE:
+            elif (SKIMAGE_AVAILABLE and
+                  isinstance(geometry, Parallel2dGeometry)):
                 impl = 'skimage'
             else:
-                raise RuntimeError('bad impl')
+                impl = 'numpy'
         else:
             impl, impl_in = str(impl).lower(), impl
             if impl not in _SUPPORTED_IMPL:
@@ -279,6 +287,14 @@ class RayTransformBase(Operator):
         """Geometry of this operator."""
         return self.__geometry
 
+    @property
+    def threads(self):
+        """Number of threads used by the ``'numpy'`` back-end, or ``None``.
+
+        ``None`` means that the back-end chooses the number of threads.
+        """
+        return self._extra_kwargs.get('threads', None)
+
     def _call(self, x, out=None):
         """Return ``self(x[, out])``."""
         if self.domain.is_rn:
@@ -299,6 +315,30 @@ class RayTransformBase(Operator):
         else:
             raise RuntimeError('bad domain {!r}'.format(self.domain))
 
+    def _call_batch(self, xs, outs=None):
+        """Return ``[self(x[, out]) for x[, out] in zip(xs[, outs])]``.
+
+        Back-ends that support it evaluate all elements in one pass,
+        otherwise the (cached) back-end objects are reused in a loop.
+        """
+        if outs is None:
+            outs = [self.range.element() for _ in xs]
+
+        if self.domain.is_rn:
+            self._call_real_batch(list(xs), list(outs))
+        elif self.domain.is_cn:
+            # Real and imaginary parts are treated as one batch
+            xs_real = [x.real for x in xs] + [x.imag for x in xs]
+            outs_real = [self.range.real_space.element() for _ in xs_real]
+            self._call_real_batch(xs_real, outs_real)
+            for i, out in enumerate(outs):
+                out.real = outs_real[i]
+                out.imag = outs_real[len(xs) + i]
+        else:
+            raise RuntimeError('bad domain {!r}'.format(self.domain))
+
+        return outs
+
 
 class RayTransform(RayTransformBase):
 
@@ -318,16 +358,20 @@ class RayTransform(RayTransformBase):
 
         Other Parameters
         ----------------
-        impl : {`None`, 'astra_cuda', 'astra_cpu', 'skimage'}, optional
-            Implementation back-end for the transform. Supported back-ends:
+        impl : {`None`, 'astra_cuda', 'astra_cpu', 'skimage', 'numpy'}
+            Implementation back-end for the transform, optional.
+            Supported back-ends:
 
             - ``'astra_cuda'``: ASTRA toolbox, using CUDA, 2D or 3D
             - ``'astra_cpu'``: ASTRA toolbox using CPU, only 2D
             - ``'skimage'``: scikit-image, only 2D parallel with square
               reconstruction space.
+            - ``'numpy'``: Joseph's method in pure NumPy, 2D or 3D with
+              flat detector and uniform reconstruction space. Always
+              available, but slower than the other back-ends.
 
-            For the default ``None``, the fastest available back-end is
-            used.
+            For the default ``None``, the fastest available back-end
+            supporting ``geometry`` is used.
         interp : {'nearest', 'linear'}, optional
             Interpolation type for the discretization of the operator
             range. This has no effect if ``range`` is given explicitly.
@@ -340,8 +384,13 @@ class RayTransform(RayTransformBase):
             If ``True``, data is cached. This gives a significant speed-up
             at the expense of a notable memory overhead, both on the GPU
             and on the CPU, since a full volume and a projection dataset
-            are stored. That may be prohibitive in 3D.
+            are stored. That may be prohibitive in 3D. For
+            ``impl='astra_cpu'``, the ASTRA objects are kept alive in
+            the `astra_cpu_cache` of ``geometry``.
             Default: True
+        threads : positive int, optional
+            Number of threads used by the ``'numpy'`` back-end.
+            Default: 1 for small problems, otherwise the number of CPUs
 
         Notes
         -----
@@ -363,7 +412,8 @@ class RayTransform(RayTransformBase):
 
             if data_impl == 'cpu':
                 return astra_cpu_forward_projector(
-                    x_real, self.geometry, self.range.real_space, out_real)
+                    x_real, self.geometry, self.range.real_space, out_real,
+                    use_cache=self.use_cache)
 
             elif data_impl == 'cuda':
                 if self._astra_wrapper is None:
@@ -382,10 +432,24 @@ class RayTransform(RayTransformBase):
         elif self.impl == 'skimage':
             return skimage_radon_forward(x_real, self.geometry,
                                          self.range.real_space, out_real)
+        elif self.impl == 'numpy':
+            return numpy_forward_projector(
+                x_real, self.geometry, self.range.real_space, out_real,
+                threads=self.threads)
         else:
             # Should never happen
             raise RuntimeError('bad `impl` {!r}'.format(self.impl))
 
+    def _call_real_batch(self, xs_real, outs_real):
+        """Real-space forward projection of a batch of volumes."""
+        if self.impl == 'numpy':
+            return numpy_forward_projector(
+                xs_real, self.geometry, self.range.real_space, outs_real,
+                threads=self.threads)
+        else:
+            return [self._call_real(x, out)
+                    for x, out in zip(xs_real, outs_real)]
+
     @property
     def adjoint(self):
         """Adjoint of this operator.
@@ -423,16 +487,20 @@ class RayBackProjection(RayTransformBase):
 
         Other Parameters
         ----------------
-        impl : {`None`, 'astra_cuda', 'astra_cpu', 'skimage'}, optional
-            Implementation back-end for the transform. Supported back-ends:
+        impl : {`None`, 'astra_cuda', 'astra_cpu', 'skimage', 'numpy'}
+            Implementation back-end for the transform, optional.
+            Supported back-ends:
 
             - ``'astra_cuda'``: ASTRA toolbox, using CUDA, 2D or 3D
             - ``'astra_cpu'``: ASTRA toolbox using CPU, only 2D
             - ``'skimage'``: scikit-image, only 2D parallel with square
               reconstruction space.
+            - ``'numpy'``: Joseph's method in pure NumPy, 2D or 3D with
+              flat detector and uniform reconstruction space. Always
+              available, but slower than the other back-ends.
 
-            For the default ``None``, the fastest available back-end is
-            used.
+            For the default ``None``, the fastest available back-end
+            supporting ``geometry`` is used.
         interp : {'nearest', 'linear'}, optional
             Interpolation type for the discretization of the operator
             domain. This has no effect if ``domain`` is given explicitly.
@@ -445,8 +513,13 @@ class RayBackProjection(RayTransformBase):
             If ``True``, data is cached. This gives a significant speed-up
             at the expense of a notable memory overhead, both on the GPU
             and on the CPU, since a full volume and a projection dataset
-            are stored. That may be prohibitive in 3D.
+            are stored. That may be prohibitive in 3D. For
+            ``impl='astra_cpu'``, the ASTRA objects are kept alive in
+            the `astra_cpu_cache` of ``geometry``.
             Default: True
+        threads : positive int, optional
+            Number of threads used by the ``'numpy'`` back-end.
+            Default: 1 for small problems, otherwise the number of CPUs
 
         Notes
         -----
@@ -468,7 +541,8 @@ class RayBackProjection(RayTransformBase):
             if data_impl == 'cpu':
                 return astra_cpu_back_projector(x_real, self.geometry,
                                                 self.range.real_space,
-                                                out_real)
+                                                out_real,
+                                                use_cache=self.use_cache)
             elif data_impl == 'cuda':
                 if self._astra_wrapper is None:
                     astra_wrapper = AstraCudaBackProjectorImpl(
@@ -488,10 +562,24 @@ class RayBackProjection(RayTransformBase):
             return skimage_radon_back_projector(x_real, self.geometry,
                                                 self.range.real_space,
                                                 out_real)
+        elif self.impl == 'numpy':
+            return numpy_back_projector(
+                x_real, self.geometry, self.range.real_space, out_real,
+                threads=self.threads)
         else:
             # Should never happen
             raise RuntimeError('bad `impl` {!r}'.format(self.impl))
 
+    def _call_real_batch(self, xs_real, outs_real):
+        """Real-space back-projection of a batch of projection data."""
+        if self.impl == 'numpy':
+            return numpy_back_projector(
+                xs_real, self.geometry, self.range.real_space, outs_real,
+                threads=self.threads)
+        else:
+            return [self._call_real(x, out)
+                    for x, out in zip(xs_real, outs_real)]
+
     @property
     def adjoint(self):
         """Adjoint of this operator.
@@ -512,6 +600,86 @@ class RayBackProjection(RayTransformBase):
         return self._adjoint
 
 
+class BatchedRayTransform(Operator):
+
+    """Ray transform or back-projection of a batch of elements.
+
+    This operator maps from the power space ``op.domain ** batch_size``
+    to ``op.range ** batch_size`` by applying ``op`` to each component.
+    In contrast to `DiagonalOperator`, the components are handed to the
+    back-end together, such that geometry information and scratch
+    buffers are shared. For ``impl='numpy'``, all components are
+    processed in a single pass.
+    """
+
+    def __init__(self, operator, batch_size):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        operator : `RayTransform` or `RayBackProjection`
+            Operator that should be applied to each component.
+        batch_size : positive int
+            Number of elements in the batch.
+
+        Examples
+        --------
+        Project a stack of two volumes, given as array with an extra
+        leading axis:
+
+        >>> space = odl.uniform_discr([-1, -1], [1, 1], (10, 10))
+        >>> geometry = odl.tomo.parallel_beam_geometry(space, angles=5)
+        >>> ray_trafo = odl.tomo.RayTransform(space, geometry, impl='numpy')
+        >>> batch_op = BatchedRayTransform(ray_trafo, 2)
+        >>> vols = np.ones((2, 10, 10))
+        >>> vols[1] *= 2
+        >>> projs = batch_op(vols)
+        >>> projs[1] == 2 * ray_trafo(space.one())
+        True
+        >>> batch_op.adjoint(projs)[0] == ray_trafo.adjoint(projs[0])
+        True
+        """
+        if not isinstance(operator, RayTransformBase):
+            raise TypeError('`operator` {!r} is neither a `RayTransform` nor '
+                            'a `RayBackProjection`'.format(operator))
+        batch_size, batch_size_in = int(batch_size), batch_size
+        if batch_size != batch_size_in or batch_size < 1:
+            raise ValueError('`batch_size` must be a positive integer, got '
+                             '{!r}'.format(batch_size_in))
+
+        self.__operator = operator
+        self.__batch_size = batch_size
+        super().__init__(operator.domain ** batch_size,
+                         operator.range ** batch_size, linear=True)
+
+    @property
+    def operator(self):
+        """Operator applied to each component of the batch."""
+        return self.__operator
+
+    @property
+    def batch_size(self):
+        """Number of elements in the batch."""
+        return self.__batch_size
+
+    def _call(self, x, out=None):
+        """Return ``self(x[, out])``."""
+        if out is None:
+            return self.operator._call_batch(x)
+        else:
+            self.operator._call_batch(x, out)
+
+    @property
+    def adjoint(self):
+        """Adjoint of this operator, the batched adjoint of `operator`."""
+        return BatchedRayTransform(self.operator.adjoint, self.batch_size)
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{}({!r}, {})'.format(self.__class__.__name__, self.operator,
+                                     self.batch_size)
+
+
 if __name__ == '__main__':
     # pylint: disable=wrong-import-position
     from odl.util.testutils import run_doctests
@@ -28,34 +28,48 @@ def euler_matrix(*angles):
 
     Parameters
     ----------
-    angle1,...,angleN : float
+    angle1,...,angleN : float or `array-like`
         One angle results in a (2x2) matrix representing a
         counter-clockwise rotation. Two or three angles result in a
         (3x3) matrix and are interpreted as Euler angles of a 3d
         rotation according to the 'ZXZ' rotation order, see the
         Wikipedia article `Euler angles`_.
+        Arrays of angles are broadcast against each other, resulting
+        in one matrix per entry.
 
     Returns
     -------
     mat : `numpy.ndarray`, shape ``(2, 2)`` or ``(3, 3)``
-        The rotation matrix
+        The rotation matrix. For array input, the shape is
+        ``bcast_shape + (2, 2)`` or ``bcast_shape + (3, 3)``, where
+        ``bcast_shape`` is the broadcast shape of the angle arrays.
+
+    Examples
+    --------
+    A single angle gives a single matrix, an array of angles a stack
+    of matrices:
+
+    >>> euler_matrix(np.pi / 2).round(10)
+    array([[ 0., -1.],
+           [ 1.,  0.]])
+    >>> euler_matrix([0, np.pi / 2]).shape
+    (2, 2, 2)
 
     .. _Euler angles:
         https://en.wikipedia.org/wiki/Euler_angles#Rotation_matrix
     """
     if len(angles) == 1:
-        phi = float(angles[0])
+        phi = np.asarray(angles[0], dtype=float)
         theta = psi = 0.
         ndim = 2
     elif len(angles) == 2:
-        phi = float(angles[0])
-        theta = float(angles[1])
+        phi, theta = np.broadcast_arrays(
+            *[np.asarray(a, dtype=float) for a in angles])
         psi = 0.
         ndim = 3
     elif len(angles) == 3:
-        phi = float(angles[0])
-        theta = float(angles[1])
-        psi = float(angles[2])
+        phi, theta, psi = np.broadcast_arrays(
+            *[np.asarray(a, dtype=float) for a in angles])
         ndim = 3
     else:
         raise ValueError('number of angles must be between 1 and 3')
@@ -71,18 +85,22 @@ def euler_matrix(*angles):
         mat = np.array([[cph, -sph],
                         [sph, cph]])
     else:
+        # Broadcast constant entries to the common shape for stacking
+        zero = np.zeros_like(cph)
         mat = np.array([
             [cph * cps - sph * cth * sps,
              -cph * sps - sph * cth * cps,
-             sph * sth],
+             sph * sth + zero],
             [sph * cps + cph * cth * sps,
              -sph * sps + cph * cth * cps,
-             -cph * sth],
-            [sth * sps,
-             sth * cps,
-             cth]])
+             -cph * sth + zero],
+            [sth * sps + zero,
+             sth * cps + zero,
+             cth + zero]])
 
-    return mat
+    # Move the matrix axes to the end for array input; `numpy.moveaxis`
+    # is not used since it requires numpy 1.11
+    return mat.transpose(tuple(range(2, mat.ndim)) + (0, 1))
 
 
 def axis_rotation(axis, angle, vectors):
@@ -143,13 +161,15 @@ def axis_rotation_matrix(axis, angle):
     ----------
     axis : `array-like`, shape ``(3,)``
         The rotation axis, assumed to be a unit vector
-    angle : float
-        The rotation angle
+    angle : float or `array-like`
+        The rotation angle. For an array of angles, one matrix per
+        entry is returned.
 
     Returns
     -------
     mat : `numpy.ndarray`, shape ``(3, 3)``
-        The axis rotation matrix
+        The axis rotation matrix. For array input, the shape is
+        ``angle.shape + (3, 3)``.
 
     .. _Rodriguez' rotation formula:
         https://en.wikipedia.org/wiki/Rodrigues'_rotation_formula
@@ -159,15 +179,15 @@ def axis_rotation_matrix(axis, angle):
         raise ValueError('`axis` shape must be (3,), got {}'
                          ''.format(axis.shape))
 
-    angle = float(angle)
+    angle = np.asarray(angle, dtype=float)
 
     cross_mat = np.array([[0, -axis[2], axis[1]],
                           [axis[2], 0, -axis[0]],
                           [-axis[1], axis[0], 0]])
     dy_mat = np.outer(axis, axis)
     id_mat = np.eye(3)
-    cos_ang = np.cos(angle)
-    sin_ang = np.sin(angle)
+    cos_ang = np.cos(angle)[..., None, None]
+    sin_ang = np.sin(angle)[..., None, None]
 
     return cos_ang * id_mat + (1. - cos_ang) * dy_mat + sin_ang * cross_mat
 
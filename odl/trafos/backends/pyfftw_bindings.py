@@ -20,7 +20,10 @@ standard_library.install_aliases()
 from builtins import range
 from future.utils import raise_from
 
+from collections import OrderedDict
 from multiprocessing import cpu_count
+import pickle
+from threading import Lock, current_thread
 import numpy as np
 try:
     import pyfftw
@@ -32,7 +35,12 @@ from odl.util import (
     is_real_dtype, dtype_repr, complex_dtype, normalized_axes_tuple)
 
 
-__all__ = ('pyfftw_call', 'PYFFTW_AVAILABLE')
+__all__ = ('pyfftw_call', 'PYFFTW_AVAILABLE', 'FFTWPlanCache',
+           'FFTW_PLAN_CACHE', 'import_fftw_wisdom', 'export_fftw_wisdom')
+
+
+# Default upper bound for the memory held by the plans in `FFTW_PLAN_CACHE`
+FFTW_PLAN_CACHE_MAX_BYTES = 2 ** 28
 
 
 def pyfftw_call(array_in, array_out, direction='forward', axes=None,
@@ -77,6 +85,11 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
         Use this plan instead of calculating a new one. If specified,
         the options ``planning_effort``, ``planning_timelimit`` and
         ``threads`` have no effect.
+    plan_cache : `FFTWPlanCache` or ``None``, optional
+        Cache to look up plans in if ``fftw_plan`` is not given.
+        Plans that are not found are created and stored in the cache.
+        ``None`` means that a new plan is created in every call.
+        Default: `FFTW_PLAN_CACHE`
     planning_effort : str, optional
         Flag for the amount of effort put into finding an optimal
         FFTW plan. See the `FFTW doc on planner flags
@@ -127,9 +140,9 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
       use ``'estimate'``.
     * If a plan is provided via the ``fftw_plan`` parameter, no copy
       is needed internally.
+    * Plans from the ``plan_cache`` are created on internal arrays, hence
+      the planner never touches ``array_in``.
     """
-    import pickle
-
     if not array_in.flags.aligned:
         raise ValueError('input array not aligned')
 
@@ -143,6 +156,7 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
 
     direction = _pyfftw_to_local(direction)
     fftw_plan_in = kwargs.pop('fftw_plan', None)
+    plan_cache = kwargs.pop('plan_cache', FFTW_PLAN_CACHE)
     planning_effort = _pyfftw_to_local(kwargs.pop('planning_effort',
                                                   'estimate'))
     planning_timelimit = kwargs.pop('planning_timelimit', None)
@@ -174,43 +188,285 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
         if wisdom:
             pyfftw.import_wisdom(wisdom)
 
+    if threads is None:
+        if array_in.size <= 4096:  # Trade-off wrt threading overhead
+            threads = 1
+        else:
+            threads = cpu_count()
+
+    if fftw_plan_in is not None:
+        fftw_plan = fftw_plan_in
+    elif plan_cache is not None and plan_cache.supports(array_in, array_out):
+        fftw_plan = plan_cache.plan(
+            array_in, array_out, direction=direction, axes=axes,
+            halfcomplex=halfcomplex, planning_effort=planning_effort,
+            planning_timelimit=planning_timelimit, threads=threads)
+    else:
+        fftw_plan = _pyfftw_plan(
+            array_in, array_out, direction, axes, halfcomplex,
+            planning_effort, planning_timelimit, threads,
+            array_in_copied)
+
+    fftw_plan(array_in, array_out, normalise_idft=normalise_idft)
+
+    if wexport:
+        try:
+            with open(wexport, 'ab') as wfile:
+                pickle.dump(pyfftw.export_wisdom(), wfile)
+        except TypeError:  # Got file handle
+            pickle.dump(pyfftw.export_wisdom(), wexport)
+
+    return fftw_plan
+
+
+def _pyfftw_plan(array_in, array_out, direction, axes, halfcomplex,
+                 planning_effort, planning_timelimit, threads,
+                 array_in_copied=False):
+    """Create a new FFTW plan for ``array_in`` and ``array_out``."""
     # Copy input array if it hasn't been done yet and the planner is likely
-    # to destroy it. If we already have a plan, we don't have to worry.
+    # to destroy it
     planner_destroys = _pyfftw_destroys_input(
         [planning_effort], direction, halfcomplex, array_in.ndim)
-    must_copy_array_in = fftw_plan_in is None and planner_destroys
 
-    if must_copy_array_in and not array_in_copied:
+    if planner_destroys and not array_in_copied:
         plan_arr_in = np.empty_like(array_in)
         flags = [_local_to_pyfftw(planning_effort), 'FFTW_DESTROY_INPUT']
     else:
         plan_arr_in = array_in
         flags = [_local_to_pyfftw(planning_effort)]
 
-    if fftw_plan_in is None:
-        if threads is None:
-            if plan_arr_in.size <= 4096:  # Trade-off wrt threading overhead
-                threads = 1
-            else:
-                threads = cpu_count()
+    return pyfftw.FFTW(
+        plan_arr_in, array_out, direction=_local_to_pyfftw(direction),
+        flags=flags, planning_timelimit=planning_timelimit,
+        threads=threads, axes=axes)
 
-        fftw_plan = pyfftw.FFTW(
-            plan_arr_in, array_out, direction=_local_to_pyfftw(direction),
-            flags=flags, planning_timelimit=planning_timelimit,
-            threads=threads, axes=axes)
+
+def _array_order(arr):
+    """Return the memory order of a contiguous array, else ``None``."""
+    if arr.flags.c_contiguous:
+        return 'C'
+    elif arr.flags.f_contiguous:
+        return 'F'
     else:
-        fftw_plan = fftw_plan_in
+        return None
 
-    fftw_plan(array_in, array_out, normalise_idft=normalise_idft)
 
-    if wexport:
-        try:
-            with open(wexport, 'ab') as wfile:
-                pickle.dump(pyfftw.export_wisdom(), wfile)
-        except TypeError:  # Got file handle
-            pickle.dump(pyfftw.export_wisdom(), wexport)
+def _is_simd_aligned(arr):
+    """Return ``True`` if ``arr`` fulfills the FFTW SIMD alignment."""
+    return arr.ctypes.data % pyfftw.simd_alignment == 0
 
-    return fftw_plan
+
+class FFTWPlanCache(object):
+
+    """Bounded cache of FFTW plans, shared between transforms.
+
+    Planning an FFTW transform can take much longer than executing it,
+    in particular with planner flags other than ``'estimate'``. The
+    cache stores plans keyed by shapes, data types and memory layouts
+    of the arrays, the transform axes, direction, ``halfcomplex``
+    flag, SIMD alignment, planning effort and number of threads, such
+    that any transform with the same parameters can reuse an existing
+    plan, regardless of which operator created it.
+
+    Plans are created on internal arrays, which are kept alive by the
+    plan. The cache holds at most `max_bytes` bytes of such arrays; if
+    that limit would be exceeded, the least recently used plans are
+    dropped.
+
+    Since the FFTW planner is not thread-safe, plans are created while
+    holding the lock of the cache. Calling a plan with new arrays is not
+    thread-safe either, hence each thread gets its own plans.
+    """
+
+    def __init__(self, max_bytes=FFTW_PLAN_CACHE_MAX_BYTES):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        max_bytes : non-negative int, optional
+            Maximum number of bytes held by the arrays of cached plans.
+        """
+        # Maps key -> (plan, nbytes), least recently used first
+        self.__plans = OrderedDict()
+        self.__nbytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = Lock()
+        self.max_bytes = max_bytes
+
+    @property
+    def max_bytes(self):
+        """Maximum number of bytes held by the cache."""
+        return self.__max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        """Set the memory limit, evicting plans if necessary."""
+        max_bytes = int(max_bytes)
+        if max_bytes < 0:
+            raise ValueError('`max_bytes` must be non-negative, got {}'
+                             ''.format(max_bytes))
+        with self.__lock:
+            self.__max_bytes = max_bytes
+            self.__evict(0)
+
+    @property
+    def nbytes(self):
+        """Number of bytes currently held by the cached plans."""
+        return self.__nbytes
+
+    @property
+    def hits(self):
+        """Number of requests served by a cached plan."""
+        return self.__hits
+
+    @property
+    def misses(self):
+        """Number of requests that created a new plan."""
+        return self.__misses
+
+    def __len__(self):
+        """Return ``len(self)``."""
+        return len(self.__plans)
+
+    @staticmethod
+    def supports(array_in, array_out):
+        """Return ``True`` if plans for the given arrays can be cached.
+
+        Both arrays need to be contiguous. Aliased arrays are only
+        supported if they are identical in memory.
+        """
+        if _array_order(array_in) is None or _array_order(array_out) is None:
+            return False
+        if np.may_share_memory(array_in, array_out):
+            return (array_in.ctypes.data == array_out.ctypes.data and
+                    array_in.shape == array_out.shape and
+                    array_in.dtype == array_out.dtype and
+                    array_in.strides == array_out.strides)
+        return True
+
+    def plan(self, array_in, array_out, direction, axes, halfcomplex,
+             planning_effort='estimate', planning_timelimit=None,
+             threads=1):
+        """Return a plan for the given arrays, creating it if necessary.
+
+        The arrays are not used for planning and are left untouched.
+        See `pyfftw_call` for an explanation of the parameters.
+
+        Returns
+        -------
+        fftw_plan : ``pyfftw.FFTW``
+            Plan that can be called with ``array_in`` and ``array_out``.
+        """
+        direction = _pyfftw_to_local(direction)
+        planning_effort = _pyfftw_to_local(planning_effort)
+        aligned = _is_simd_aligned(array_in) and _is_simd_aligned(array_out)
+        in_place = np.may_share_memory(array_in, array_out)
+        key = (array_in.shape, array_in.dtype, _array_order(array_in),
+               array_out.shape, array_out.dtype, _array_order(array_out),
+               tuple(axes), direction, bool(halfcomplex), aligned, in_place,
+               planning_effort, int(threads), current_thread().ident)
+
+        with self.__lock:
+            try:
+                plan, nbytes = self.__plans.pop(key)
+            except KeyError:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+                self.__plans[key] = (plan, nbytes)
+                return plan
+
+            # Plan on private arrays, keeping the alignment of the inputs
+            flags = [_local_to_pyfftw(planning_effort)]
+            if aligned:
+                empty = pyfftw.empty_aligned
+            else:
+                empty = np.empty
+                flags.append('FFTW_UNALIGNED')
+
+            plan_arr_in = empty(array_in.shape, dtype=array_in.dtype,
+                                order=_array_order(array_in))
+            if in_place:
+                plan_arr_out = plan_arr_in
+                nbytes = plan_arr_in.nbytes
+            else:
+                plan_arr_out = empty(array_out.shape, dtype=array_out.dtype,
+                                     order=_array_order(array_out))
+                nbytes = plan_arr_in.nbytes + plan_arr_out.nbytes
+
+            plan = pyfftw.FFTW(
+                plan_arr_in, plan_arr_out,
+                direction=_local_to_pyfftw(direction), flags=flags,
+                planning_timelimit=planning_timelimit, threads=threads,
+                axes=axes)
+
+            if nbytes <= self.max_bytes:
+                self.__evict(nbytes)
+                self.__plans[key] = (plan, nbytes)
+                self.__nbytes += nbytes
+
+        return plan
+
+    def __evict(self, nbytes):
+        """Drop old plans until ``nbytes`` more bytes fit in the cache."""
+        while self.__plans and self.__nbytes + nbytes > self.max_bytes:
+            _, (_, plan_nbytes) = self.__plans.popitem(last=False)
+            self.__nbytes -= plan_nbytes
+
+    def clear(self):
+        """Remove all plans from the cache."""
+        with self.__lock:
+            self.__plans.clear()
+            self.__nbytes = 0
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{}(max_bytes={})'.format(self.__class__.__name__,
+                                         self.max_bytes)
+
+
+FFTW_PLAN_CACHE = FFTWPlanCache()
+
+
+def export_fftw_wisdom(filename):
+    """Write the FFTW wisdom accumulated so far to a file.
+
+    Together with `import_fftw_wisdom`, this allows to start a new
+    process with the planning results of earlier ones, such that
+    creating plans with planner flags other than ``'estimate'`` is
+    fast from the start.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file to write. An existing file is overwritten.
+    """
+    with open(filename, 'wb') as wfile:
+        pickle.dump(pyfftw.export_wisdom(), wfile)
+
+
+def import_fftw_wisdom(filename):
+    """Load FFTW wisdom from a file written by `export_fftw_wisdom`.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file to read.
+
+    Returns
+    -------
+    success : bool
+        ``True`` if the wisdom for all precisions could be imported,
+        ``False`` otherwise, in particular if the file does not exist.
+    """
+    try:
+        with open(filename, 'rb') as wfile:
+            wisdom = pickle.load(wfile)
+    except IOError:
+        return False
+
+    return all(pyfftw.import_wisdom(wisdom))
 
 
 def _pyfftw_to_local(flag):
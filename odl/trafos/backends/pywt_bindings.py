@@ -383,7 +383,7 @@ def pywt_coeffs_from_flat_array(arr, shapes):
     (array([[2, 2]]), array([[3, 3]]), array([[4, 4]]))
     """
     arr = np.asarray(arr)
-    flat_sizes = [np.prod(shp) for shp in shapes]
+    flat_sizes = [int(np.prod(shp)) for shp in shapes]
     start = 0
     stop = flat_sizes[0]
     coeff_list = [arr[start:stop].reshape(shapes[0])]
@@ -614,7 +614,7 @@ modes.html
     return recon
 
 
-def pywt_multi_level_decomp(arr, wavelet, nlevels, mode):
+def pywt_multi_level_decomp(arr, wavelet, nlevels, mode, out=None):
     """Return multi-level wavelet decomposition coefficients from ``arr``.
 
     Parameters
@@ -631,6 +631,11 @@ def pywt_multi_level_decomp(arr, wavelet, nlevels, mode):
     mode : string, optional
         PyWavelets style signal extension mode. See `signal extension modes`_
         for available options.
+    out : `numpy.ndarray`, optional
+        One-dimensional array in which the coefficients are stored, in
+        the layout of `pywt_flat_array_from_coeffs`. Each level is
+        written into ``out`` as soon as it is computed, hence no
+        intermediate flat array is created.
 
     Returns
     -------
@@ -645,6 +650,7 @@ def pywt_multi_level_decomp(arr, wavelet, nlevels, mode):
         the number of dimensions of the input array.
         See the documentation for the `multilevel decomposition`_ in
         PyWavelets for more information.
+        If ``out`` was given, the arrays are views into ``out``.
 
     See Also
     --------
@@ -707,6 +713,19 @@ wavelet-transform.html#multilevel-decomposition-using-wavedec
     if mode not in PYWT_SUPPORTED_MODES:
         raise ValueError("mode '{}' not understood".format(mode_in))
 
+    if out is not None:
+        # Write each level into its views of `out`, from finest to
+        # coarsest, such that the detail arrays can be freed right away
+        shapes = pywt_coeff_shapes(arr.shape, wavelet, nlevels, mode)
+        coeff_views = pywt_coeffs_from_flat_array(out, shapes)
+        approx = arr
+        for level in range(nlevels):
+            approx, details = pywt_single_level_decomp(approx, wavelet, mode)
+            for view, detail in zip(coeff_views[-1 - level], details):
+                view[:] = detail
+        coeff_views[0][:] = approx
+        return coeff_views
+
     # Fill the list with detail coefficients from coarsest to finest level,
     # by recursively applying the single-level transform to the approximation
     # coefficients, starting with the input array. Append the final
@@ -0,0 +1,143 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Bindings to the ``scipy.fft`` back-end for Fourier transforms.
+
+The `scipy.fft <https://docs.scipy.org/doc/scipy/reference/fft.html>`_
+module (SciPy 1.4 and later) contains a fast Fourier transform
+implementation that can use several worker threads.
+"""
+
+# Imports for common Python 2/3 codebase
+from __future__ import print_function, division, absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from builtins import range
+
+from multiprocessing import cpu_count
+import numpy as np
+try:
+    import scipy.fft as scipy_fft
+    SCIPY_FFT_AVAILABLE = True
+except ImportError:
+    SCIPY_FFT_AVAILABLE = False
+
+from odl.trafos.backends.pyfftw_bindings import _pyfftw_check_args
+from odl.util import is_real_dtype, normalized_axes_tuple
+
+
+__all__ = ('scipy_fft_call', 'SCIPY_FFT_AVAILABLE')
+
+
+def scipy_fft_call(array_in, array_out, direction='forward', axes=None,
+                   halfcomplex=False, workers=None, normalise_idft=False):
+    """Calculate the DFT with ``scipy.fft``.
+
+    The conventions are the same as in `pyfftw_call`, i.e., the forward
+    transform calculates the sum::
+
+        f_hat[k] = sum_j( f[j] * exp(-2*pi*1j * j*k/N) )
+
+    and the backward transform flips the sign in the exponent.
+
+    Parameters
+    ----------
+    array_in : `numpy.ndarray`
+        Array to be transformed
+    array_out : `numpy.ndarray`
+        Output array storing the transformed values, may be aliased
+        with ``array_in``. In this case, ``array_in`` is overwritten
+        with the result.
+    direction : {'forward', 'backward'}, optional
+        Direction of the transform
+    axes : int or sequence of ints, optional
+        Dimensions along which to take the transform. ``None`` means
+        using all axes and is equivalent to ``np.arange(ndim)``.
+    halfcomplex : bool, optional
+        If ``True``, calculate only the negative frequency part along the
+        last axis, using a real-to-complex (forward) or complex-to-real
+        (backward) transform. If ``False``, calculate the full complex
+        FFT.
+    workers : positive int, optional
+        Number of worker threads to use.
+        Default: Number of CPUs if the number of data points is larger
+        than 4096, else 1.
+    normalise_idft : bool, optional
+        If ``True``, the result of the backward transform is divided by
+        ``N``, where ``N`` is the total number of points in
+        ``array_out[axes]``.
+        Default: ``False``
+
+    Returns
+    -------
+    array_out : `numpy.ndarray`
+        The transformed array, a reference to the ``array_out``
+        parameter.
+
+    Examples
+    --------
+    >>> x = np.array([1.0, 2.0, 0.0, 0.0])
+    >>> y = np.empty(3, dtype=complex)
+    >>> scipy_fft_call(x, y, halfcomplex=True)
+    array([ 3.+0.j,  1.-2.j, -1.+0.j])
+    >>> z = np.empty(4)
+    >>> scipy_fft_call(y, z, direction='backward', halfcomplex=True,
+    ...                normalise_idft=True)
+    array([ 1.,  2.,  0.,  0.])
+    """
+    if axes is None:
+        axes = tuple(range(array_in.ndim))
+    axes = normalized_axes_tuple(axes, array_in.ndim)
+
+    direction, direction_in = str(direction).lower(), direction
+    if direction not in ('forward', 'backward'):
+        raise ValueError('`direction` {!r} not understood'
+                         ''.format(direction_in))
+
+    # The same consistency checks as for pyfftw
+    _pyfftw_check_args(array_in, array_out, axes, halfcomplex, direction)
+    if (direction == 'backward' and not halfcomplex and
+            is_real_dtype(array_out.dtype)):
+        raise ValueError('cannot combine full complex backward transform '
+                         'with real output')
+
+    if workers is None:
+        # Trade-off wrt threading overhead
+        workers = 1 if array_in.size <= 4096 else cpu_count()
+
+    # Let the backend work in-place if input and output are aliased
+    overwrite_x = np.may_share_memory(array_in, array_out)
+
+    if halfcomplex and direction == 'forward':
+        result = scipy_fft.rfftn(array_in, axes=axes, workers=workers)
+    elif halfcomplex:
+        shape = [array_out.shape[i] for i in axes]
+        result = scipy_fft.irfftn(array_in, s=shape, axes=axes,
+                                  overwrite_x=overwrite_x, workers=workers)
+    elif direction == 'forward':
+        result = scipy_fft.fftn(array_in, axes=axes, overwrite_x=overwrite_x,
+                                workers=workers)
+    else:
+        result = scipy_fft.ifftn(array_in, axes=axes,
+                                 overwrite_x=overwrite_x, workers=workers)
+
+    if direction == 'backward' and not normalise_idft:
+        # Undo the normalization of the backend and store the result in
+        # one pass
+        num_points = np.prod([array_out.shape[i] for i in axes])
+        np.multiply(result, num_points, out=array_out)
+    elif result is not array_out:
+        array_out[:] = result
+
+    return array_out
+
+
+if __name__ == '__main__':
+    # pylint: disable=wrong-import-position
+    from odl.util.testutils import run_doctests
+    run_doctests(skip_if=not SCIPY_FFT_AVAILABLE)
@@ -0,0 +1,346 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Discrete convolution with a fixed kernel."""
+
+# Imports for common Python 2/3 codebase
+from __future__ import print_function, division, absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from builtins import range, super
+
+from itertools import product
+import numpy as np
+
+from odl.discr import DiscreteLp
+from odl.operator import Operator
+from odl.util import (
+    is_real_dtype, normalized_scalar_param_list, safe_int_conv,
+    signature_string)
+
+
+__all__ = ('Convolution',)
+
+
+# Kernels with at most this many entries are applied directly, larger
+# ones via FFT
+CONVOLUTION_DIRECT_MAX_KERNEL_SIZE = 32
+
+_SUPPORTED_CONV_PAD_MODES = ('constant', 'periodic')
+_SUPPORTED_CONV_METHODS = ('direct', 'fft')
+
+
+def _fast_fft_length(n):
+    """Return the smallest 5-smooth integer that is at least ``n``."""
+    while True:
+        m = n
+        for p in (2, 3, 5):
+            while m % p == 0:
+                m //= p
+        if m == 1:
+            return n
+        n += 1
+
+
+def _padded_region(arr, start, shape, pad_mode):
+    """Return a region of ``arr`` extended beyond its boundaries.
+
+    Parameters
+    ----------
+    arr : `numpy.ndarray`
+        Array from which the region is taken.
+    start : sequence of ints
+        Index of the first entry of the region, may be negative.
+    shape : sequence of ints
+        Shape of the region.
+    pad_mode : {'constant', 'periodic'}
+        Extend ``arr`` by zeros or periodically.
+    """
+    if pad_mode == 'periodic':
+        idcs = [np.arange(s, s + n) % size
+                for s, n, size in zip(start, shape, arr.shape)]
+        return arr[np.ix_(*idcs)]
+
+    region = np.zeros(shape, dtype=arr.dtype)
+    src, dst = [], []
+    for s, n, size in zip(start, shape, arr.shape):
+        lo, hi = max(s, 0), min(s + n, size)
+        if hi <= lo:
+            return region
+        src.append(slice(lo, hi))
+        dst.append(slice(lo - s, hi - s))
+    region[tuple(dst)] = arr[tuple(src)]
+    return region
+
+
+class Convolution(Operator):
+
+    """Discrete convolution with a fixed kernel.
+
+    For a kernel ``k`` with center index ``c``, the operator computes ::
+
+        out[i] = sum_j k[j] * x[i + c - j]
+
+    where ``x`` is extended beyond its boundaries according to
+    ``pad_mode``. The output has the same shape as the input.
+
+    Small kernels are applied directly as a sum of shifted arrays.
+    Larger kernels are applied via FFT, using real-to-complex
+    transforms for real data. The spectrum of the kernel is computed
+    once and cached. If ``block_shape`` is given, the output is computed
+    block by block with the overlap-save method, such that only arrays
+    of roughly the block size need to be transformed.
+
+    The adjoint is the correlation with the same kernel, i.e., the
+    convolution with the flipped and conjugated kernel.
+    """
+
+    def __init__(self, space, kernel, center=None, pad_mode='constant',
+                 method=None, block_shape=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        space : `DiscreteLp`
+            Domain and range of the operator.
+        kernel : `array-like` or ``space`` element
+            Convolution kernel with ``space.ndim`` axes. It can have a
+            different shape than ``space``.
+        center : int or sequence of ints, optional
+            Index of the kernel entry that is applied to ``x[i]`` for
+            ``out[i]``.
+            Default: ``kernel.shape // 2``
+        pad_mode : {'constant', 'periodic'}, optional
+            Extend the input by zeros or periodically beyond its
+            boundaries.
+        method : {'direct', 'fft'}, optional
+            Evaluate the sums directly or via FFT. ``None`` means
+            ``'direct'`` if the kernel has at most
+            ``CONVOLUTION_DIRECT_MAX_KERNEL_SIZE`` entries, otherwise
+            ``'fft'``.
+        block_shape : int or sequence of ints, optional
+            Compute the output in blocks of this shape with the
+            overlap-save method. Only used for ``method='fft'``.
+            Default: ``space.shape``, i.e., one block.
+
+        Examples
+        --------
+        Smoothing with a periodic box filter:
+
+        >>> space = odl.uniform_discr(0, 5, 5)
+        >>> conv = Convolution(space, [1, 1, 1], pad_mode='periodic')
+        >>> conv([1, 0, 0, 0, 2])
+        uniform_discr(0.0, 5.0, 5).element([3.0, 1.0, 0.0, 2.0, 3.0])
+
+        The result does not depend on the evaluation method:
+
+        >>> conv = Convolution(space, [1, 2, 3], method='fft',
+        ...                    block_shape=2)
+        >>> conv([1, 0, 0, 0, 0])
+        uniform_discr(0.0, 5.0, 5).element([2.0, 3.0, 0.0, 0.0, 0.0])
+        >>> conv.adjoint([1, 0, 0, 0, 0])
+        uniform_discr(0.0, 5.0, 5).element([2.0, 1.0, 0.0, 0.0, 0.0])
+        """
+        if not isinstance(space, DiscreteLp):
+            raise TypeError('`space` {!r} is not a `DiscreteLp` instance'
+                            ''.format(space))
+        super().__init__(domain=space, range=space, linear=True)
+
+        kernel = np.array(kernel, dtype=space.dtype, ndmin=space.ndim)
+        if kernel.ndim != space.ndim:
+            raise ValueError('`kernel` must have {} axes, got array with '
+                             'shape {}'.format(space.ndim, kernel.shape))
+        if kernel.size == 0:
+            raise ValueError('`kernel` is empty')
+        kernel.flags.writeable = False
+        self.__kernel = kernel
+
+        if center is None:
+            center = [n // 2 for n in kernel.shape]
+        center = normalized_scalar_param_list(
+            center, length=space.ndim, param_conv=safe_int_conv)
+        if not all(0 <= c < n for c, n in zip(center, kernel.shape)):
+            raise ValueError('`center` {} out of bounds for kernel shape {}'
+                             ''.format(center, kernel.shape))
+        self.__center = tuple(center)
+
+        pad_mode, pad_mode_in = str(pad_mode).lower(), pad_mode
+        if pad_mode not in _SUPPORTED_CONV_PAD_MODES:
+            raise ValueError('`pad_mode` {!r} not understood'
+                             ''.format(pad_mode_in))
+        self.__pad_mode = pad_mode
+
+        if method is None:
+            if kernel.size <= CONVOLUTION_DIRECT_MAX_KERNEL_SIZE:
+                method = 'direct'
+            else:
+                method = 'fft'
+        method, method_in = str(method).lower(), method
+        if method not in _SUPPORTED_CONV_METHODS:
+            raise ValueError('`method` {!r} not understood'
+                             ''.format(method_in))
+        self.__method = method
+
+        if block_shape is None:
+            self.__block_shape = None
+        else:
+            block_shape = normalized_scalar_param_list(
+                block_shape, length=space.ndim, param_conv=safe_int_conv)
+            if any(b <= 0 for b in block_shape):
+                raise ValueError('`block_shape` must be positive, got {}'
+                                 ''.format(block_shape))
+            self.__block_shape = tuple(block_shape)
+
+        # Spectrum of the kernel, computed on first use
+        self.__kernel_ft = None
+
+    @property
+    def kernel(self):
+        """Convolution kernel as read-only array."""
+        return self.__kernel
+
+    @property
+    def center(self):
+        """Index of the kernel center."""
+        return self.__center
+
+    @property
+    def pad_mode(self):
+        """Extension of the input beyond its boundaries."""
+        return self.__pad_mode
+
+    @property
+    def method(self):
+        """Evaluation method, ``'direct'`` or ``'fft'``."""
+        return self.__method
+
+    @property
+    def block_shape(self):
+        """Shape of the output blocks in the overlap-save method."""
+        if self.__block_shape is None:
+            return self.domain.shape
+        else:
+            return tuple(min(b, n) for b, n in zip(self.__block_shape,
+                                                   self.domain.shape))
+
+    @property
+    def fft_shape(self):
+        """Shape of the FFTs used for one block."""
+        return tuple(_fast_fft_length(b + k - 1)
+                     for b, k in zip(self.block_shape, self.kernel.shape))
+
+    @property
+    def kernel_ft(self):
+        """Spectrum of the kernel, zero-padded to `fft_shape`."""
+        if self.__kernel_ft is None:
+            if is_real_dtype(self.domain.dtype):
+                kernel_ft = np.fft.rfftn(self.kernel, s=self.fft_shape)
+            else:
+                kernel_ft = np.fft.fftn(self.kernel, s=self.fft_shape)
+            kernel_ft.flags.writeable = False
+            self.__kernel_ft = kernel_ft
+        return self.__kernel_ft
+
+    def _call(self, x, out):
+        """Implement ``self(x, out)``."""
+        x_arr = x.asarray()
+        out_arr = out.asarray()
+        if self.method == 'direct':
+            self._call_direct(x_arr, out_arr)
+        else:
+            self._call_fft(x_arr, out_arr)
+        out[:] = out_arr
+
+    def _region_start(self, block_start):
+        """Return the input index where the region for a block starts."""
+        return [s - (k - 1 - c) for s, k, c in
+                zip(block_start, self.kernel.shape, self.center)]
+
+    def _call_direct(self, x_arr, out_arr):
+        """Sum up shifted copies of the input."""
+        shape = out_arr.shape
+        kshape = self.kernel.shape
+        region_shape = [n + k - 1 for n, k in zip(shape, kshape)]
+        region = _padded_region(x_arr, self._region_start([0] * len(shape)),
+                                region_shape, self.pad_mode)
+
+        out_arr.fill(0)
+        for j in product(*[range(k) for k in kshape]):
+            weight = self.kernel[j]
+            if weight == 0:
+                continue
+            slc = tuple(slice(k - 1 - ji, k - 1 - ji + n)
+                        for ji, k, n in zip(j, kshape, shape))
+            out_arr += weight * region[slc]
+
+    def _call_fft(self, x_arr, out_arr):
+        """Multiply with the kernel spectrum, block by block."""
+        kshape = self.kernel.shape
+        block_shape = self.block_shape
+        fft_shape = self.fft_shape
+        kernel_ft = self.kernel_ft
+        real = is_real_dtype(self.domain.dtype)
+
+        block_starts = product(*[range(0, n, b) for n, b in
+                                 zip(out_arr.shape, block_shape)])
+        for block_start in block_starts:
+            block = tuple(slice(s, min(s + b, n)) for s, b, n in
+                          zip(block_start, block_shape, out_arr.shape))
+            cur_shape = [slc.stop - slc.start for slc in block]
+            region_shape = [n + k - 1 for n, k in zip(cur_shape, kshape)]
+            region = _padded_region(x_arr, self._region_start(block_start),
+                                    region_shape, self.pad_mode)
+
+            # Circular convolution of the region with the kernel, the
+            # entries starting from index kernel.shape - 1 are not
+            # affected by the wrap-around ("overlap-save")
+            if real:
+                region_ft = np.fft.rfftn(region, s=fft_shape)
+                region_ft *= kernel_ft
+                result = np.fft.irfftn(region_ft, s=fft_shape)
+            else:
+                region_ft = np.fft.fftn(region, s=fft_shape)
+                region_ft *= kernel_ft
+                result = np.fft.ifftn(region_ft)
+
+            valid = tuple(slice(k - 1, k - 1 + n)
+                          for k, n in zip(kshape, cur_shape))
+            out_arr[block] = result[valid]
+
+    @property
+    def adjoint(self):
+        """Adjoint of this operator, the correlation with the kernel.
+
+        Returns
+        -------
+        adjoint : `Convolution`
+            Convolution with the flipped and conjugated kernel.
+        """
+        flip = tuple(slice(None, None, -1) for _ in range(self.domain.ndim))
+        center = [k - 1 - c for k, c in zip(self.kernel.shape, self.center)]
+        return Convolution(self.domain, self.kernel[flip].conj(),
+                           center=center, pad_mode=self.pad_mode,
+                           method=self.method,
+                           block_shape=self.__block_shape)
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        posargs = [self.domain, self.kernel.tolist()]
+        optargs = [('center', list(self.center),
+                    [n // 2 for n in self.kernel.shape]),
+                   ('pad_mode', self.pad_mode, 'constant'),
+                   ('method', self.method, None),
+                   ('block_shape', self.__block_shape, None)]
+        return '{}({})'.format(self.__class__.__name__,
+                               signature_string(posargs, optargs))
+
+
+if __name__ == '__main__':
+    # pylint: disable=wrong-import-position
+    from odl.util.testutils import run_doctests
+    run_doctests()
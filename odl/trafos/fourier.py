@@ -21,9 +21,10 @@ from odl.operator import Operator
 from odl.set import RealNumbers, ComplexNumbers
 from odl.trafos.backends.pyfftw_bindings import (
     pyfftw_call, PYFFTW_AVAILABLE, _pyfftw_to_local)
+from odl.trafos.backends.scipy_fft_bindings import (
+    scipy_fft_call, SCIPY_FFT_AVAILABLE)
 from odl.trafos.util import (
-    reciprocal_grid, reciprocal_space,
-    dft_preprocess_data, dft_postprocess_data)
+    reciprocal_space, dft_preprocess_data, dft_postprocess_data)
 from odl.util import (is_real_dtype, is_complex_floating_dtype,
                       dtype_repr, conj_exponent, complex_dtype,
                       normalized_scalar_param_list, normalized_axes_tuple)
@@ -35,6 +36,9 @@ __all__ = ('DiscreteFourierTransform', 'DiscreteFourierTransformInverse',
 
 _SUPPORTED_FOURIER_IMPLS = ('numpy',)
 _DEFAULT_FOURIER_IMPL = 'numpy'
+if SCIPY_FFT_AVAILABLE:
+    _SUPPORTED_FOURIER_IMPLS += ('scipy',)
+    _DEFAULT_FOURIER_IMPL = 'scipy'
 if PYFFTW_AVAILABLE:
     _SUPPORTED_FOURIER_IMPLS += ('pyfftw',)
     _DEFAULT_FOURIER_IMPL = 'pyfftw'
@@ -45,7 +49,8 @@ class DiscreteFourierTransformBase(Operator):
     """Base class for discrete fourier transform classes."""
 
     def __init__(self, inverse, domain, range=None, axes=None, sign='-',
-                 halfcomplex=False, impl=None):
+                 halfcomplex=False, impl=None, padded_shape=None,
+                 workers=None):
         """Initialize a new instance.
 
         All parameters are given according to the specifics of the forward
@@ -79,10 +84,20 @@ class DiscreteFourierTransformBase(Operator):
             arrays.
             Otherwise, calculate the full complex FFT. If ``dom_dtype``
             is a complex type, this option has no effect.
-        impl : {'numpy', 'pyfftw', ``None``}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw', ``None``}, optional
+            Backend for the FFT implementation. The 'scipy' backend
+            requires ``scipy.fft`` (SciPy 1.4 or later) and can use
+            several threads, the 'pyfftw' backend is usually fastest
+            but requires the ``pyfftw`` package.
             ``None`` selects the fastest available backend.
+        padded_shape : sequence of ints, optional
+            Shape to which the input of the forward transform is
+            zero-padded, one entry per axis in ``axes``. The range of
+            the transform is enlarged accordingly. ``None`` means no
+            padding.
+        workers : positive int, optional
+            Number of threads used by the 'scipy' backend. ``None``
+            chooses depending on the data size.
         """
         if not isinstance(domain, DiscreteLp):
             raise TypeError('`domain` {!r} is not a `DiscreteLp` instance'
@@ -110,6 +125,32 @@ class DiscreteFourierTransformBase(Operator):
         else:
             self.__halfcomplex = bool(halfcomplex)
 
+        # Zero padding
+        if padded_shape is None:
+            padded_shape = [domain.shape[i] for i in self.axes]
+        padded_shape = tuple(int(n) for n in padded_shape)
+        if len(padded_shape) != len(self.axes):
+            raise ValueError('`padded_shape` {} must have length {} (number '
+                             'of axes)'.format(padded_shape, len(self.axes)))
+        if any(n < domain.shape[i] for n, i in zip(padded_shape, self.axes)):
+            raise ValueError('`padded_shape` {} smaller than the shape {} of '
+                             '`domain` in `axes`'
+                             ''.format(padded_shape, domain.shape))
+        self.__padded_shape = padded_shape
+
+        # Shape of the real-space array that is transformed, and the
+        # slice of it holding the unpadded data
+        fft_real_shape = list(domain.shape)
+        for i, n in zip(self.axes, padded_shape):
+            fft_real_shape[i] = n
+        self.__fft_real_shape = tuple(fft_real_shape)
+        if self.__fft_real_shape == domain.shape:
+            self.__pad_slc = None
+        else:
+            self.__pad_slc = tuple(slice(0, n) for n in domain.shape)
+        self.__inverse = bool(inverse)
+        self.__workers = workers
+
         ran_dtype = complex_dtype(domain.dtype)
 
         # Sign of the transform
@@ -122,8 +163,10 @@ class DiscreteFourierTransformBase(Operator):
         self.__sign = sign
 
         # Calculate the range
-        ran_shape = reciprocal_grid(
-            domain.grid, shift=False, halfcomplex=halfcomplex, axes=axes).shape
+        ran_shape = list(self.__fft_real_shape)
+        if self.halfcomplex:
+            ran_shape[self.axes[-1]] = ran_shape[self.axes[-1]] // 2 + 1
+        ran_shape = tuple(ran_shape)
 
         if range is None:
             impl = domain.dspace.impl
@@ -165,18 +208,77 @@ class DiscreteFourierTransformBase(Operator):
         See Also
         --------
         pyfftw_call : Call pyfftw backend directly
+        scipy_fft_call : Call scipy backend directly
         """
-        # TODO: Implement zero padding
+        x_arr = x.asarray()
+        crop_output = self.__pad_slc is not None and self.__inverse
+        if self.__pad_slc is not None and not self.__inverse:
+            x_arr = self._zero_pad(x_arr)
+
+        # The scipy and pyfftw back-ends need complex input and output
+        # for full complex transforms. Like in the numpy path, the real
+        # part of the result is taken for real output.
+        full_complex = not self.halfcomplex and self.impl != 'numpy'
+        if full_complex and is_real_dtype(x_arr.dtype):
+            x_arr = x_arr.astype(complex_dtype(x_arr.dtype))
+        real_tmp = full_complex and is_real_dtype(out.dtype)
+
+        if crop_output or real_tmp:
+            out_dtype = complex_dtype(out.dtype) if real_tmp else out.dtype
+            out_arr = np.empty(self.__fft_real_shape, dtype=out_dtype)
+        else:
+            out_arr = out.asarray()
+
         if self.impl == 'numpy':
-            out[:] = self._call_numpy(x.asarray())
+            result = self._call_numpy(x_arr)
+        elif self.impl == 'scipy':
+            result = self._call_scipy(x_arr, out_arr, **kwargs)
         else:
-            out[:] = self._call_pyfftw(x.asarray(), out.asarray(), **kwargs)
+            result = self._call_pyfftw(x_arr, out_arr, **kwargs)
+
+        if crop_output:
+            result = result[self.__pad_slc]
+        if real_tmp:
+            result = result.real
+        out[:] = result
+
+    def _zero_pad(self, x):
+        """Return ``x`` padded with zeros to the transform shape."""
+        padded = np.zeros(self.__fft_real_shape, dtype=x.dtype)
+        padded[self.__pad_slc] = x
+        return padded
+
+    def _fft_arrays(self):
+        """Return new input and output arrays of the FFT step."""
+        if self.__pad_slc is not None and not self.__inverse:
+            arr_in = np.empty(self.__fft_real_shape, dtype=self.domain.dtype)
+        else:
+            arr_in = self.domain.element().asarray()
+        if self.__pad_slc is not None and self.__inverse:
+            arr_out = np.empty(self.__fft_real_shape, dtype=self.range.dtype)
+        else:
+            arr_out = self.range.element().asarray()
+        return arr_in, arr_out
 
     @property
     def impl(self):
         """Backend for the FFT implementation."""
         return self.__impl
 
+    @property
+    def padded_shape(self):
+        """Shape of the transformed real-space array in `axes`.
+
+        It is larger than the shape of the real space if the data is
+        zero-padded.
+        """
+        return self.__padded_shape
+
+    @property
+    def workers(self):
+        """Number of threads used by the 'scipy' backend."""
+        return self.__workers
+
     @property
     def axes(self):
         """Axes along the FT is calculated by this operator."""
@@ -200,6 +302,9 @@ class DiscreteFourierTransformBase(Operator):
         --------
         inverse
         """
+        if self.__pad_slc is not None:
+            raise NotImplementedError('no adjoint defined for zero-padded '
+                                      'transforms')
         if self.domain.exponent == 2.0 and self.range.exponent == 2.0:
             return self.inverse
         else:
@@ -230,6 +335,25 @@ class DiscreteFourierTransformBase(Operator):
         """
         raise NotImplementedError('abstract method')
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x[, out, **kwargs])`` using scipy.fft.
+
+        Parameters
+        ----------
+        x : `numpy.ndarray`
+            Input array to be transformed
+        out : `numpy.ndarray`
+            Output array storing the result
+        workers : positive int, optional
+            Number of threads to use. Default: `workers`
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Result of the transform, a reference to ``out``.
+        """
+        raise NotImplementedError('abstract method')
+
     def _call_pyfftw(self, x, out, **kwargs):
         """Implement ``self(x[, out, **kwargs])`` using pyfftw.
 
@@ -325,13 +449,12 @@ class DiscreteFourierTransformBase(Operator):
         if self.impl != 'pyfftw':
             raise ValueError('cannot create fftw plan without fftw backend')
 
-        x = self.domain.element()
-        y = self.range.element()
+        x, y = self._fft_arrays()
         kwargs.pop('planning_timelimit', None)
 
         direction = 'forward' if self.sign == '-' else 'backward'
         self._fftw_plan = pyfftw_call(
-            x.asarray(), y.asarray(), direction=direction,
+            x, y, direction=direction,
             halfcomplex=self.halfcomplex, axes=self.axes,
             planning_effort=planning_effort, **kwargs)
 
@@ -345,7 +468,9 @@ class DiscreteFourierTransformBase(Operator):
 
         Notes
         -----
-        If no plan exists, this is a no-op.
+        If no plan exists, this is a no-op. Plans that are also held by
+        `FFTW_PLAN_CACHE` are only freed when they are evicted from
+        the cache, see `FFTWPlanCache.clear`.
         """
         if self.impl != 'pyfftw':
             raise ValueError('cannot create fftw plan without fftw backend')
@@ -382,7 +507,8 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
     """
 
     def __init__(self, domain, range=None, axes=None, sign='-',
-                 halfcomplex=False, impl=None):
+                 halfcomplex=False, impl=None, padded_shape=None,
+                 workers=None):
         """Initialize a new instance.
 
         Parameters
@@ -409,10 +535,19 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
             arrays.
             Otherwise, calculate the full complex FFT. If ``dom_dtype``
             is a complex type, this option has no effect.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The ``'pyfftw'`` backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFT implementation. The ``'scipy'`` and
+            ``'pyfftw'`` backends are faster but require ``scipy.fft``
+            or the ``pyfftw`` package, respectively.
             ``None`` selects the fastest available backend.
+        padded_shape : sequence of ints, optional
+            Shape to which the input is zero-padded before the
+            transform, one entry per axis in ``axes``. The range has
+            this shape (halved in the last axis for half-complex
+            transforms). ``None`` means no padding.
+        workers : positive int, optional
+            Number of threads used by the ``'scipy'`` backend. ``None``
+            chooses depending on the data size.
 
         Examples
         --------
@@ -437,9 +572,26 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
         (2, 2, 4)
         >>> fft.domain.shape
         (2, 3, 4)
+
+        With zero padding, the input is extended by zeros to
+        ``padded_shape`` before transforming:
+
+        >>> domain = discr_sequence_space(4, dtype='complex')
+        >>> fft = DiscreteFourierTransform(domain, padded_shape=(8,))
+        >>> fft.range.shape
+        (8,)
+        >>> y = fft([1, 2, 3, 4])
+        >>> y[0]  # sum of the entries
+        (10+0j)
+
+        The inverse discards the padded part:
+
+        >>> np.allclose(fft.inverse(y), [1, 2, 3, 4])
+        True
         """
         super().__init__(inverse=False, domain=domain, range=range, axes=axes,
-                         sign=sign, halfcomplex=halfcomplex, impl=impl)
+                         sign=sign, halfcomplex=halfcomplex, impl=impl,
+                         padded_shape=padded_shape, workers=workers)
 
     def _call_numpy(self, x):
         """Return ``self(x)`` using numpy.
@@ -457,9 +609,23 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
                 return np.fft.fftn(x, axes=self.axes)
             else:
                 # Need to undo Numpy IFFT scaling
-                return (np.prod(np.take(self.domain.shape, self.axes)) *
+                return (np.prod(self.padded_shape) *
                         np.fft.ifftn(x, axes=self.axes))
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x[, out, **kwargs])`` using scipy.fft.
+
+        See Also
+        --------
+        DiscreteFourierTransformBase._call_scipy
+        """
+        direction = 'forward' if self.sign == '-' else 'backward'
+        return scipy_fft_call(
+            x, out, direction=direction, axes=self.axes,
+            halfcomplex=self.halfcomplex,
+            workers=kwargs.pop('workers', self.workers),
+            normalise_idft=False)
+
     def _call_pyfftw(self, x, out, **kwargs):
         """Implement ``self(x[, out, **kwargs])`` using pyfftw.
 
@@ -495,11 +661,16 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
 
     @property
     def inverse(self):
-        """Inverse Fourier transform."""
+        """Inverse Fourier transform.
+
+        For zero-padded transforms, this is a left inverse that
+        discards the padded part.
+        """
         sign = '+' if self.sign == '-' else '-'
         return DiscreteFourierTransformInverse(
             domain=self.range, range=self.domain, axes=self.axes,
-            halfcomplex=self.halfcomplex, sign=sign)
+            halfcomplex=self.halfcomplex, sign=sign, impl=self.impl,
+            padded_shape=self.padded_shape, workers=self.workers)
 
 
 class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
@@ -532,7 +703,8 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
        http://www.fftw.org/fftw3_doc/What-FFTW-Really-Computes.html
     """
     def __init__(self, range, domain=None, axes=None, sign='+',
-                 halfcomplex=False, impl=None):
+                 halfcomplex=False, impl=None, padded_shape=None,
+                 workers=None):
         """Initialize a new instance.
 
         Parameters
@@ -559,10 +731,19 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
             ``floor(N[i]/2) + 1`` in this axis ``i``.
             Otherwise, domain and range have the same shape. If
             ``range`` is a complex space, this option has no effect.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFT implementation. The 'scipy' and 'pyfftw'
+            backends are faster but require ``scipy.fft`` or the
+            ``pyfftw`` package, respectively.
             ``None`` selects the fastest available backend.
+        padded_shape : sequence of ints, optional
+            Shape of the zero-padded forward transform input, one entry
+            per axis in ``axes``. The inverse transform is computed
+            with this shape and cropped to the shape of ``range``.
+            ``None`` means no padding.
+        workers : positive int, optional
+            Number of threads used by the 'scipy' backend. ``None``
+            chooses depending on the data size.
 
         Examples
         --------
@@ -589,7 +770,8 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
         (2, 3, 4)
         """
         super().__init__(inverse=True, domain=range, range=domain, axes=axes,
-                         sign=sign, halfcomplex=halfcomplex, impl=impl)
+                         sign=sign, halfcomplex=halfcomplex, impl=impl,
+                         padded_shape=padded_shape, workers=workers)
 
     def _call_numpy(self, x):
         """Return ``self(x)`` using numpy.
@@ -605,13 +787,34 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
             Result of the transform
         """
         if self.halfcomplex:
-            return np.fft.irfftn(x, axes=self.axes)
+            return np.fft.irfftn(x, s=self.padded_shape, axes=self.axes)
         else:
             if self.sign == '+':
                 return np.fft.ifftn(x, axes=self.axes)
             else:
                 return (np.fft.fftn(x, axes=self.axes) /
-                        np.prod(np.take(self.domain.shape, self.axes)))
+                        np.prod(self.padded_shape))
+
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x[, out, **kwargs])`` using scipy.fft.
+
+        See Also
+        --------
+        DiscreteFourierTransformBase._call_scipy
+        """
+        direction = 'forward' if self.sign == '-' else 'backward'
+        scipy_fft_call(
+            x, out, direction=direction, axes=self.axes,
+            halfcomplex=self.halfcomplex,
+            workers=kwargs.pop('workers', self.workers),
+            normalise_idft=True)
+
+        # Normalization is only done for 'backward', we need it for
+        # 'forward', too.
+        if self.sign == '-':
+            out /= np.prod(self.padded_shape)
+
+        return out
 
     def _call_pyfftw(self, x, out, **kwargs):
         """Implement ``self(x[, out, **kwargs])`` using pyfftw.
@@ -669,17 +872,22 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
 
         # Need to normalize for 'forward', no way to force pyfftw
         if self.sign == '-':
-            out /= np.prod(np.take(self.domain.shape, self.axes))
+            out /= np.prod(self.padded_shape)
 
         return out
 
     @property
     def inverse(self):
-        """Inverse Fourier transform."""
+        """Inverse Fourier transform.
+
+        For zero-padded transforms, this is a right inverse that
+        pads the input with zeros.
+        """
         sign = '-' if self.sign == '+' else '+'
         return DiscreteFourierTransform(
             domain=self.range, range=self.domain, axes=self.axes,
-            halfcomplex=self.halfcomplex, sign=sign)
+            halfcomplex=self.halfcomplex, sign=sign, impl=self.impl,
+            padded_shape=self.padded_shape, workers=self.workers)
 
 
 class FourierTransformBase(Operator):
@@ -728,9 +936,10 @@ class FourierTransformBase(Operator):
             is determined from ``domain`` and the other parameters. The
             exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFT implementation. The 'scipy' and 'pyfftw'
+            backends are faster but require ``scipy.fft`` or the
+            ``pyfftw`` package, respectively.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -766,6 +975,10 @@ class FourierTransformBase(Operator):
 
             Variants using this: R2C, C2R (inverse), HC2R (inverse)
 
+        workers : positive int, optional
+            Number of threads used by the 'scipy' backend. ``None``
+            chooses depending on the data size.
+
         Notes
         -----
         * The transform variants are:
@@ -863,6 +1076,8 @@ class FourierTransformBase(Operator):
         self._tmp_r = tmp_r
         self._tmp_f = tmp_f
 
+        self.__workers = kwargs.pop('workers', None)
+
     def _call(self, x, out, **kwargs):
         """Implement ``self(x, out[, **kwargs])``.
 
@@ -886,6 +1101,9 @@ class FourierTransformBase(Operator):
         # TODO: Implement zero padding
         if self.impl == 'numpy':
             out[:] = self._call_numpy(x.asarray())
+        elif self.impl == 'scipy':
+            # 0-overhead assignment if asarray() does not copy
+            out[:] = self._call_scipy(x.asarray(), out.asarray(), **kwargs)
         else:
             # 0-overhead assignment if asarray() does not copy
             out[:] = self._call_pyfftw(x.asarray(), out.asarray(), **kwargs)
@@ -932,11 +1150,55 @@ class FourierTransformBase(Operator):
         """
         raise NotImplementedError('abstract method')
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x[, out, **kwargs])`` for scipy back-end.
+
+        Pre- and post-processing are the same as for the pyfftw
+        back-end, only the FFT step differs (see `_fft_call`).
+
+        Parameters
+        ----------
+        x : `numpy.ndarray`
+            Array representing the function to be transformed
+        out : `numpy.ndarray`
+            Array to which the output is written
+        workers : positive int, optional
+            Number of threads to use. Default: `workers`
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Result of the transform. The returned object is a reference
+            to the input parameter ``out``.
+        """
+        return self._call_pyfftw(x, out, **kwargs)
+
+    def _fft_call(self, arr_in, arr_out, direction, normalise_idft,
+                  **kwargs):
+        """Compute the FFT step with the backend given by `impl`."""
+        if self.impl == 'scipy':
+            scipy_fft_call(
+                arr_in, arr_out, direction=direction,
+                halfcomplex=self.halfcomplex, axes=self.axes,
+                workers=kwargs.pop('workers', self.workers),
+                normalise_idft=normalise_idft)
+        else:
+            self._fftw_plan = pyfftw_call(
+                arr_in, arr_out, direction=direction,
+                halfcomplex=self.halfcomplex, axes=self.axes,
+                normalise_idft=normalise_idft, **kwargs)
+        return arr_out
+
     @property
     def impl(self):
         """Backend for the FFT implementation."""
         return self.__impl
 
+    @property
+    def workers(self):
+        """Number of threads used by the 'scipy' backend."""
+        return self.__workers
+
     @property
     def axes(self):
         """Axes along the FT is calculated by this operator."""
@@ -961,6 +1223,10 @@ class FourierTransformBase(Operator):
     def adjoint(self):
         """Adjoint transform, equal to the inverse.
 
+        For half-complex transforms, the range is weighted such that
+        inner products are those of the full spectra, hence the inverse
+        acts directly on the half spectrum.
+
         See Also
         --------
         inverse
@@ -984,7 +1250,8 @@ class FourierTransformBase(Operator):
         return FourierTransformInverse(
             domain=self.range, range=self.domain, impl=self.impl,
             axes=self.axes, halfcomplex=self.halfcomplex, shift=self.shifts,
-            sign=sign, tmp_r=self._tmp_r, tmp_f=self._tmp_f)
+            sign=sign, tmp_r=self._tmp_r, tmp_f=self._tmp_f,
+            workers=self.workers)
 
     def create_temporaries(self, r=True, f=True):
         """Allocate and store reusable temporaries.
@@ -1123,7 +1390,9 @@ class FourierTransformBase(Operator):
 
         Notes
         -----
-        If no plan exists, this is a no-op.
+        If no plan exists, this is a no-op. Plans that are also held by
+        `FFTW_PLAN_CACHE` are only freed when they are evicted from
+        the cache, see `FFTWPlanCache.clear`.
         """
 
         if self.impl != 'pyfftw':
@@ -1171,9 +1440,10 @@ class FourierTransform(FourierTransformBase):
             is determined from ``domain`` and the other parameters. The
             exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFT implementation. The 'scipy' and 'pyfftw'
+            backends are faster but require ``scipy.fft`` or the
+            ``pyfftw`` package, respectively.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -1209,6 +1479,10 @@ class FourierTransform(FourierTransformBase):
 
             Variants using this: R2C, C2R (inverse), HC2R (inverse)
 
+        workers : positive int, optional
+            Number of threads used by the 'scipy' backend. ``None``
+            chooses depending on the data size.
+
         Notes
         -----
         * The transform variants are:
@@ -1357,9 +1631,8 @@ class FourierTransform(FourierTransformBase):
         # The FFT is calculated in-place, except if the range is real and
         # we don't use halfcomplex.
         direction = 'forward' if self.sign == '-' else 'backward'
-        self._fftw_plan = pyfftw_call(
-            preproc, out, direction=direction, halfcomplex=self.halfcomplex,
-            axes=self.axes, normalise_idft=False, **kwargs)
+        self._fft_call(preproc, out, direction=direction,
+                       normalise_idft=False, **kwargs)
 
         assert is_complex_floating_dtype(out.dtype)
 
@@ -1375,7 +1648,8 @@ class FourierTransform(FourierTransformBase):
         return FourierTransformInverse(
             domain=self.range, range=self.domain, impl=self.impl,
             axes=self.axes, halfcomplex=self.halfcomplex, shift=self.shifts,
-            sign=sign, tmp_r=self._tmp_r, tmp_f=self._tmp_f)
+            sign=sign, tmp_r=self._tmp_r, tmp_f=self._tmp_f,
+            workers=self.workers)
 
 
 class FourierTransformInverse(FourierTransformBase):
@@ -1407,9 +1681,10 @@ class FourierTransformInverse(FourierTransformBase):
             domain is determined from ``range`` and the other parameters.
             The exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFT implementation. The 'scipy' and 'pyfftw'
+            backends are faster but require ``scipy.fft`` or the
+            ``pyfftw`` package, respectively.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -1445,6 +1720,10 @@ class FourierTransformInverse(FourierTransformBase):
 
             Variants using this: C2R, HC2R, R2C (forward)
 
+        workers : positive int, optional
+            Number of threads used by the 'scipy' backend. ``None``
+            chooses depending on the data size.
+
         Notes
         -----
         * The transform variants are:
@@ -1602,17 +1881,13 @@ class FourierTransformInverse(FourierTransformBase):
         if self.range.field == RealNumbers() and not self.halfcomplex:
             # Need to use a complex array as out if we do C2R since the
             # FFT has to be C2C
-            self._fftw_plan = pyfftw_call(
-                preproc, preproc, direction=direction,
-                halfcomplex=self.halfcomplex, axes=self.axes,
-                normalise_idft=True, **kwargs)
+            self._fft_call(preproc, preproc, direction=direction,
+                           normalise_idft=True, **kwargs)
             fft_arr = preproc
         else:
             # Only here we can use out directly
-            self._fftw_plan = pyfftw_call(
-                preproc, out, direction=direction,
-                halfcomplex=self.halfcomplex, axes=self.axes,
-                normalise_idft=True, **kwargs)
+            self._fft_call(preproc, out, direction=direction,
+                           normalise_idft=True, **kwargs)
             fft_arr = out
 
         # Normalization is only done for 'backward', we need it for 'forward',
@@ -1633,7 +1908,8 @@ class FourierTransformInverse(FourierTransformBase):
         return FourierTransform(
             domain=self.range, range=self.domain, impl=self.impl,
             axes=self.axes, halfcomplex=self.halfcomplex, shift=self.shifts,
-            sign=sign, tmp_r=self._tmp_r, tmp_f=self._tmp_f)
+            sign=sign, tmp_r=self._tmp_r, tmp_f=self._tmp_f,
+            workers=self.workers)
 
 
 if __name__ == '__main__':
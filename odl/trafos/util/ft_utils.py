@@ -14,12 +14,15 @@ from future import standard_library
 standard_library.install_aliases()
 from builtins import range
 
+from collections import OrderedDict
+from threading import Lock
 import numpy as np
 
 from odl.discr import (
     uniform_grid, DiscreteLp, uniform_partition_fromgrid,
     uniform_discr_frompartition)
 from odl.set import RealNumbers
+from odl.space.npy_ntuples import NumpyFnHermitianWeighting
 from odl.util import (
     fast_1d_tensor_mult,
     is_real_dtype, is_scalar_dtype, is_real_floating_dtype,
@@ -33,6 +36,38 @@ __all__ = ('reciprocal_grid', 'realspace_grid',
            'dft_preprocess_data', 'dft_postprocess_data')
 
 
+# Maximum number of one-dimensional factor arrays kept by the pre- and
+# post-processing functions
+DFT_FACTOR_CACHE_MAX_SIZE = 256
+
+# Maps key -> read-only factor array, least recently used first
+_DFT_FACTOR_CACHE = OrderedDict()
+_DFT_FACTOR_CACHE_LOCK = Lock()
+
+
+def _cached_factor(key, func):
+    """Return ``func()``, cached under ``key``.
+
+    The returned array is read-only since it is shared between calls.
+    """
+    with _DFT_FACTOR_CACHE_LOCK:
+        try:
+            factor = _DFT_FACTOR_CACHE.pop(key)
+        except KeyError:
+            pass
+        else:
+            _DFT_FACTOR_CACHE[key] = factor
+            return factor
+
+    factor = func()
+    factor.flags.writeable = False
+    with _DFT_FACTOR_CACHE_LOCK:
+        _DFT_FACTOR_CACHE[key] = factor
+        while len(_DFT_FACTOR_CACHE) > DFT_FACTOR_CACHE_MAX_SIZE:
+            _DFT_FACTOR_CACHE.popitem(last=False)
+    return factor
+
+
 def reciprocal_grid(grid, shift=True, axes=None, halfcomplex=False):
     """Return the reciprocal of the given regular grid.
 
@@ -298,6 +333,9 @@ def dft_preprocess_data(arr, shift=True, axes=None, sign='-', out=None):
     is the same as that of ``arr`` except when ``arr`` has real data
     type and ``shift`` is not ``True``. In this case, the return type
     is the complex counterpart of ``arr.dtype``.
+
+    The one-dimensional factors are cached, and the copy from ``arr``
+    to ``out`` is done in the same pass as the multiplication.
     """
     arr = np.asarray(arr)
     if not is_scalar_dtype(arr.dtype):
@@ -318,44 +356,45 @@ def dft_preprocess_data(arr, shift=True, axes=None, sign='-', out=None):
     shift_list = normalized_scalar_param_list(shift, length=len(axes),
                                               param_conv=bool)
 
-    # Make a copy of arr with correct data type if necessary, or copy values.
+    # Allocate the output with correct data type if necessary. The values
+    # are copied from arr during multiplication.
     if out is None:
         if is_real_dtype(arr.dtype) and not all(shift_list):
-            out = np.array(arr, dtype=complex_dtype(arr.dtype), copy=True)
+            out = np.empty(shape, dtype=complex_dtype(arr.dtype))
         else:
-            out = arr.copy()
-    else:
-        out[:] = arr
+            out = np.empty(shape, dtype=arr.dtype)
 
     if is_real_dtype(out.dtype) and not shift:
         raise ValueError('cannot pre-process real input in-place without '
                          'shift')
 
-    if sign == '-':
-        imag = -1j
-    elif sign == '+':
-        imag = 1j
-    else:
+    if sign not in ('-', '+'):
         raise ValueError("`sign` '{}' not understood".format(sign))
 
-    def _onedim_arr(length, shift):
+    onedim_arrs = [_dft_preprocess_factor(shape[axis], shift, sign, out.dtype)
+                   for axis, shift in zip(axes, shift_list)]
+
+    fast_1d_tensor_mult(arr, onedim_arrs, axes=axes, out=out)
+    return out
+
+
+def _dft_preprocess_factor(length, shift, sign, dtype):
+    """Return the 1d pre-processing factor, see `dft_preprocess_data`."""
+    key = ('pre', length, shift, sign, np.dtype(dtype))
+
+    def factor():
         if shift:
             # (-1)^indices
-            factor = np.ones(length, dtype=out.dtype)
+            factor = np.ones(length, dtype=dtype)
             factor[1::2] = -1
         else:
-            factor = np.arange(length, dtype=out.dtype)
+            imag = -1j if sign == '-' else 1j
+            factor = np.arange(length, dtype=dtype)
             factor *= -imag * np.pi * (1 - 1.0 / length)
             np.exp(factor, out=factor)
-        return factor.astype(out.dtype, copy=False)
+        return factor.astype(dtype, copy=False)
 
-    onedim_arrs = []
-    for axis, shift in zip(axes, shift_list):
-        length = shape[axis]
-        onedim_arrs.append(_onedim_arr(length, shift))
-
-    fast_1d_tensor_mult(out, onedim_arrs, axes=axes, out=out)
-    return out
+    return _cached_factor(key, factor)
 
 
 def _interp_kernel_ft(norm_freqs, interp):
@@ -456,6 +495,12 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
     out : `numpy.ndarray`
         Result of the post-processing. If ``out`` was given, the returned
         object is a reference to it.
+
+    Notes
+    -----
+    The one-dimensional factors, i.e., the products of phase factors and
+    interpolation kernel values per axis, are cached, and the copy from
+    ``arr`` to ``out`` is done in the same pass as the multiplication.
     """
     arr = np.asarray(arr)
     if is_real_floating_dtype(arr.dtype):
@@ -465,9 +510,7 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
                          'data type'.format(dtype_repr(arr.dtype)))
 
     if out is None:
-        out = arr.copy()
-    elif out is not arr:
-        out[:] = arr
+        out = np.empty(arr.shape, dtype=arr.dtype)
 
     if axes is None:
         axes = list(range(arr.ndim))
@@ -480,11 +523,7 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
     shift_list = normalized_scalar_param_list(shift, length=len(axes),
                                               param_conv=bool)
 
-    if sign == '-':
-        imag = -1j
-    elif sign == '+':
-        imag = 1j
-    else:
+    if sign not in ('-', '+'):
         raise ValueError("`sign` '{}' not understood".format(sign))
 
     op, op_in = str(op).lower(), op
@@ -500,17 +539,33 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
     else:
         interp = [str(interp).lower()] * arr.ndim
 
-    onedim_arrs = []
-    for ax, shift, intp in zip(axes, shift_list, interp):
-        x = real_grid.min_pt[ax]
-        xi = recip_grid.coord_vectors[ax]
+    onedim_arrs = [
+        _dft_postprocess_factor(real_grid, recip_grid, ax, shift, intp,
+                                sign, op, out.dtype)
+        for ax, shift, intp in zip(axes, shift_list, interp)]
+
+    fast_1d_tensor_mult(arr, onedim_arrs, axes=axes, out=out)
+    return out
+
+
+def _dft_postprocess_factor(real_grid, recip_grid, ax, shift, interp, sign,
+                            op, dtype):
+    """Return the 1d post-processing factor, see `dft_postprocess_data`."""
+    x = real_grid.min_pt[ax]
+    xi = recip_grid.coord_vectors[ax]
+    len_orig = real_grid.shape[ax]
+    stride = real_grid.stride[ax]
+    key = ('post', x, stride, len_orig, xi.tobytes(), shift,
+           str(interp).lower(), sign, op, np.dtype(dtype))
+
+    def factor():
+        imag = -1j if sign == '-' else 1j
 
         # First part: exponential array
         onedim_arr = np.exp(imag * x * xi)
 
         # Second part: interpolation kernel
-        len_dft = recip_grid.shape[ax]
-        len_orig = real_grid.shape[ax]
+        len_dft = len(xi)
         halfcomplex = (len_dft < len_orig)
         odd = len_orig % 2
 
@@ -534,9 +589,8 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
                 fmax = 0.5 - 1.0 / (2 * len_orig)
 
         freqs = np.linspace(fmin, fmax, num=len_dft)
-        stride = real_grid.stride[ax]
 
-        interp_kernel = _interp_kernel_ft(freqs, intp)
+        interp_kernel = _interp_kernel_ft(freqs, interp)
         interp_kernel *= stride
 
         if op == 'multiply':
@@ -544,10 +598,40 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
         else:
             onedim_arr /= interp_kernel
 
-        onedim_arrs.append(onedim_arr.astype(out.dtype, copy=False))
+        return onedim_arr.astype(dtype, copy=False)
 
-    fast_1d_tensor_mult(out, onedim_arrs, axes=axes, out=out)
-    return out
+    return _cached_factor(key, factor)
+
+
+def _halfcomplex_weights(shape, axis, len_orig, shift, const, bdry_fracs):
+    """Return the flat weighting array of a half-complex space.
+
+    Along ``axis``, entries whose mirrored counterpart is neither stored
+    nor absent from the full grid get weight ``2 * const``, all other
+    entries get weight ``const``.
+
+    `DiscreteLp` scales the outermost entries by the fractions
+    ``bdry_fracs`` of their cells in the domain. The weights of these
+    entries are divided by the fractions to compensate, since the
+    Hermitian weights already count every entry with its full cell.
+    """
+    key = ('halfcomplex_weights', tuple(shape), axis, len_orig, bool(shift),
+           float(const), tuple(float(f) for f in bdry_fracs))
+
+    def weights():
+        len_half = shape[axis]
+        idx = np.arange(len_half)
+        mirror = len_orig - idx if shift else len_orig - 1 - idx
+        onedim_w = np.where((mirror >= len_orig) | (mirror < len_half),
+                            1.0, 2.0) * const
+        onedim_w[0] /= bdry_fracs[0]
+        onedim_w[-1] /= bdry_fracs[1]
+        bcast_shape = [1] * len(shape)
+        bcast_shape[axis] = len_half
+        return np.broadcast_to(onedim_w.reshape(bcast_shape),
+                               shape).ravel()
+
+    return _cached_factor(key, weights)
 
 
 def reciprocal_space(space, axes=None, halfcomplex=False, shift=True,
@@ -592,6 +676,23 @@ def reciprocal_space(space, axes=None, halfcomplex=False, shift=True,
         Reciprocal of the input ``space``. If ``halfcomplex=True``, the
         upper end of the domain (where the half space ends) is chosen to
         coincide with the grid node.
+        For ``halfcomplex=True``, ``impl='numpy'`` and finite exponent,
+        the space is weighted with `NumpyFnHermitianWeighting`, such that
+        inner products, norms and distances equal those of the full
+        Hermitian-symmetric spectra.
+
+    Examples
+    --------
+    Norms in the half-complex space are the same as for the full
+    spectrum:
+
+    >>> space = odl.uniform_discr(0, 1, 4)
+    >>> full_space = reciprocal_space(space)
+    >>> half_space = reciprocal_space(space, halfcomplex=True)
+    >>> full = full_space.element([1, 2 + 1j, 3, 2 - 1j])
+    >>> half = half_space.element([1, 2 + 1j, 3])
+    >>> np.isclose(full.norm(), half.norm())
+    True
     """
     if not isinstance(space, DiscreteLp):
         raise TypeError('`space` {!r} is not a `DiscreteLp` instance'
@@ -627,12 +728,16 @@ def reciprocal_space(space, axes=None, halfcomplex=False, shift=True,
                                  halfcomplex=halfcomplex, axes=axes)
 
     # Make a partition with nodes on the boundary in the last transform axis
-    # if `halfcomplex == True`, otherwise a standard partition.
+    # if `halfcomplex == True`, otherwise a standard partition. Axes that
+    # are not transformed keep their extent, which cannot be inferred from
+    # the grid if it has only one point there.
+    other_axes = [i for i in range(space.ndim) if i not in axes]
+    min_pt = {i: space.min_pt[i] for i in other_axes}
+    max_pt = {i: space.max_pt[i] for i in other_axes}
     if halfcomplex:
-        max_pt = {axes[-1]: recip_grid.max_pt[axes[-1]]}
-        part = uniform_partition_fromgrid(recip_grid, max_pt=max_pt)
-    else:
-        part = uniform_partition_fromgrid(recip_grid)
+        max_pt[axes[-1]] = recip_grid.max_pt[axes[-1]]
+    part = uniform_partition_fromgrid(recip_grid, min_pt=min_pt,
+                                      max_pt=max_pt)
 
     # Use convention of adding a hat to represent fourier transform of variable
     axis_labels = list(space.axis_labels)
@@ -641,9 +746,22 @@ def reciprocal_space(space, axes=None, halfcomplex=False, shift=True,
         label = axis_labels[i].replace('$', '')
         axis_labels[i] = '$\^{{{}}}$'.format(label)
 
+    # In the half-complex case, let the weighting account for the
+    # missing half of the spectrum
+    if halfcomplex and impl == 'numpy' and exponent != float('inf'):
+        last_shift = normalized_scalar_param_list(
+            shift, length=len(axes), param_conv=bool)[-1]
+        weights = _halfcomplex_weights(
+            part.shape, axes[-1], space.shape[axes[-1]], last_shift,
+            part.cell_volume, part.boundary_cell_fractions[axes[-1]])
+        weighting = NumpyFnHermitianWeighting(weights, exponent)
+    else:
+        weighting = 'const'
+
     recip_spc = uniform_discr_frompartition(part, exponent=exponent,
                                             dtype=dtype, impl=impl,
-                                            axis_labels=axis_labels)
+                                            axis_labels=axis_labels,
+                                            weighting=weighting)
 
     return recip_spc
 
@@ -129,6 +129,11 @@ class WaveletTransformBase(Operator):
         if self.impl == 'pywt':
             self.pywt_pad_mode = pywt_pad_mode(pad_mode, pad_const)
             self.pywt_wavelet = pywt_wavelet(self.wavelet)
+            # Shapes of the coefficients, they determine the layout
+            # of the flat coefficient vector
+            self.__coeff_shapes = tuple(pywt_coeff_shapes(
+                space.shape, self.pywt_wavelet, self.nlevels,
+                self.pywt_pad_mode))
             coeff_size = pywt_flat_coeff_size(space.shape, wavelet,
                                               self.nlevels, self.pywt_pad_mode)
             coeff_space = space.dspace_type(coeff_size, dtype=space.dtype)
@@ -171,6 +176,15 @@ class WaveletTransformBase(Operator):
         """Value for extension used in ``'constant'`` padding mode."""
         return self.__pad_const
 
+    @property
+    def coeff_shapes(self):
+        """Shapes of the coefficients in the flat coefficient vector.
+
+        The order is ``(shape_aN, shape_DN, ..., shape_D1)``, see
+        `pywt_coeff_shapes` for details.
+        """
+        return self.__coeff_shapes
+
     @property
     def is_orthogonal(self):
         """Whether or not the wavelet basis is orthogonal."""
@@ -198,8 +212,7 @@ class WaveletTransformBase(Operator):
                 discr_space = self.range
                 wavelet_space = self.domain
 
-            shapes = pywt_coeff_shapes(discr_space.shape, self.pywt_wavelet,
-                                       self.nlevels, self.pywt_pad_mode)
+            shapes = self.coeff_shapes
             coeff_list = [np.ones(shapes[0]) * 0]
             dcoeffs_per_scale = 2 ** discr_space.ndim - 1
             for i in range(1, 1 + len(shapes[1:])):
@@ -301,13 +314,19 @@ class WaveletTransform(WaveletTransformBase):
                          variant='forward', pad_mode=pad_mode,
                          pad_const=pad_const, impl=impl)
 
-    def _call(self, x):
-        """Return wavelet transform of ``x``."""
+    def _call(self, x, out):
+        """Compute the wavelet transform of ``x`` and store it in ``out``.
+
+        The coefficients are written level by level into views of
+        ``out``, without an intermediate flat array.
+        """
         if self.impl == 'pywt':
-            coeff_list = pywt_multi_level_decomp(
-                x, wavelet=self.pywt_wavelet, nlevels=self.nlevels,
-                mode=self.pywt_pad_mode)
-            return pywt_flat_array_from_coeffs(coeff_list)
+            out_arr = out.asarray()
+            pywt_multi_level_decomp(
+                x.asarray(), wavelet=self.pywt_wavelet, nlevels=self.nlevels,
+                mode=self.pywt_pad_mode, out=out_arr)
+            if not np.may_share_memory(out_arr, out.asarray()):
+                out[:] = out_arr
         else:
             raise RuntimeError("bad `impl` '{}'".format(self.impl))
 
@@ -443,13 +462,16 @@ class WaveletTransformInverse(WaveletTransformBase):
                          nlevels=nlevels, pad_mode=pad_mode,
                          pad_const=pad_const, impl=impl)
 
-    def _call(self, coeffs):
-        """Return the inverse wavelet transform of ``coeffs``."""
+    def _call(self, coeffs, out):
+        """Compute the inverse wavelet transform of ``coeffs``.
+
+        The coefficient arrays are views into ``coeffs``, using the
+        cached `coeff_shapes`.
+        """
         if self.impl == 'pywt':
-            shapes = pywt_coeff_shapes(self.range.shape, self.pywt_wavelet,
-                                       self.nlevels, self.pywt_pad_mode)
-            coeff_list = pywt_coeffs_from_flat_array(coeffs, shapes)
-            return pywt_multi_level_recon(
+            coeff_list = pywt_coeffs_from_flat_array(coeffs.asarray(),
+                                                     self.coeff_shapes)
+            out[:] = pywt_multi_level_recon(
                 coeff_list, recon_shape=self.range.shape,
                 wavelet=self.pywt_wavelet, mode=self.pywt_pad_mode)
         else:
@@ -30,4 +30,10 @@ __all__ += numerics.__all__
 from .vectorization import *
 __all__ += vectorization.__all__
 
+from .pool import *
+__all__ += pool.__all__
+
+from .parallel import *
+__all__ += parallel.__all__
+
 from . import ufuncs
@@ -21,6 +21,10 @@ from odl.util.normalize import normalized_scalar_param_list, safe_int_conv
 __all__ = ('apply_on_boundary', 'fast_1d_tensor_mult', 'resize_array')
 
 
+# Number of array entries processed at a time by `fast_1d_tensor_mult`
+TENSOR_MULT_BLOCK_SIZE = 2 ** 16
+
+
 _SUPPORTED_RESIZE_PAD_MODES = ('constant', 'symmetric', 'periodic',
                                'order0', 'order1')
 
@@ -202,8 +206,11 @@ def fast_1d_tensor_mult(ndarr, onedim_arrs, axes=None, out=None):
       and multiply it to the large array. Finally, multiply with the
       last 1d array.
 
-    The advantage of this approach is that it is memory-friendly and
-    loops over the big array only twice.
+    The advantage of this approach is that it is memory-friendly. The
+    copy from ``ndarr`` to ``out`` is fused with the first
+    multiplication, and both multiplications are done block-wise
+    (`TENSOR_MULT_BLOCK_SIZE` entries at a time), such that the big
+    array is effectively traversed only once.
 
     Parameters
     ----------
@@ -224,10 +231,13 @@ def fast_1d_tensor_mult(ndarr, onedim_arrs, axes=None, out=None):
         Result of the modification. If ``out`` was given, the returned
         object is a reference to it.
     """
+    ndarr = np.asarray(ndarr)
     if out is None:
-        out = np.array(ndarr, copy=True)
-    else:
-        out[:] = ndarr  # Self-assignment is free if out is ndarr
+        out = np.empty(ndarr.shape, dtype=ndarr.dtype)
+    elif not np.can_cast(ndarr.dtype, out.dtype, casting='same_kind'):
+        # Let assignment do the (unsafe) cast, then work in-place
+        out[:] = ndarr
+        ndarr = out
 
     if not onedim_arrs:
         raise ValueError('no 1d arrays given')
@@ -262,7 +272,8 @@ def fast_1d_tensor_mult(ndarr, onedim_arrs, axes=None, out=None):
             slc[ax] = slice(None)
             factor = factor * arr[slc]
 
-        out *= factor
+        # Copy and multiply in one pass
+        np.multiply(ndarr, factor, out=out)
 
     else:
         # Hybrid approach
@@ -272,7 +283,7 @@ def fast_1d_tensor_mult(ndarr, onedim_arrs, axes=None, out=None):
         last_ax = np.argmax(out.strides)
         last_arr = alist[axes.index(last_ax)]
 
-        # Build the semi-big array and multiply
+        # Build the semi-big array
         factor = np.array(1.0)
         for ax, arr in zip(axes, alist):
             if ax == last_ax:
@@ -282,12 +293,20 @@ def fast_1d_tensor_mult(ndarr, onedim_arrs, axes=None, out=None):
             slc[ax] = slice(None)
             factor = factor * arr[slc]
 
-        out *= factor
-
-        # Finally multiply by the remaining 1d array
-        slc = [None] * out.ndim
-        slc[last_ax] = slice(None)
-        out *= last_arr[slc]
+        # Multiply with both factors block by block along `last_ax`,
+        # such that each block is still in cache for the second
+        # multiplication
+        slab_size = max(out.size // max(out.shape[last_ax], 1), 1)
+        num_slabs = max(TENSOR_MULT_BLOCK_SIZE // slab_size, 1)
+        last_slc = [None] * out.ndim
+        last_slc[last_ax] = slice(None)
+        for start in range(0, out.shape[last_ax], num_slabs):
+            block = [slice(None)] * out.ndim
+            block[last_ax] = slice(start, start + num_slabs)
+            block = tuple(block)
+            out_block = out[block]
+            np.multiply(ndarr[block], factor, out=out_block)
+            out_block *= last_arr[start:start + num_slabs][tuple(last_slc)]
 
     return out
 
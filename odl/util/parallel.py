@@ -0,0 +1,142 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Shared thread pools for concurrent evaluation."""
+
+# Imports for common Python 2/3 codebase
+from __future__ import print_function, division, absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+from threading import Lock, local
+
+
+__all__ = ('thread_pool', 'in_worker_thread', 'map_blocks')
+
+
+# Maps number of threads -> shared `ThreadPool`
+_THREAD_POOLS = {}
+_THREAD_POOLS_LOCK = Lock()
+
+# Thread-local marker for the worker threads of the shared pools
+_WORKER_STATE = local()
+
+
+def _init_worker():
+    """Mark the calling thread as worker of a shared pool."""
+    _WORKER_STATE.is_worker = True
+
+
+def in_worker_thread():
+    """Return ``True`` if called from a worker of a shared thread pool.
+
+    Work submitted to a shared pool from one of its own workers can
+    deadlock when all workers wait for it. Callers therefore run
+    serially if this function returns ``True``.
+
+    Examples
+    --------
+    >>> in_worker_thread()
+    False
+    >>> thread_pool(2).apply(in_worker_thread)
+    True
+    """
+    return getattr(_WORKER_STATE, 'is_worker', False)
+
+
+def thread_pool(num_threads):
+    """Return a shared thread pool with ``num_threads`` workers.
+
+    The pool is created on the first request and reused afterwards,
+    such that the cost of starting threads is not paid in every
+    evaluation. It must not be closed by the caller.
+
+    Parameters
+    ----------
+    num_threads : positive int
+        Number of worker threads of the pool.
+
+    Returns
+    -------
+    pool : `multiprocessing.pool.ThreadPool`
+
+    Examples
+    --------
+    >>> pool = thread_pool(2)
+    >>> pool.map(abs, [-1, 2, -3])
+    [1, 2, 3]
+    >>> thread_pool(2) is pool
+    True
+    """
+    num_threads, num_threads_in = int(num_threads), num_threads
+    if num_threads != num_threads_in or num_threads < 1:
+        raise ValueError('`num_threads` must be a positive integer, got {}'
+                         ''.format(num_threads_in))
+
+    with _THREAD_POOLS_LOCK:
+        pool = _THREAD_POOLS.get(num_threads)
+        if pool is None:
+            pool = ThreadPool(num_threads, initializer=_init_worker)
+            _THREAD_POOLS[num_threads] = pool
+        return pool
+
+
+def map_blocks(func, size, block_size, threading_threshold, grouped=False):
+    """Apply ``func`` to consecutive blocks of indices ``0, ..., size - 1``.
+
+    Parameters
+    ----------
+    func : callable
+        Function taking a ``slice`` as single argument. If ``grouped``
+        is ``True``, it takes a list of slices instead and returns a
+        list of results.
+    size : int
+        Total number of indices.
+    block_size : positive int
+        Number of indices per block.
+    threading_threshold : int
+        Minimum ``size`` from which the blocks are distributed over
+        several threads of a shared pool. Calls from a worker thread of
+        a shared pool always run serially.
+    grouped : bool, optional
+        If ``True``, call ``func`` once per thread with the list of
+        blocks assigned to that thread.
+
+    Returns
+    -------
+    results : list
+        Results of ``func`` in block order.
+    """
+    blocks = [slice(i, min(i + block_size, size))
+              for i in range(0, size, block_size)]
+    if grouped:
+        group_func = func
+    else:
+        def group_func(group):
+            return [func(blk) for blk in group]
+
+    num_threads = min(cpu_count(), len(blocks))
+    if (size < threading_threshold or num_threads <= 1 or
+            in_worker_thread()):
+        return group_func(blocks)
+
+    # Give each thread one contiguous range of blocks. NumPy releases the
+    # GIL in the arithmetic, hence the threads run concurrently.
+    per_thread = -(-len(blocks) // num_threads)
+    groups = [blocks[i:i + per_thread]
+              for i in range(0, len(blocks), per_thread)]
+    results = thread_pool(len(groups)).map(group_func, groups)
+    return [res for group_res in results for res in group_res]
+
+
+if __name__ == '__main__':
+    # pylint: disable=wrong-import-position
+    from odl.util.testutils import run_doctests
+    run_doctests()
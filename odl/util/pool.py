@@ -0,0 +1,247 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Pool of reusable temporary space elements."""
+
+# Imports for common Python 2/3 codebase
+from __future__ import print_function, division, absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+
+
+__all__ = ('ElementPool', 'ELEMENT_POOL', 'borrow_element')
+
+
+# Default upper bound for the memory held by `ELEMENT_POOL`
+ELEMENT_POOL_MAX_BYTES = 2 ** 30
+
+
+def _element_nbytes(x):
+    """Return the number of bytes occupied by the space element ``x``."""
+    if hasattr(x, 'parts'):
+        return sum(_element_nbytes(p) for p in x.parts)
+    elif hasattr(x, 'ntuple'):
+        return _element_nbytes(x.ntuple)
+    else:
+        return getattr(x, 'nbytes', 0)
+
+
+class ElementPool(object):
+
+    """Bounded pool of temporary elements, keyed by space.
+
+    Composite operators and solvers need scratch elements in every
+    evaluation. Instead of allocating a new element each time, they
+    borrow one from a pool and return it afterwards, such that the
+    memory is reused in subsequent evaluations.
+
+    The contents of a borrowed element are undefined. The pool holds at
+    most `max_bytes` bytes of returned elements; if that limit would be
+    exceeded, the elements returned least recently are dropped.
+
+    Examples
+    --------
+    >>> pool = ElementPool()
+    >>> space = odl.rn(3)
+    >>> with pool.borrow(space) as tmp:
+    ...     tmp_id = id(tmp)
+    >>> with pool.borrow(space) as tmp2:
+    ...     id(tmp2) == tmp_id
+    True
+    """
+
+    def __init__(self, max_bytes=ELEMENT_POOL_MAX_BYTES):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        max_bytes : non-negative int, optional
+            Maximum number of bytes held by the elements in the pool.
+        """
+        # Maps id(x) -> (space, x, nbytes), least recently returned first
+        self.__free = OrderedDict()
+        # Maps space -> list of id(x) for x in the pool
+        self.__ids_by_space = {}
+        self.__nbytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = Lock()
+        self.max_bytes = max_bytes
+
+    @property
+    def max_bytes(self):
+        """Maximum number of bytes held by the pool."""
+        return self.__max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        """Set the memory limit, evicting elements if necessary."""
+        max_bytes = int(max_bytes)
+        if max_bytes < 0:
+            raise ValueError('`max_bytes` must be non-negative, got {}'
+                             ''.format(max_bytes))
+        with self.__lock:
+            self.__max_bytes = max_bytes
+            self.__evict(0)
+
+    @property
+    def nbytes(self):
+        """Number of bytes currently held by the pool."""
+        return self.__nbytes
+
+    @property
+    def hits(self):
+        """Number of requests served by a pooled element."""
+        return self.__hits
+
+    @property
+    def misses(self):
+        """Number of requests that allocated a new element."""
+        return self.__misses
+
+    def __len__(self):
+        """Return ``len(self)``."""
+        return len(self.__free)
+
+    def acquire(self, space):
+        """Take an element of ``space`` out of the pool.
+
+        If no element of ``space`` is available, a new one is created.
+        The element should be given back with `release` when it is no
+        longer needed.
+
+        Parameters
+        ----------
+        space : `LinearSpace`
+            Space of the requested element.
+
+        Returns
+        -------
+        element : ``space`` element
+            Element with undefined contents.
+        """
+        with self.__lock:
+            ids = self.__ids_by_space.get(space)
+            if ids:
+                _, x, nbytes = self.__free.pop(ids.pop())
+                self.__nbytes -= nbytes
+                self.__hits += 1
+                return x
+            self.__misses += 1
+
+        return space.element()
+
+    def release(self, x):
+        """Give the element ``x`` back to the pool.
+
+        Parameters
+        ----------
+        x : `LinearSpaceElement`
+            Element that was obtained by `acquire` and is no longer used.
+        """
+        nbytes = _element_nbytes(x)
+        if nbytes > self.max_bytes:
+            return
+
+        with self.__lock:
+            if id(x) in self.__free:
+                return
+            self.__evict(nbytes)
+            self.__free[id(x)] = (x.space, x, nbytes)
+            self.__ids_by_space.setdefault(x.space, []).append(id(x))
+            self.__nbytes += nbytes
+
+    def __evict(self, nbytes):
+        """Drop old elements until ``nbytes`` more bytes fit in the pool."""
+        while self.__free and self.__nbytes + nbytes > self.max_bytes:
+            x_id, (space, _, x_nbytes) = self.__free.popitem(last=False)
+            ids = self.__ids_by_space[space]
+            ids.remove(x_id)
+            if not ids:
+                del self.__ids_by_space[space]
+            self.__nbytes -= x_nbytes
+
+    @contextmanager
+    def borrow(self, space):
+        """Context manager for a temporary element of ``space``.
+
+        The element is returned to the pool when the ``with`` block is
+        left. It must not be referenced after that.
+
+        Parameters
+        ----------
+        space : `LinearSpace`
+            Space of the requested element.
+
+        Yields
+        ------
+        element : ``space`` element
+            Element with undefined contents.
+        """
+        x = self.acquire(space)
+        try:
+            yield x
+        finally:
+            self.release(x)
+
+    def clear(self):
+        """Remove all elements from the pool."""
+        with self.__lock:
+            self.__free.clear()
+            self.__ids_by_space.clear()
+            self.__nbytes = 0
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{}(max_bytes={})'.format(self.__class__.__name__,
+                                         self.max_bytes)
+
+
+ELEMENT_POOL = ElementPool()
+
+
+def borrow_element(space):
+    """Borrow a temporary element of ``space`` from `ELEMENT_POOL`.
+
+    Parameters
+    ----------
+    space : `LinearSpace`
+        Space of the requested element.
+
+    Returns
+    -------
+    context : context manager
+        Yields an element of ``space`` with undefined contents, which is
+        returned to the pool at the end of the ``with`` block.
+
+    See Also
+    --------
+    ElementPool.borrow
+
+    Examples
+    --------
+    >>> space = odl.rn(3)
+    >>> x = space.element([1, 2, 3])
+    >>> with borrow_element(space) as tmp:
+    ...     x.multiply(x, out=tmp)
+    ...     x += tmp
+    rn(3).element([1.0, 4.0, 9.0])
+    >>> x
+    rn(3).element([2.0, 6.0, 12.0])
+    """
+    return ELEMENT_POOL.borrow(space)
+
+
+if __name__ == '__main__':
+    # pylint: disable=wrong-import-position
+    from odl.util.testutils import run_doctests
+    run_doctests()
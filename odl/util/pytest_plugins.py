@@ -17,7 +17,8 @@ import operator
 import os
 
 import odl
-from odl.trafos.backends import PYFFTW_AVAILABLE, PYWT_AVAILABLE
+from odl.trafos.backends import (
+    PYFFTW_AVAILABLE, PYWT_AVAILABLE, SCIPY_FFT_AVAILABLE)
 from odl.util import dtype_repr
 
 try:
@@ -78,6 +79,10 @@ if not PYWT_AVAILABLE:
     collect_ignore.append(
         os.path.join(odl_root, 'odl', 'trafos', 'backends',
                      'pywt_bindings.py'))
+if not SCIPY_FFT_AVAILABLE:
+    collect_ignore.append(
+        os.path.join(odl_root, 'odl', 'trafos', 'backends',
+                     'scipy_fft_bindings.py'))
     # Currently `pywt` is the only implementation
     collect_ignore.append(
         os.path.join(odl_root, 'odl', 'trafos', 'wavelet.py'))
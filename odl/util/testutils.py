@@ -26,7 +26,8 @@ from odl.util.utility import run_from_ipython
 
 __all__ = ('almost_equal', 'all_equal', 'all_almost_equal', 'never_skip',
            'skip_if_no_stir', 'skip_if_no_pywavelets',
-           'skip_if_no_pyfftw', 'skip_if_no_largescale',
+           'skip_if_no_pyfftw', 'skip_if_no_scipy_fft',
+           'skip_if_no_largescale',
            'noise_array', 'noise_element', 'noise_elements',
            'Timer', 'timeit', 'ProgressBar', 'ProgressRange',
            'test', 'run_doctests')
@@ -219,6 +220,10 @@ try:
         "not odl.trafos.PYFFTW_AVAILABLE",
         reason='pyFFTW not available')
 
+    skip_if_no_scipy_fft = pytest.mark.skipif(
+        "not odl.trafos.SCIPY_FFT_AVAILABLE",
+        reason='scipy.fft not available')
+
     skip_if_no_largescale = pytest.mark.skipif(
         "not pytest.config.getoption('--largescale')",
         reason='Need --largescale option to run'
@@ -274,6 +279,7 @@ except ImportError:
     skip_if_no_stir = _pass
     skip_if_no_pywavelets = _pass
     skip_if_no_pyfftw = _pass
+    skip_if_no_scipy_fft = _pass
     skip_if_no_largescale = _pass
     skip_if_no_benchmark = _pass
 